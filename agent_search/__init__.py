@@ -1,6 +1,7 @@
 """A-share trading research agent package."""
 
+from .async_engine import AsyncTradingResearchAgent
 from .config import AppConfig, load_config
 from .engine import TradingResearchAgent
 
-__all__ = ["AppConfig", "TradingResearchAgent", "load_config"]
+__all__ = ["AppConfig", "AsyncTradingResearchAgent", "TradingResearchAgent", "load_config"]
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Coroutine
+
+from agent_search.config import AppConfig
+from agent_search.connectors import (
+    AkShareConnector,
+    AnnouncementConnector,
+    AsyncAkShareConnector,
+    BulkAnnouncementConnector,
+    SerperConnector,
+    WecomConnector,
+)
+from agent_search.engine import RunContext, SymbolScan, TradingResearchAgent
+from agent_search.models import MarketBar, RunResult, TradeSignal
+from agent_search.reporting import build_alert_digests
+from agent_search.storage import SQLiteStore
+
+
+class AsyncTradingResearchAgent(TradingResearchAgent):
+    """Asyncio variant of the scan pipeline for embedding in an event loop.
+
+    Serper, announcements and WeCom go through the connectors' native async
+    methods; AkShare has no async API and runs in an executor instead. Store
+    access, signal building and report files are the sync agent's code run
+    in worker threads, so the loop never blocks and both agents produce the
+    same ``RunResult`` for the same inputs. The coroutine entry point is
+    ``arun_once``; the inherited sync ``run_once`` (used by
+    ``run_market_scan`` and ``AgentScheduler``) keeps working unchanged.
+    """
+
+    def __init__(
+        self,
+        config: AppConfig,
+        market_connector: AkShareConnector | None = None,
+        serper_connector: SerperConnector | None = None,
+        announcement_connector: AnnouncementConnector | None = None,
+        notifier: WecomConnector | None = None,
+        store: SQLiteStore | None = None,
+        async_market: AsyncAkShareConnector | None = None,
+        bulk_announcements: BulkAnnouncementConnector | None = None,
+    ) -> None:
+        super().__init__(
+            config=config,
+            market_connector=market_connector,
+            serper_connector=serper_connector,
+            announcement_connector=announcement_connector,
+            notifier=notifier,
+            store=store,
+            bulk_announcements=bulk_announcements,
+        )
+        self.async_market = async_market or AsyncAkShareConnector(self.market)
+        self._async_limits = {
+            "akshare": asyncio.Semaphore(max(1, config.scan.akshare_concurrency)),
+            "serper": asyncio.Semaphore(max(1, config.scan.serper_concurrency)),
+            "wecom": asyncio.Semaphore(max(1, config.scan.serper_concurrency)),
+        }
+
+    async def _acall_source(self, ctx: RunContext, source: str, call: Coroutine[Any, Any, Any]) -> Any:
+        limiter = self._rate_limiters.get(source)
+        async with self._async_limits[source]:
+            with ctx.metrics.timer(f"connector.{call.__name__}", source):
+                try:
+                    self._before_call(source)
+                except Exception:
+                    call.close()
+                    raise
+                started = time.perf_counter()
+                try:
+                    if limiter is not None:
+                        await limiter.aacquire()
+                        started = time.perf_counter()
+                    result = await call
+                except Exception as err:
+                    self._observe_call(ctx, source, started, err)
+                    raise
+                except BaseException:
+                    self._abandon_call(source)
+                    call.close()
+                    raise
+                self._observe_call(ctx, source, started)
+                return result
+
+    async def _aload_bars(self, symbol: str, ctx: RunContext) -> tuple[list[MarketBar], list[MarketBar]]:
+        fetch_start = self._kline_fetch_start(symbol, ctx)
+        fetched = await self._acall_source(
+            ctx, "akshare", self.async_market.get_kline(symbol=symbol, start=fetch_start, end=ctx.end)
+        )
+        bars = self._merge_kline(symbol, ctx, fetch_start, fetched)
+        if bars is None:
+            fetched = await self._acall_source(
+                ctx, "akshare", self.async_market.get_kline(symbol=symbol, start=ctx.start, end=ctx.end)
+            )
+            bars = fetched
+        return bars, fetched
+
+    async def _ascan_symbol(self, symbol: str, ctx: RunContext) -> SymbolScan:
+        scan = SymbolScan(symbol=symbol)
+
+        try:
+            scan.bars, scan.new_bars = await self._aload_bars(symbol, ctx)
+        except Exception as err:  # noqa: BLE001
+            scan.fail("market_error", f"行情获取失败: {err}", err)
+
+        try:
+            scan.news = await self._acall_source(
+                ctx, "serper", self.serper.aget_news(symbol=symbol, since_hours=48)
+            )
+        except Exception as err:  # noqa: BLE001
+            scan.fail("news_error", f"新闻获取失败: {err}", err)
+
+        if ctx.announcements is not None:
+            scan.announcements = ctx.announcements.get(symbol, [])
+        else:
+            try:
+                scan.announcements = await self._acall_source(
+                    ctx, "serper", self.announcements.aget_announcements(symbol=symbol, since_days=7)
+                )
+            except Exception as err:  # noqa: BLE001
+                scan.fail("announcement_error", f"公告获取失败: {err}", err)
+
+        scan.signal = await asyncio.to_thread(self._build_signal, scan, ctx)
+        return scan
+
+    async def _amaybe_send_alert(self, signal: TradeSignal, ctx: RunContext) -> bool:
+        text = self._format_alert(signal)
+        if text is None:
+            return False
+        result = await self._acall_source(ctx, "wecom", self.notifier.asend_text(text))
+        with ctx.metrics.timer("store.log_event", "sqlite"):
+            await asyncio.to_thread(self.store.log_event, "wecom_alert", {"signal_id": signal.id, "result": result})
+        return bool(result.get("ok"))
+
+    async def _asend_alerts(self, signals: list[TradeSignal], ctx: RunContext) -> int:
+        if self.outbox is not None:
+            # Only queues; the outbox worker delivers.
+            return await asyncio.to_thread(self._send_alerts, signals, ctx)
+        if self.config.alerts.mode != "digest":
+            sent = await asyncio.gather(*(self._amaybe_send_alert(signal, ctx) for signal in signals))
+            return sum(1 for ok in sent if ok)
+        actionable = [signal for signal in signals if self._format_alert(signal) is not None]
+        alerted = 0
+        # Digests go out one at a time so the WeCom limiter paces them.
+        for content, batch in build_alert_digests(actionable, ctx.today, self.config.alerts.max_bytes):
+            result = await self._acall_source(ctx, "wecom", self.notifier.asend_markdown(content))
+            payload = {"signal_ids": [signal.id for signal in batch], "result": result}
+            with ctx.metrics.timer("store.log_event", "sqlite"):
+                await asyncio.to_thread(self.store.log_event, "wecom_digest", payload)
+            if result.get("ok"):
+                alerted += len(batch)
+        return alerted
+
+    async def arun_once(
+        self,
+        symbols: list[str] | None = None,
+        equity: float = 1_000_000.0,
+        full_refresh: bool = False,
+    ) -> RunResult:
+        target_symbols = symbols or self._default_symbols()
+        if not target_symbols:
+            raise ValueError("No symbols provided and watchlist is empty.")
+
+        # The bulk announcement ingest and the store preloads are blocking I/O.
+        ctx = await asyncio.to_thread(self._start_run, target_symbols, equity, full_refresh=full_refresh)
+        scans = await asyncio.gather(*(self._ascan_symbol(symbol, ctx) for symbol in target_symbols))
+
+        await asyncio.to_thread(self._persist_scans, scans, ctx)
+
+        alerts_sent = await self._asend_alerts([scan.signal for scan in scans if not scan.reused], ctx)
+        return await asyncio.to_thread(
+            self._finish_run, ctx, target_symbols, [scan.signal for scan in scans], alerts_sent
+        )
+
+    async def aclose(self) -> None:
+        for connector in (self.serper, self.notifier):
+            closer = getattr(connector, "aclose", None)
+            if closer is not None:
+                await closer()
+        # close() drains the outbox and pending cache refreshes and closes the store; keep that off the loop.
+        await asyncio.to_thread(self.close)
@@ -1,17 +1,37 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
 
 from agent_search.config import AppConfig
 from agent_search.connectors.akshare_connector import AkShareConnector
+from agent_search.connectors.ratelimit import AdaptiveRateLimiter, limited_call
+from agent_search.engine import build_rate_limiters
 from agent_search.models import BacktestResult
+from agent_search.series import BarSeries
+from agent_search.storage import BarArchive
 from agent_search.strategy.factors import compute_technical_score
 
+# Calendar days a stored history may start late or end early and still count as covering
+# the range: weekends plus the longest exchange holiday.
+COVERAGE_SLACK_DAYS = 10
+
 
 class BacktestEngine:
-    def __init__(self, config: AppConfig, market_connector: AkShareConnector):
+    def __init__(
+        self,
+        config: AppConfig,
+        market_connector: AkShareConnector,
+        bar_archive: BarArchive | None = None,
+        limiter: AdaptiveRateLimiter | None = None,
+    ):
         self.config = config
         self.market_connector = market_connector
+        self.bar_archive = bar_archive
+        # K-line pulls share AkShare's AIMD pacing with the scans' settings unless a limiter is passed in.
+        self.limiter = limiter or build_rate_limiters(config.rate_limit).get("akshare")
 
     @staticmethod
     def _daily_returns(closes: list[float]) -> list[float]:
@@ -40,17 +60,44 @@ class BacktestEngine:
                 mdd = drawdown
         return mdd
 
+    def _today(self) -> date:
+        return datetime.now(ZoneInfo(self.config.timezone)).date()
+
+    def _covers(self, series: BarSeries, start: str, end: str) -> bool:
+        """Whether archived bars span ``start``..``end``; the archive only holds the scan window."""
+        if not len(series):
+            return False
+        slack = np.timedelta64(COVERAGE_SLACK_DAYS, "D")
+        # An end date in the future can at best be covered up to today, on the exchange calendar.
+        last_needed = min(np.datetime64(end, "D"), np.datetime64(self._today(), "D"))
+        return bool(
+            series.ts[0] <= np.datetime64(start, "D") + slack and series.ts[-1] >= last_needed - slack
+        )
+
+    def _load_series(self, symbol: str, start: str, end: str, adjust: str = "qfq") -> BarSeries:
+        # The archive holds the qfq bars scans stored, so unadjusted loads (the benchmark) go to the source.
+        if self.bar_archive is not None and adjust == "qfq" and symbol in self.bar_archive:
+            series = self.bar_archive.get_bar_series(symbol, start, end)
+            if self._covers(series, start, end):
+                return series
+        kwargs = {"symbol": symbol, "start": start, "end": end, "adjust": adjust, "period": "daily"}
+        loader = getattr(self.market_connector, "get_kline_series", None)
+        if loader is not None:
+            return limited_call(self.limiter, loader, **kwargs)
+        bars = limited_call(self.limiter, self.market_connector.get_kline, **kwargs)
+        return BarSeries.from_bars(bars, symbol)
+
     def _symbol_strategy_returns(self, symbol: str, start: str, end: str) -> list[float]:
-        bars = self.market_connector.get_kline(symbol=symbol, start=start, end=end)
+        bars = self._load_series(symbol, start, end)
         if len(bars) < 30:
             return []
 
-        closes = [bar.close for bar in bars]
-        daily_ret = self._daily_returns(closes)
+        daily_ret = self._daily_returns(bars.close.tolist())
 
         position = 0
         strategy_returns: list[float] = []
         for i in range(20, len(bars) - 1):
+            # Slices of a BarSeries are views, so each expanding window is free.
             window = bars[: i + 1]
             score, _, _ = compute_technical_score(window)
             if score >= self.config.signal.buy_threshold:
@@ -82,15 +129,8 @@ class BacktestEngine:
             equity_curve.append(equity_curve[-1] * (1.0 + day_ret))
         total_return = equity_curve[-1] - 1.0
 
-        bench_bars = self.market_connector.get_kline(
-            symbol=benchmark_symbol,
-            start=start,
-            end=end,
-            adjust="",
-            period="daily",
-        )
-        bench_closes = [bar.close for bar in bench_bars]
-        bench_ret = self._daily_returns(bench_closes)
+        bench_bars = self._load_series(benchmark_symbol, start, end, adjust="")
+        bench_ret = self._daily_returns(bench_bars.close.tolist())
         if bench_ret:
             bench_curve = [1.0]
             for day_ret in bench_ret[-len(portfolio_returns) :]:
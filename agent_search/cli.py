@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import argparse
 import json
+from contextlib import nullcontext
 from datetime import date, datetime
 
 from agent_search.backtest import BacktestEngine
-from agent_search.config import load_config, load_watchlist
-from agent_search.connectors import AkShareConnector
-from agent_search.engine import TradingResearchAgent
+from agent_search.config import RetentionConfig, load_config, load_watchlist
+from agent_search.connectors import AkShareConnector, CallArchive
+from agent_search.engine import TradingResearchAgent, build_store
+from agent_search.maintenance import run_maintenance
 from agent_search.scheduler import AgentScheduler
+from agent_search.storage import BarArchive
 
 
 def _split_symbols(raw: str | None, fallback: list[str]) -> list[str]:
@@ -17,28 +20,93 @@ def _split_symbols(raw: str | None, fallback: list[str]) -> list[str]:
     return [item.strip() for item in raw.split(",") if item.strip()]
 
 
+def _open_archive(args: argparse.Namespace) -> CallArchive | None:
+    if args.record:
+        return CallArchive(args.record, mode="record")
+    if args.replay:
+        return CallArchive(args.replay, mode="replay")
+    return None
+
+
+def _add_archive_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--record", default="", metavar="PATH", help="save every upstream response to PATH")
+    group.add_argument("--replay", default="", metavar="PATH", help="serve upstream responses from PATH, offline")
+
+
 def cmd_run_once(args: argparse.Namespace) -> int:
     config = load_config(args.config)
     watchlist = load_watchlist(config.universe_file)
     symbols = _split_symbols(args.symbols, watchlist)
+    if args.workers:
+        config.scan.max_workers = args.workers
+    archive = _open_archive(args)
+    if archive is not None and args.processes is not None:
+        print("ERROR: --record/--replay cannot be combined with --processes")
+        return 1
+
+    with archive or nullcontext(), TradingResearchAgent(config, archive=archive) as agent:
+        agent.start_outbox()
+        return _run_once(agent, args, symbols)
 
-    agent = TradingResearchAgent(config)
-    result = agent.run_once(symbols=symbols, equity=args.equity)
+
+def _run_once(agent: TradingResearchAgent, args: argparse.Namespace, symbols: list[str]) -> int:
+    if args.universe == "market":
+        symbols = agent.screen_market(top_n=args.top_n)
+        if not symbols:
+            print("ERROR: market screen returned no candidates")
+            return 1
+
+    if args.intraday:
+        result = agent.run_intraday(symbols=symbols, equity=args.equity)
+        signal_count = len(result.signals)
+    elif args.stream:
+        stream = agent.iter_run(symbols=symbols, equity=args.equity, full_refresh=args.full_refresh)
+        signal_count = 0
+        while True:
+            try:
+                signal = next(stream)
+            except StopIteration as stop:
+                result = stop.value
+                break
+            signal_count += 1
+            print(f"signal {signal.symbol} {signal.action} score={signal.score:.2f}", flush=True)
+    elif args.processes is not None:
+        result = agent.run_sharded(
+            symbols=symbols,
+            equity=args.equity,
+            processes=args.processes or None,
+            full_refresh=args.full_refresh,
+        )
+        signal_count = len(result.signals)
+    else:
+        result = agent.run_once(symbols=symbols, equity=args.equity, full_refresh=args.full_refresh)
+        signal_count = len(result.signals)
 
     print(f"date={result.date.isoformat()}")
     print(f"symbols={','.join(result.symbols)}")
-    print(f"signals={len(result.signals)}")
+    print(f"signals={signal_count}")
     print(f"alerts_sent={result.alerts_sent}")
     print(f"json={result.output_json}")
     print(f"markdown={result.output_markdown}")
+    print(f"run_id={result.run_id}")
+    for item in result.metrics:
+        stage = f"{item.stage}[{item.source}]" if item.source else item.stage
+        print(
+            f"metric {stage} count={item.count} errors={item.errors} "
+            f"p50={item.p50_ms:.1f}ms p95={item.p95_ms:.1f}ms max={item.max_ms:.1f}ms"
+        )
+    for name, value in result.gauges.items():
+        print(f"gauge {name}={value}")
     return 0
 
 
 def cmd_run_schedule(args: argparse.Namespace) -> int:
     config = load_config(args.config)
-    agent = TradingResearchAgent(config)
-    scheduler = AgentScheduler(agent, timezone=config.timezone)
-    scheduler.run_forever(equity=args.equity)
+    with TradingResearchAgent(config) as agent:
+        agent.start_outbox()
+        scheduler = AgentScheduler(agent, timezone=config.timezone)
+        scheduler.run_forever(equity=args.equity)
     return 0
 
 
@@ -49,14 +117,21 @@ def cmd_backtest(args: argparse.Namespace) -> int:
     if not symbols:
         raise SystemExit("No symbols configured. Use --symbols or config/watchlist.csv")
 
-    engine = BacktestEngine(config=config, market_connector=AkShareConnector())
+    archive = _open_archive(args)
+    market = AkShareConnector(calendar_path=config.storage.calendar_path, archive=archive, timezone=config.timezone)
+    # A recording or replay must see the connector calls, so it bypasses the bar archive.
+    bar_archive = None
+    if config.storage.bar_archive_dir and archive is None:
+        bar_archive = BarArchive(config.storage.bar_archive_dir)
+    engine = BacktestEngine(config=config, market_connector=market, bar_archive=bar_archive)
     try:
-        result = engine.run(
-            symbols=symbols,
-            start=args.start,
-            end=args.end,
-            benchmark_symbol=args.benchmark,
-        )
+        with archive or nullcontext():
+            result = engine.run(
+                symbols=symbols,
+                start=args.start,
+                end=args.end,
+                benchmark_symbol=args.benchmark,
+            )
     except Exception as err:  # noqa: BLE001
         print(f"ERROR: backtest failed: {err}")
         return 1
@@ -69,12 +144,61 @@ def cmd_backtest(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_export_bars(args: argparse.Namespace) -> int:
+    config = load_config(args.config)
+    if not config.storage.bar_archive_dir:
+        print("ERROR: storage.bar_archive_dir is not configured")
+        return 1
+    symbols = _split_symbols(args.symbols, []) or None
+    store = build_store(config)
+    try:
+        summary = BarArchive(config.storage.bar_archive_dir).sync(store, symbols=symbols, full=args.full)
+    finally:
+        store.close()
+    print(json.dumps(summary, ensure_ascii=False))
+    return 0
+
+
+def cmd_maintenance(args: argparse.Namespace) -> int:
+    config = load_config(args.config)
+    overrides = {"audit_days": args.audit_days, "news_days": args.news_days}
+    retention = RetentionConfig.model_validate(
+        {**config.retention.model_dump(), **{key: value for key, value in overrides.items() if value is not None}}
+    )
+    store = build_store(config)
+    try:
+        report = run_maintenance(store, retention, datetime.utcnow().date(), vacuum=args.vacuum)
+    finally:
+        store.close()
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+def _parse_day(raw: str) -> date | None:
+    return datetime.strptime(raw, "%Y-%m-%d").date() if raw else None
+
+
 def cmd_report(args: argparse.Namespace) -> int:
     config = load_config(args.config)
-    agent = TradingResearchAgent(config)
-    target_day = datetime.strptime(args.date, "%Y-%m-%d").date() if args.date else date.today()
-    signals = agent.get_daily_signals(target_day)
-    print(json.dumps({"date": target_day.isoformat(), "signals": signals}, ensure_ascii=False, indent=2))
+    start, end = _parse_day(args.date_from), _parse_day(args.date_to)
+    if not (start or end or args.symbol):
+        target_day = _parse_day(args.date) or date.today()
+        with TradingResearchAgent(config) as agent:
+            signals = agent.get_daily_signals(target_day)
+        print(json.dumps({"date": target_day.isoformat(), "signals": signals}, ensure_ascii=False, indent=2))
+        return 0
+
+    if args.date and not (start or end):
+        start = end = _parse_day(args.date)
+    with TradingResearchAgent(config) as agent:
+        signals = agent.get_signals_between(start, end, symbol=args.symbol or None)
+    payload = {
+        "from": start.isoformat() if start else None,
+        "to": end.isoformat() if end else None,
+        "symbol": args.symbol or None,
+        "signals": signals,
+    }
+    print(json.dumps(payload, ensure_ascii=False, indent=2))
     return 0
 
 
@@ -87,6 +211,34 @@ def build_parser() -> argparse.ArgumentParser:
     run_once = subparsers.add_parser("run-once", help="run one scan cycle")
     run_once.add_argument("--symbols", default="", help="comma separated symbols")
     run_once.add_argument("--equity", type=float, default=1_000_000.0)
+    run_once.add_argument("--workers", type=int, default=0, help="override scan.max_workers")
+    run_once.add_argument(
+        "--full-refresh",
+        action="store_true",
+        help="refetch the whole K-line window, e.g. after qfq adjustment factors change",
+    )
+    run_once.add_argument("--stream", action="store_true", help="print and alert signals as symbols finish")
+    run_once.add_argument(
+        "--intraday",
+        action="store_true",
+        help="refresh from one spot snapshot on top of stored K-lines and news",
+    )
+    run_once.add_argument(
+        "--universe",
+        choices=["watchlist", "market"],
+        default="watchlist",
+        help="market: pre-screen all A-shares and deep-scan the top-N shortlist",
+    )
+    run_once.add_argument("--top-n", type=int, default=None, help="override screen.top_n")
+    run_once.add_argument(
+        "--processes",
+        type=int,
+        nargs="?",
+        const=0,
+        default=None,
+        help="shard symbols across N worker processes (default scan.processes, 0 = CPU count)",
+    )
+    _add_archive_arguments(run_once)
     run_once.set_defaults(func=cmd_run_once)
 
     run_schedule = subparsers.add_parser("run-schedule", help="run scheduler loop")
@@ -98,10 +250,34 @@ def build_parser() -> argparse.ArgumentParser:
     backtest.add_argument("--start", required=True, help="YYYY-MM-DD")
     backtest.add_argument("--end", required=True, help="YYYY-MM-DD")
     backtest.add_argument("--benchmark", default="000300")
+    _add_archive_arguments(backtest)
     backtest.set_defaults(func=cmd_backtest)
 
+    export_bars = subparsers.add_parser(
+        "export-bars", help="export stored K-lines to the memory-mapped bar archive used by backtests"
+    )
+    export_bars.add_argument("--symbols", default="", help="comma separated symbols (default: all stored)")
+    export_bars.add_argument("--full", action="store_true", help="rewrite every file, not just changed symbols")
+    export_bars.set_defaults(func=cmd_export_bars)
+
+    maintenance = subparsers.add_parser(
+        "maintenance", help="apply retention, roll up audit logs, vacuum and analyze the database"
+    )
+    maintenance.add_argument("--audit-days", type=int, default=None, help="override retention.audit_days")
+    maintenance.add_argument("--news-days", type=int, default=None, help="override retention.news_days")
+    maintenance.add_argument(
+        "--vacuum",
+        choices=["incremental", "full", "none"],
+        default="incremental",
+        help="full rewrites the whole file; incremental only releases free pages",
+    )
+    maintenance.set_defaults(func=cmd_maintenance)
+
     report = subparsers.add_parser("report", help="view stored daily signals")
     report.add_argument("--date", default="", help="YYYY-MM-DD")
+    report.add_argument("--from", dest="date_from", default="", help="first trading date, YYYY-MM-DD")
+    report.add_argument("--to", dest="date_to", default="", help="last trading date, YYYY-MM-DD")
+    report.add_argument("--symbol", default="", help="only this symbol")
     report.set_defaults(func=cmd_report)
 
     return parser
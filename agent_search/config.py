@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import csv
 from pathlib import Path
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -9,6 +10,7 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator
 class ScheduleConfig(BaseModel):
     pre_open: str = "09:05"
     intraday_every_minutes: int = 30
+    intraday_mode: Literal["full", "snapshot"] = "full"
     post_close: str = "15:10"
 
 
@@ -25,6 +27,62 @@ class SignalConfig(BaseModel):
     reduce_threshold: float = 1.0
 
 
+class ScanConfig(BaseModel):
+    max_workers: int = 1
+    processes: int = 0
+    akshare_concurrency: int = 4
+    serper_concurrency: int = 4
+    http_pool_size: int = 0
+    spot_ttl_seconds: float = 10.0
+    incremental_kline: bool = False
+    kline_lookback_days: int = 120
+    signal_batch_size: int = 20
+    reuse_unchanged_signals: bool = False
+
+
+class SourceRateConfig(BaseModel):
+    rate: float = 5.0
+    burst: int = 5
+    min_rate: float = 0.5
+    max_rate: float = 10.0
+    slow_seconds: float = 0.0
+
+
+class RateLimitConfig(BaseModel):
+    enabled: bool = False
+    increase_step: float = 0.1
+    decrease_factor: float = 0.5
+    akshare: SourceRateConfig = Field(default_factory=lambda: SourceRateConfig(slow_seconds=3.0))
+    serper: SourceRateConfig = Field(default_factory=SourceRateConfig)
+    cninfo: SourceRateConfig = Field(
+        default_factory=lambda: SourceRateConfig(rate=2.0, burst=2, min_rate=0.2, max_rate=5.0, slow_seconds=5.0)
+    )
+    wecom: SourceRateConfig = Field(
+        default_factory=lambda: SourceRateConfig(rate=0.3, burst=3, min_rate=0.05, max_rate=0.3)
+    )
+
+
+class ResilienceConfig(BaseModel):
+    breaker_failures: int = 0
+    breaker_reset_seconds: float = 60.0
+    hedge_sources: list[str] = Field(default_factory=list)
+    hedge_min_delay_seconds: float = 0.5
+    hedge_min_samples: int = 20
+
+
+class ScreenConfig(BaseModel):
+    min_price: float = 3.0
+    max_price: float = 300.0
+    min_volume_ratio: float = 1.2
+    min_change_pct: float = 0.0
+    max_change_pct: float = 9.5
+    min_turnover: float = 1.0
+    max_turnover: float = 25.0
+    min_amount: float = 50_000_000.0
+    exclude_st: bool = True
+    top_n: int = 50
+
+
 class IntegrationsConfig(BaseModel):
     serper_api_key_env: str = "SERPER_API_KEY"
     openai_api_key_env: str = "OPENAI_API_KEY"
@@ -33,6 +91,55 @@ class IntegrationsConfig(BaseModel):
 
 class StorageConfig(BaseModel):
     db_path: str = "data/agent_search.db"
+    calendar_path: str = "data/trade_calendar.json"
+    journal_mode: Literal["delete", "wal"] = "delete"
+    synchronous: Literal["off", "normal", "full"] = "full"
+    cache_size_kib: int = 0
+    busy_timeout_ms: int = 5000
+    event_buffer_size: int = 0
+    write_batch_size: int = 256
+    bar_archive_dir: str = ""
+
+
+class SearchCacheConfig(BaseModel):
+    enabled: bool = False
+    news_ttl_seconds: int = 1800
+    announcement_ttl_seconds: int = 21600
+    default_ttl_seconds: int = 3600
+    stale_seconds: int = 3600
+    max_entries: int = 5000
+
+
+class AlertConfig(BaseModel):
+    mode: Literal["single", "digest"] = "single"
+    max_bytes: int = 4096
+    delivery: Literal["inline", "outbox"] = "inline"
+    outbox_poll_seconds: float = 2.0
+    outbox_max_attempts: int = 8
+    outbox_backoff_seconds: float = 5.0
+
+
+class AnnouncementConfig(BaseModel):
+    mode: Literal["search", "bulk"] = "search"
+    endpoint_url: str = "http://www.cninfo.com.cn/new/hisAnnouncement/query"
+    columns: list[str] = Field(default_factory=lambda: ["szse", "sse"])
+    page_size: int = 30
+    max_pages: int = 200
+    since_days: int = 7
+    refresh_minutes: int = 30
+
+
+class RetentionConfig(BaseModel):
+    audit_days: int = 0
+    news_days: int = 0
+
+    @field_validator("news_days")
+    @classmethod
+    def _validate_news_days(cls, value: int) -> int:
+        # Scans reuse the last 7 days of stored news and announcements.
+        if 0 < value < 7:
+            raise ValueError("news_days must be 0 (keep everything) or at least 7")
+        return value
 
 
 class ModelConfig(BaseModel):
@@ -50,8 +157,16 @@ class AppConfig(BaseModel):
     schedule: ScheduleConfig = Field(default_factory=ScheduleConfig)
     risk: RiskConfig = Field(default_factory=RiskConfig)
     signal: SignalConfig = Field(default_factory=SignalConfig)
+    scan: ScanConfig = Field(default_factory=ScanConfig)
+    rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
+    resilience: ResilienceConfig = Field(default_factory=ResilienceConfig)
+    screen: ScreenConfig = Field(default_factory=ScreenConfig)
     integrations: IntegrationsConfig = Field(default_factory=IntegrationsConfig)
     storage: StorageConfig = Field(default_factory=StorageConfig)
+    search_cache: SearchCacheConfig = Field(default_factory=SearchCacheConfig)
+    announcements: AnnouncementConfig = Field(default_factory=AnnouncementConfig)
+    alerts: AlertConfig = Field(default_factory=AlertConfig)
+    retention: RetentionConfig = Field(default_factory=RetentionConfig)
     llm: ModelConfig = Field(default_factory=ModelConfig)
 
     @field_validator("timezone")
@@ -126,12 +241,34 @@ def _coerce_scalar(value: str):
         return text
 
 
+def _strip_comment(line: str) -> str:
+    """Drop a trailing ``# ...`` comment that sits outside quotes."""
+    quote = ""
+    for index, char in enumerate(line):
+        if quote:
+            if char == quote:
+                quote = ""
+        elif char in "'\"":
+            quote = char
+        elif char == "#" and (index == 0 or line[index - 1].isspace()):
+            return line[:index].rstrip()
+    return line
+
+
+def _coerce_value(value: str):
+    if value.startswith("[") and value.endswith("]"):
+        inner = value[1:-1].strip()
+        return [_coerce_scalar(item) for item in inner.split(",")] if inner else []
+    return _coerce_scalar(value)
+
+
 def _simple_yaml_parse(raw: str) -> dict:
     root: dict = {}
     stack: list[tuple[int, dict]] = [(0, root)]
 
     for line in raw.splitlines():
-        if not line.strip() or line.strip().startswith("#"):
+        line = _strip_comment(line)
+        if not line.strip():
             continue
 
         indent = len(line) - len(line.lstrip(" "))
@@ -152,6 +289,6 @@ def _simple_yaml_parse(raw: str) -> dict:
             parent[key] = node
             stack.append((indent + 2, node))
         else:
-            parent[key] = _coerce_scalar(value)
+            parent[key] = _coerce_value(value)
 
     return root
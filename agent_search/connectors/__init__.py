@@ -1,11 +1,20 @@
-from .akshare_connector import AkShareConnector
+from .akshare_connector import AkShareConnector, AsyncAkShareConnector, RealtimeQuote
 from .announcement_connector import AnnouncementConnector
+from .bulk_announcement_connector import BulkAnnouncementConnector
+from .recording import CallArchive, ReplayMissError
 from .serper_connector import SerperConnector
+from .trading_calendar import TradingCalendar
 from .wecom_connector import WecomConnector
 
 __all__ = [
     "AkShareConnector",
     "AnnouncementConnector",
+    "AsyncAkShareConnector",
+    "BulkAnnouncementConnector",
+    "CallArchive",
+    "RealtimeQuote",
+    "ReplayMissError",
     "SerperConnector",
+    "TradingCalendar",
     "WecomConnector",
 ]
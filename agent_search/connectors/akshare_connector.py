@@ -1,10 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import math
+import os
+import threading
+import time
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Any
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable
+from zoneinfo import ZoneInfo
 
+from agent_search.connectors.recording import CallArchive
+from agent_search.connectors.trading_calendar import TradingCalendar
 from agent_search.models import MarketBar
+from agent_search.series import BarSeries
 
 
 @dataclass
@@ -14,13 +27,97 @@ class RealtimeQuote:
     change_pct: float
     volume: float
     amount: float
+    open: float = 0.0
+    high: float = 0.0
+    low: float = 0.0
+    prev_close: float = 0.0
+
+    def to_bar(self, ts: datetime, source: str = "akshare") -> MarketBar | None:
+        """Build today's partial daily bar from the snapshot, or ``None`` if the symbol has not traded."""
+        if not (math.isfinite(self.price) and self.price > 0):
+            return None
+
+        def _or_price(value: float) -> float:
+            return value if math.isfinite(value) and value > 0 else self.price
+
+        return MarketBar(
+            symbol=self.symbol,
+            ts=ts,
+            open=_or_price(self.open),
+            high=max(_or_price(self.high), self.price),
+            low=min(_or_price(self.low), self.price),
+            close=self.price,
+            volume=self.volume if math.isfinite(self.volume) else 0.0,
+            amount=self.amount if math.isfinite(self.amount) else 0.0,
+            source=source,
+        )
+
+
+SPOT_COLUMNS = {
+    "代码": "symbol",
+    "名称": "name",
+    "最新价": "price",
+    "涨跌幅": "change_pct",
+    "成交量": "volume",
+    "成交额": "amount",
+    "量比": "volume_ratio",
+    "换手率": "turnover",
+    "今开": "open",
+    "最高": "high",
+    "最低": "low",
+    "昨收": "prev_close",
+}
+
+
+class SpotSnapshotCache:
+    """Process-wide holder for the latest whole-market snapshot.
+
+    Concurrent callers share a single fetch: whoever finds the snapshot
+    older than ``max_age`` refreshes it while the others wait on the lock
+    and then reuse the result. The cached frame is shared, so treat it as
+    read-only.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._frame: Any = None
+        self._fetched_at = float("-inf")
+
+    def get(self, fetch: Callable[[], Any], max_age: float) -> Any:
+        with self._lock:
+            if self._frame is None or self._clock() - self._fetched_at > max_age:
+                self._frame = fetch()
+                self._fetched_at = self._clock()
+            return self._frame
+
+    def clear(self) -> None:
+        with self._lock:
+            self._frame = None
+            self._fetched_at = float("-inf")
+
+
+SPOT_SNAPSHOT_CACHE = SpotSnapshotCache()
 
 
 class AkShareConnector:
     """Connector for A-share market data via AkShare."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        calendar_path: str | None = None,
+        spot_ttl_seconds: float = 0.0,
+        archive: CallArchive | None = None,
+        timezone: str = "Asia/Shanghai",
+    ) -> None:
         self.source = "akshare"
+        self.archive = archive
+        self.tz = ZoneInfo(timezone)
+        self.spot_ttl_seconds = spot_ttl_seconds
+        self.calendar_path = Path(calendar_path) if calendar_path else None
+        self._calendar: TradingCalendar | None = None
+        self._calendar_failed_on: date | None = None
+        self._calendar_lock = threading.Lock()
 
     @staticmethod
     def _import_akshare() -> Any:
@@ -32,6 +129,12 @@ class AkShareConnector:
             ) from exc
         return ak
 
+    def _akshare(self) -> Any:
+        """The akshare module, or its record/replay stand-in when an archive is attached."""
+        if self.archive is None:
+            return self._import_akshare()
+        return self.archive.proxy("akshare", self._import_akshare)
+
     @staticmethod
     def _parse_datetime(value: Any) -> datetime:
         if isinstance(value, datetime):
@@ -60,68 +163,190 @@ class AkShareConnector:
             source="akshare",
         )
 
-    def get_kline(
+    def get_kline_series(
         self,
         symbol: str,
         start: str,
         end: str,
         adjust: str = "qfq",
         period: str = "daily",
-    ) -> list[MarketBar]:
-        ak = self._import_akshare()
-        start_date = start.replace("-", "")
-        end_date = end.replace("-", "")
+    ) -> BarSeries:
+        ak = self._akshare()
         frame = ak.stock_zh_a_hist(
             symbol=symbol,
             period=period,
-            start_date=start_date,
-            end_date=end_date,
+            start_date=start.replace("-", ""),
+            end_date=end.replace("-", ""),
             adjust=adjust,
         )
+        return BarSeries.from_frame(symbol, frame, source=self.source)
+
+    def get_kline(
+        self,
+        symbol: str,
+        start: str,
+        end: str,
+        adjust: str = "qfq",
+        period: str = "daily",
+    ) -> list[MarketBar]:
+        return self.get_kline_series(symbol, start, end, adjust=adjust, period=period).to_bars()
+
+    def _fetch_spot_frame(self) -> Any:
+        import pandas as pd  # type: ignore
+
+        ak = self._akshare()
+        frame = ak.stock_zh_a_spot_em()
         if frame is None or frame.empty:
-            return []
-        bars = [self.map_hist_row(symbol, row) for row in frame.to_dict("records")]
-        bars.sort(key=lambda x: x.ts)
-        return bars
+            return pd.DataFrame(columns=list(SPOT_COLUMNS.values()))
+
+        frame = frame.rename(columns=SPOT_COLUMNS)
+        for column in SPOT_COLUMNS.values():
+            if column not in frame.columns:
+                frame[column] = "" if column in ("symbol", "name") else float("nan")
+        frame = frame[list(SPOT_COLUMNS.values())].copy()
+        frame["symbol"] = frame["symbol"].astype(str).str.strip()
+        frame["name"] = frame["name"].astype(str)
+        numeric = [column for column in SPOT_COLUMNS.values() if column not in ("symbol", "name")]
+        frame[numeric] = frame[numeric].apply(pd.to_numeric, errors="coerce")
+        return frame.reset_index(drop=True)
+
+    def get_spot_frame(self) -> Any:
+        """Whole-market spot snapshot as a DataFrame with the English ``SPOT_COLUMNS`` names.
+
+        With ``spot_ttl_seconds > 0`` the snapshot comes from the process-wide
+        ``SPOT_SNAPSHOT_CACHE``; the returned frame must not be modified.
+        """
+        if self.spot_ttl_seconds <= 0:
+            return self._fetch_spot_frame()
+        return SPOT_SNAPSHOT_CACHE.get(self._fetch_spot_frame, self.spot_ttl_seconds)
 
     def get_realtime_quotes(self, symbols: list[str]) -> dict[str, RealtimeQuote]:
         if not symbols:
             return {}
-        symbol_set = set(symbols)
-        ak = self._import_akshare()
-        frame = ak.stock_zh_a_spot_em()
-        if frame is None or frame.empty:
+        frame = self.get_spot_frame()
+        selected = frame.loc[frame["symbol"].isin(set(symbols))]
+        if selected.empty:
             return {}
 
-        quotes: dict[str, RealtimeQuote] = {}
-        for row in frame.to_dict("records"):
-            symbol = str(row.get("代码", "")).strip()
-            if symbol not in symbol_set:
-                continue
-            quotes[symbol] = RealtimeQuote(
-                symbol=symbol,
-                price=float(row.get("最新价", 0.0) or 0.0),
-                change_pct=float(row.get("涨跌幅", 0.0) or 0.0),
-                volume=float(row.get("成交量", 0.0) or 0.0),
-                amount=float(row.get("成交额", 0.0) or 0.0),
-            )
-        return quotes
+        fields = ["price", "change_pct", "volume", "amount", "open", "high", "low", "prev_close"]
+        values = selected[fields].fillna(0.0).astype(float)
+        return {
+            symbol: RealtimeQuote(symbol, *row)
+            for symbol, row in zip(selected["symbol"], values.itertuples(index=False, name=None))
+        }
 
-    def get_trading_calendar(self, start: str, end: str) -> list[date]:
-        ak = self._import_akshare()
+    def _fetch_trading_days(self) -> list[date]:
+        import pandas as pd  # type: ignore
+
+        ak = self._akshare()
         frame = ak.tool_trade_date_hist_sina()
         if frame is None or frame.empty:
             return []
+        parsed = pd.to_datetime(frame["trade_date"], errors="coerce").dropna()
+        return parsed.dt.date.tolist()
 
-        start_dt = datetime.strptime(start, "%Y-%m-%d").date()
-        end_dt = datetime.strptime(end, "%Y-%m-%d").date()
+    def _read_calendar_file(self) -> TradingCalendar | None:
+        if self.calendar_path is None or not self.calendar_path.exists():
+            return None
+        try:
+            payload = json.loads(self.calendar_path.read_text(encoding="utf-8"))
+            return TradingCalendar(
+                (date.fromisoformat(day) for day in payload["days"]),
+                fetched_on=date.fromisoformat(payload["fetched_on"]),
+            )
+        except (ValueError, KeyError, TypeError):
+            return None
 
-        days: list[date] = []
-        for row in frame.to_dict("records"):
-            trade_day = row.get("trade_date")
-            if trade_day is None:
-                continue
-            day = self._parse_datetime(trade_day).date()
-            if start_dt <= day <= end_dt:
-                days.append(day)
-        return sorted(days)
+    def _write_calendar_file(self, calendar: TradingCalendar) -> None:
+        if self.calendar_path is None:
+            return
+        self.calendar_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "fetched_on": calendar.fetched_on.isoformat() if calendar.fetched_on else None,
+            "days": [day.isoformat() for day in calendar.days],
+        }
+        partial_path = self.calendar_path.with_suffix(self.calendar_path.suffix + ".partial")
+        partial_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(partial_path, self.calendar_path)
+
+    def trading_calendar(self, today: date | None = None) -> TradingCalendar:
+        """Exchange calendar, downloaded at most once a day and kept in ``calendar_path``.
+
+        ``today`` is the exchange-local day (``timezone``) unless given. If the
+        download fails or comes back empty, an older copy (in memory or on
+        disk) is served for the rest of that day without retrying; with no
+        copy at all, the error is raised, again only once a day.
+        """
+        today = today or datetime.now(self.tz).date()
+        with self._calendar_lock:
+            if self._calendar is not None and today in (self._calendar.fetched_on, self._calendar_failed_on):
+                return self._calendar
+            if self._calendar_failed_on == today:
+                raise RuntimeError(f"trading calendar download failed on {today.isoformat()}")
+            stored = self._read_calendar_file()
+            if stored is not None and stored.fetched_on == today:
+                self._calendar = stored
+                return stored
+            try:
+                calendar = TradingCalendar(self._fetch_trading_days(), fetched_on=today)
+                if not calendar.days:
+                    raise ValueError("trading calendar download returned no days")
+            except Exception:
+                self._calendar_failed_on = today
+                self._calendar = self._calendar or stored
+                if self._calendar is None:
+                    raise
+                return self._calendar
+            self._write_calendar_file(calendar)
+            self._calendar = calendar
+            return calendar
+
+    def get_trading_calendar(self, start: str, end: str) -> list[date]:
+        calendar = self.trading_calendar()
+        return calendar.trading_days_between(
+            datetime.strptime(start, "%Y-%m-%d").date(),
+            datetime.strptime(end, "%Y-%m-%d").date(),
+        )
+
+
+class AsyncAkShareConnector:
+    """Asyncio adapter that runs the blocking AkShare calls in an executor."""
+
+    def __init__(self, market: AkShareConnector | None = None, executor: Executor | None = None) -> None:
+        self.market = market or AkShareConnector()
+        self.executor = executor
+        self.source = getattr(self.market, "source", "akshare")
+
+    async def _run(self, fn: Callable[..., Any], **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(fn, **kwargs))
+
+    async def get_kline(
+        self,
+        symbol: str,
+        start: str,
+        end: str,
+        adjust: str = "qfq",
+        period: str = "daily",
+    ) -> list[MarketBar]:
+        return await self._run(
+            self.market.get_kline, symbol=symbol, start=start, end=end, adjust=adjust, period=period
+        )
+
+    async def get_kline_series(
+        self,
+        symbol: str,
+        start: str,
+        end: str,
+        adjust: str = "qfq",
+        period: str = "daily",
+    ) -> BarSeries:
+        return await self._run(
+            self.market.get_kline_series, symbol=symbol, start=start, end=end, adjust=adjust, period=period
+        )
+
+    async def get_realtime_quotes(self, symbols: list[str]) -> dict[str, RealtimeQuote]:
+        return await self._run(self.market.get_realtime_quotes, symbols=symbols)
+
+    async def get_trading_calendar(self, start: str, end: str) -> list[date]:
+        return await self._run(self.market.get_trading_calendar, start=start, end=end)
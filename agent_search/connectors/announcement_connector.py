@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
 from agent_search.connectors.serper_connector import SerperConnector
 from agent_search.models import NewsItem
@@ -13,10 +14,27 @@ class AnnouncementConnector:
     def __init__(self, serper: SerperConnector):
         self.serper = serper
 
+    @staticmethod
+    def announcement_query(symbol: str) -> str:
+        return f"site:cninfo.com.cn {symbol} 公告"
+
     def get_announcements(self, symbol: str, since_days: int = 7) -> list[NewsItem]:
-        query = f"site:cninfo.com.cn {symbol} 公告"
-        result = self.serper.search(query, num=10)
-        now = datetime.now(timezone.utc)
+        result = self.serper.search(self.announcement_query(symbol), num=10, kind="announcement")
+        return self.build_announcements_from_result(symbol, result, since_days=since_days)
+
+    async def aget_announcements(self, symbol: str, since_days: int = 7) -> list[NewsItem]:
+        result = await self.serper.asearch(self.announcement_query(symbol), num=10, kind="announcement")
+        return self.build_announcements_from_result(symbol, result, since_days=since_days)
+
+    def build_announcements_from_result(
+        self,
+        symbol: str,
+        result: dict[str, Any],
+        since_days: int = 7,
+        now: datetime | None = None,
+    ) -> list[NewsItem]:
+        if now is None:
+            now = self.serper.now() if isinstance(self.serper, SerperConnector) else datetime.now(timezone.utc)
         cutoff = now - timedelta(days=since_days)
 
         announcements: list[NewsItem] = []
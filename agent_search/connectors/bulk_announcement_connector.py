@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import re
+from datetime import date, datetime, timezone
+from functools import partial
+from typing import Any, Callable
+
+import requests
+
+from agent_search.connectors.http import build_session
+from agent_search.connectors.recording import CallArchive
+from agent_search.models import NewsItem
+from agent_search.utils import stable_hash
+
+CNINFO_QUERY_URL = "http://www.cninfo.com.cn/new/hisAnnouncement/query"
+CNINFO_STATIC_URL = "http://static.cninfo.com.cn/"
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+class BulkAnnouncementConnector:
+    """Market-wide announcement list from a cninfo-style paged endpoint.
+
+    One paged query per exchange column covers every listed symbol for a
+    day; any endpoint that accepts the same form fields and answers with
+    ``{"announcements": [...], "hasMore": bool}`` can be plugged in.
+    """
+
+    source = "cninfo"
+
+    def __init__(
+        self,
+        endpoint_url: str = CNINFO_QUERY_URL,
+        columns: tuple[str, ...] | list[str] = ("szse", "sse"),
+        page_size: int = 30,
+        max_pages: int = 200,
+        static_url: str = CNINFO_STATIC_URL,
+        timeout: int = 20,
+        session: requests.Session | None = None,
+        archive: CallArchive | None = None,
+    ) -> None:
+        self.endpoint_url = endpoint_url
+        self.columns = list(columns)
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.static_url = static_url
+        self.timeout = timeout
+        self._owns_session = session is None
+        self.session = session or build_session(pool_size=1)
+        self.archive = archive
+
+    def _post_page(self, column: str, se_date: str, page: int) -> dict[str, Any]:
+        form = {
+            "pageNum": page,
+            "pageSize": self.page_size,
+            "column": column,
+            "tabName": "fulltext",
+            "plate": "",
+            "stock": "",
+            "searchkey": "",
+            "secid": "",
+            "category": "",
+            "trade": "",
+            "seDate": se_date,
+            "sortName": "",
+            "sortType": "",
+            "isHLtitle": "true",
+        }
+        response = self.session.post(self.endpoint_url, data=form, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def fetch_page(self, column: str, se_date: str, page: int) -> dict[str, Any]:
+        if self.archive is None:
+            return self._post_page(column, se_date, page)
+        return self.archive.call("cninfo", "query", self._post_page, column, se_date, page)
+
+    def parse_item(self, row: dict[str, Any]) -> NewsItem | None:
+        symbol = str(row.get("secCode") or "").strip()
+        title = _TAG_RE.sub("", str(row.get("announcementTitle") or "")).strip()
+        adjunct = str(row.get("adjunctUrl") or "").strip()
+        millis = row.get("announcementTime")
+        if not symbol or not title or not adjunct or millis is None:
+            return None
+        url = self.static_url.rstrip("/") + "/" + adjunct.lstrip("/")
+        return NewsItem(
+            id=stable_hash(f"ann|{symbol}|{url}|{title}"),
+            symbol=symbol,
+            ts=datetime.fromtimestamp(int(millis) / 1000, tz=timezone.utc),
+            title=title,
+            url=url,
+            source=self.source,
+            sentiment=0.0,
+            relevance=1.0,
+        )
+
+    def fetch_day(self, day: date, guard: Callable[..., Any] | None = None) -> tuple[list[NewsItem], bool]:
+        """Every announcement published on ``day``, de-duplicated.
+
+        Querying one day at a time keeps each column well inside ``max_pages``;
+        the flag is False when a column still had more pages at the cap, so the
+        caller can leave the day to be fetched again. ``guard`` wraps each page
+        request as ``guard(fetch_page, **kwargs)``, e.g. the agent's rate limit
+        and circuit breaker.
+        """
+        fetch = self.fetch_page if guard is None else partial(guard, self.fetch_page)
+        se_date = f"{day.isoformat()}~{day.isoformat()}"
+        items: dict[str, NewsItem] = {}
+        complete = True
+        for column in self.columns:
+            for page in range(1, self.max_pages + 1):
+                payload = fetch(column=column, se_date=se_date, page=page)
+                rows = payload.get("announcements") or []
+                for row in rows:
+                    item = self.parse_item(row)
+                    if item is not None:
+                        items.setdefault(item.id, item)
+                if not rows or not payload.get("hasMore"):
+                    break
+            else:
+                complete = False
+        return list(items.values()), complete
+
+    def close(self) -> None:
+        if self._owns_session:
+            self.session.close()
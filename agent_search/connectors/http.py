@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def import_httpx() -> Any:
+    try:
+        import httpx  # type: ignore
+    except ImportError as exc:
+        raise RuntimeError(
+            "httpx is required for the asyncio connectors. Install with `pip install agent-search[async]`."
+        ) from exc
+    return httpx
+
+
+def build_session(pool_size: int = 10) -> requests.Session:
+    """Keep-alive session whose per-host pool holds ``pool_size`` connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(1, pool_size), pool_block=False)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def build_async_client(max_connections: int = 10) -> Any:
+    httpx = import_httpx()
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+    )
+    return httpx.AsyncClient(limits=limits)
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable
+
+
+def is_throttle_error(err: BaseException) -> bool:
+    """True for HTTP 429 and 5xx responses from requests or httpx."""
+    response = getattr(err, "response", None)
+    status = getattr(response, "status_code", None)
+    return status is not None and (status == 429 or status >= 500)
+
+
+class AdaptiveRateLimiter:
+    """Token bucket whose refill rate follows AIMD.
+
+    Each healthy response adds ``increase_step`` req/s up to ``max_rate``;
+    a throttling response (429/5xx) or one slower than ``slow_seconds``
+    multiplies the rate by ``decrease_factor`` down to ``min_rate``, at most
+    once per ``cooldown_seconds`` so a burst of in-flight failures counts
+    as one signal. Callers reserve a token and sleep for the returned wait,
+    which lets threads and coroutines share one bucket.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        min_rate: float = 0.1,
+        max_rate: float | None = None,
+        increase_step: float = 0.1,
+        decrease_factor: float = 0.5,
+        slow_seconds: float = 0.0,
+        cooldown_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else rate
+        self.rate = min(max(rate, min_rate), self.max_rate)
+        self.burst = max(1, burst)
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.slow_seconds = slow_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._last_decrease = float("-inf")
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def try_acquire(self) -> bool:
+        """Take a token only if one is available right now."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+    def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def observe(self, latency: float, error: BaseException | None = None) -> None:
+        """Feed back one call's outcome; errors other than throttling leave the rate alone."""
+        throttled = error is not None and is_throttle_error(error)
+        slow = self.slow_seconds > 0 and latency > self.slow_seconds
+        with self._lock:
+            if throttled or slow:
+                now = self._clock()
+                if now - self._last_decrease >= self.cooldown_seconds:
+                    self._last_decrease = now
+                    self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            elif error is None:
+                self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+
+def limited_call(limiter: AdaptiveRateLimiter | None, fn: Callable[..., Any], **kwargs: Any) -> Any:
+    """Run one call paced by ``limiter`` and feed its latency and outcome back into the rate."""
+    if limiter is None:
+        return fn(**kwargs)
+    limiter.acquire()
+    started = time.perf_counter()
+    try:
+        result = fn(**kwargs)
+    except Exception as err:
+        limiter.observe(time.perf_counter() - started, err)
+        raise
+    limiter.observe(time.perf_counter() - started)
+    return result
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import pickle
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Literal
+
+from agent_search.utils import stable_hash
+
+ArchiveMode = Literal["record", "replay"]
+
+
+class ReplayMissError(KeyError):
+    """The replay archive has no response for this call."""
+
+
+class CallArchive:
+    """Upstream responses keyed by call signature, stored as one gzip'd pickle.
+
+    In ``record`` mode live responses are captured and written on ``close``;
+    in ``replay`` mode they are served back with no network access. The
+    archive also pins the recording time so date windows and news cutoffs
+    line up on replay. Pickle is used because AkShare returns DataFrames;
+    only replay archives you recorded yourself.
+    """
+
+    def __init__(self, path: str | Path, mode: ArchiveMode) -> None:
+        self.path = Path(path)
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._responses: dict[str, Any] = {}
+        self.recorded_at = datetime.now(timezone.utc)
+        if mode == "replay":
+            with gzip.open(self.path, "rb") as handle:
+                payload = pickle.load(handle)
+            self.recorded_at = payload["recorded_at"]
+            self._responses = payload["responses"]
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    @staticmethod
+    def key(namespace: str, name: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+        return stable_hash(json.dumps([namespace, name, list(args), kwargs], sort_keys=True, default=str))
+
+    def lookup(self, key: str) -> Any:
+        with self._lock:
+            if key not in self._responses:
+                raise ReplayMissError(f"no recorded response for call {key[:12]} in {self.path}")
+            return self._responses[key]
+
+    def store(self, key: str, value: Any) -> None:
+        if self.mode != "record":
+            return
+        with self._lock:
+            self._responses[key] = value
+
+    def call(self, namespace: str, name: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        key = self.key(namespace, name, args, kwargs)
+        if self.replaying:
+            return self.lookup(key)
+        result = fn(*args, **kwargs)
+        self.store(key, result)
+        return result
+
+    def proxy(self, namespace: str, target: Callable[[], Any]) -> ArchiveProxy:
+        """Stand-in for a module such as ``akshare``; ``target`` is only resolved when recording."""
+        return ArchiveProxy(self, namespace, target)
+
+    def close(self) -> None:
+        if self.mode != "record":
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            payload = {"recorded_at": self.recorded_at, "responses": dict(self._responses)}
+        partial_path = self.path.with_suffix(self.path.suffix + ".partial")
+        with gzip.open(partial_path, "wb") as handle:
+            pickle.dump(payload, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(partial_path, self.path)
+
+    def __enter__(self) -> CallArchive:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class ArchiveProxy:
+    def __init__(self, archive: CallArchive, namespace: str, target: Callable[[], Any]) -> None:
+        self._archive = archive
+        self._namespace = namespace
+        self._target = target
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        def live(*args: Any, **kwargs: Any) -> Any:
+            return getattr(self._target(), name)(*args, **kwargs)
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return self._archive.call(self._namespace, name, live, *args, **kwargs)
+
+        return call
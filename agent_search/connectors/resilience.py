@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Any, Callable
+
+from agent_search.metrics import percentile
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a source whose breaker is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker: closed -> open -> half-open -> closed.
+
+    After ``failure_threshold`` failures in a row the breaker opens and calls
+    fail fast for ``reset_seconds``. Then a single trial call is let through;
+    its outcome closes the breaker or re-opens it for another period.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._opened_at is not None
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if self._clock() - self._opened_at >= self.reset_seconds and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+        raise CircuitOpenError(f"{self.name} circuit open after {self.failure_threshold} consecutive failures")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+            self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """Give back a half-open trial whose call was abandoned without an outcome."""
+        with self._lock:
+            self._trial_in_flight = False
+
+
+class LatencyWindow:
+    """Rolling window of recent call latencies for picking a hedge delay."""
+
+    def __init__(self, size: int = 200) -> None:
+        self._lock = threading.Lock()
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._samples)
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def p95(self) -> float:
+        with self._lock:
+            values = sorted(self._samples)
+        return percentile(values, 95)
+
+
+def hedged_call(
+    pool: Executor,
+    fn: Callable[[], Any],
+    delay: float,
+    may_hedge: Callable[[], bool] = lambda: True,
+    release: Callable[[], None] = lambda: None,
+) -> tuple[Any, bool]:
+    """Run ``fn``; if it has not answered after ``delay`` seconds, start a duplicate.
+
+    Returns ``(result, hedged)`` from whichever attempt succeeds first. If
+    every attempt fails, the primary's exception is raised. ``may_hedge`` is
+    checked right before the duplicate is issued, e.g. to spend a rate-limit
+    token or take a concurrency slot; ``release`` runs once both attempts
+    have finished, so a slot taken for the duplicate stays held while the
+    losing attempt is still in flight.
+    """
+    primary = pool.submit(fn)
+    done, _ = wait([primary], timeout=delay)
+    if done or not may_hedge():
+        return primary.result(), False
+
+    try:
+        duplicate = pool.submit(fn)
+    except BaseException:
+        release()
+        raise
+    lock = threading.Lock()
+    running = [2]
+
+    def settle(_: Future) -> None:
+        with lock:
+            running[0] -= 1
+            last = running[0] == 0
+        if last:
+            release()
+
+    primary.add_done_callback(settle)
+    duplicate.add_done_callback(settle)
+    pending: set[Future] = {primary, duplicate}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future.result(), True
+    return primary.result(), True
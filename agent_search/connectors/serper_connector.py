@@ -1,22 +1,46 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Callable
 
 import requests
 
+from agent_search.connectors.http import build_async_client, build_session
+from agent_search.connectors.recording import CallArchive
 from agent_search.models import NewsItem
+from agent_search.storage.search_cache import SearchCache
 from agent_search.utils import source_from_url, stable_hash
 
 
 class SerperConnector:
-    def __init__(self, api_key: str | None = None, base_url: str = "https://google.serper.dev/search"):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str = "https://google.serper.dev/search",
+        session: requests.Session | None = None,
+        pool_size: int = 10,
+        cache: SearchCache | None = None,
+        archive: CallArchive | None = None,
+    ):
         self.api_key = api_key or os.getenv("SERPER_API_KEY")
         self.base_url = base_url
+        self._owns_session = session is None
+        self.session = session or build_session(pool_size)
+        self.cache = cache
+        self.archive = archive
+        self._async_client: Any = None
+        # Set by the agent to its breaker + rate-limit path; called as ``guard(fn, **kwargs)``.
+        self.guard: Callable[..., Any] | None = None
+        self._refresh_lock = threading.Lock()
+        self._refreshing: set[str] = set()
+        self._refresher: ThreadPoolExecutor | None = None
 
-    def search(self, query: str, num: int = 10, hl: str = "zh-cn", gl: str = "cn") -> dict[str, Any]:
+    def _build_request(self, query: str, num: int, hl: str, gl: str) -> tuple[dict[str, str], str]:
         if not self.api_key:
             raise ValueError("Missing environment variable: SERPER_API_KEY")
 
@@ -25,10 +49,111 @@ class SerperConnector:
             "X-API-KEY": self.api_key,
             "Content-Type": "application/json",
         }
-        response = requests.post(self.base_url, headers=headers, data=payload, timeout=20)
+        return headers, payload
+
+    @staticmethod
+    def cache_key(query: str, num: int, hl: str, gl: str) -> str:
+        return stable_hash(json.dumps([query, num, hl, gl], ensure_ascii=False))
+
+    def now(self) -> datetime:
+        """Reference time for news cutoffs; pinned to the recording time on replay."""
+        if self.archive is not None and self.archive.replaying:
+            return self.archive.recorded_at
+        return datetime.now(timezone.utc)
+
+    def _post(self, query: str, num: int, hl: str, gl: str) -> dict[str, Any]:
+        headers, payload = self._build_request(query, num, hl, gl)
+        response = self.session.post(self.base_url, headers=headers, data=payload, timeout=20)
         response.raise_for_status()
         return response.json()
 
+    def _fetch(self, query: str, num: int, hl: str, gl: str) -> dict[str, Any]:
+        if self.archive is None:
+            return self._post(query, num, hl, gl)
+        return self.archive.call("serper", "search", self._post, query, num, hl, gl)
+
+    def _cached(self, key: str, kind: str, query: str, num: int, hl: str, gl: str) -> dict[str, Any] | None:
+        if self.cache is None:
+            return None
+        hit = self.cache.lookup(key, kind)
+        if hit is None:
+            return None
+        result, fresh = hit
+        if not fresh:
+            self._revalidate(key, kind, query, num, hl, gl)
+        return result
+
+    def _revalidate(self, key: str, kind: str, query: str, num: int, hl: str, gl: str) -> None:
+        """Refresh a stale entry in the background; at most one refresh per key at a time."""
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._refresher is None:
+                self._refresher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="serper-refresh")
+
+        def refresh() -> None:
+            try:
+                if self.guard is None:
+                    result = self._fetch(query, num, hl, gl)
+                else:
+                    result = self.guard(self._fetch, query=query, num=num, hl=hl, gl=gl)
+                self.cache.put(key, kind, query, result)
+            except Exception:  # noqa: BLE001
+                pass  # keep serving the stale copy until it ages out
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+
+        self._refresher.submit(refresh)
+
+    def search(
+        self, query: str, num: int = 10, hl: str = "zh-cn", gl: str = "cn", kind: str = "search"
+    ) -> dict[str, Any]:
+        key = self.cache_key(query, num, hl, gl)
+        cached = self._cached(key, kind, query, num, hl, gl)
+        if cached is not None:
+            return cached
+        result = self._fetch(query, num, hl, gl)
+        if self.cache is not None:
+            self.cache.put(key, kind, query, result)
+        return result
+
+    async def asearch(
+        self, query: str, num: int = 10, hl: str = "zh-cn", gl: str = "cn", kind: str = "search"
+    ) -> dict[str, Any]:
+        key = self.cache_key(query, num, hl, gl)
+        # Cache reads and writes are SQLite calls; keep them off the event loop.
+        cached = None if self.cache is None else await asyncio.to_thread(self._cached, key, kind, query, num, hl, gl)
+        if cached is not None:
+            return cached
+        archive_key = CallArchive.key("serper", "search", (query, num, hl, gl), {})
+        if self.archive is not None and self.archive.replaying:
+            return self.archive.lookup(archive_key)
+        headers, payload = self._build_request(query, num, hl, gl)
+        if self._async_client is None:
+            self._async_client = build_async_client()
+        response = await self._async_client.post(self.base_url, headers=headers, content=payload, timeout=20)
+        response.raise_for_status()
+        result = response.json()
+        if self.archive is not None:
+            self.archive.store(archive_key, result)
+        if self.cache is not None:
+            await asyncio.to_thread(self.cache.put, key, kind, query, result)
+        return result
+
+    def close(self) -> None:
+        if self._refresher is not None:
+            self._refresher.shutdown(wait=True)
+            self._refresher = None
+        if self._owns_session:
+            self.session.close()
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
     @staticmethod
     def parse_time(raw: Any, default: datetime | None = None) -> datetime:
         if isinstance(raw, datetime):
@@ -90,7 +215,14 @@ class SerperConnector:
         hour_bucket = item.ts.astimezone(timezone.utc).strftime("%Y%m%d%H")
         return url_hash, hour_bucket
 
+    @staticmethod
+    def news_query(symbol: str) -> str:
+        return f"{symbol} A股 最新 新闻 财经"
+
     def get_news(self, symbol: str, since_hours: int = 48) -> list[NewsItem]:
-        query = f"{symbol} A股 最新 新闻 财经"
-        result = self.search(query)
-        return self.build_news_items_from_result(symbol, result, since_hours=since_hours)
+        result = self.search(self.news_query(symbol), kind="news")
+        return self.build_news_items_from_result(symbol, result, now=self.now(), since_hours=since_hours)
+
+    async def aget_news(self, symbol: str, since_hours: int = 48) -> list[NewsItem]:
+        result = await self.asearch(self.news_query(symbol), kind="news")
+        return self.build_news_items_from_result(symbol, result, now=self.now(), since_hours=since_hours)
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Iterable
+
+
+class TradingCalendar:
+    """Sorted exchange trading days with O(log n) lookups."""
+
+    def __init__(self, days: Iterable[date], fetched_on: date | None = None) -> None:
+        self.days: list[date] = sorted(set(days))
+        self.fetched_on = fetched_on
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def is_trading_day(self, day: date) -> bool:
+        index = bisect_left(self.days, day)
+        return index < len(self.days) and self.days[index] == day
+
+    def next_trading_day(self, day: date) -> date | None:
+        """First trading day strictly after ``day``."""
+        index = bisect_right(self.days, day)
+        return self.days[index] if index < len(self.days) else None
+
+    def prev_trading_day(self, day: date) -> date | None:
+        """Last trading day strictly before ``day``."""
+        index = bisect_left(self.days, day)
+        return self.days[index - 1] if index > 0 else None
+
+    def trading_days_between(self, start: date, end: date) -> list[date]:
+        """Trading days in ``[start, end]``."""
+        return self.days[bisect_left(self.days, start) : bisect_right(self.days, end)]
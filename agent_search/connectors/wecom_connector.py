@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import time
 from typing import Any
 
 import requests
 
+from agent_search.connectors.http import build_async_client, build_session
+
 
 class WecomConnector:
     def __init__(
@@ -13,17 +16,19 @@ class WecomConnector:
         timeout: int = 10,
         max_retries: int = 3,
         backoff_seconds: float = 1.0,
+        session: requests.Session | None = None,
     ) -> None:
         self.webhook_url = webhook_url
         self.timeout = timeout
         self.max_retries = max_retries
         self.backoff_seconds = backoff_seconds
+        self._owns_session = session is None
+        self.session = session or build_session(pool_size=1)
+        self._async_client: Any = None
 
-    def send_text(self, content: str, mentioned_list: list[str] | None = None) -> dict[str, Any]:
-        if not self.webhook_url:
-            return {"ok": False, "error": "missing webhook"}
-
-        payload = {
+    @staticmethod
+    def _text_payload(content: str, mentioned_list: list[str] | None) -> dict[str, Any]:
+        return {
             "msgtype": "text",
             "text": {
                 "content": content,
@@ -31,19 +36,81 @@ class WecomConnector:
             },
         }
 
+    @staticmethod
+    def _markdown_payload(content: str) -> dict[str, Any]:
+        return {"msgtype": "markdown", "markdown": {"content": content}}
+
+    @staticmethod
+    def _check_response(data: dict[str, Any]) -> Exception | None:
+        if int(data.get("errcode", -1)) == 0:
+            return None
+        return RuntimeError(f"wecom errcode={data.get('errcode')} errmsg={data.get('errmsg')}")
+
+    def _backoff(self, attempt: int) -> float:
+        return self.backoff_seconds * (2 ** (attempt - 1))
+
+    def send_text(self, content: str, mentioned_list: list[str] | None = None) -> dict[str, Any]:
+        return self._send(self._text_payload(content, mentioned_list))
+
+    def send_markdown(self, content: str) -> dict[str, Any]:
+        return self._send(self._markdown_payload(content))
+
+    def _send(self, payload: dict[str, Any]) -> dict[str, Any]:
+        if not self.webhook_url:
+            return {"ok": False, "error": "missing webhook"}
+
         last_err: Exception | None = None
         for attempt in range(1, self.max_retries + 1):
             try:
-                resp = requests.post(self.webhook_url, json=payload, timeout=self.timeout)
+                resp = self.session.post(self.webhook_url, json=payload, timeout=self.timeout)
                 resp.raise_for_status()
                 data = resp.json()
-                if int(data.get("errcode", -1)) == 0:
+                last_err = self._check_response(data)
+                if last_err is None:
                     return {"ok": True, "data": data, "attempt": attempt}
-                last_err = RuntimeError(f"wecom errcode={data.get('errcode')} errmsg={data.get('errmsg')}")
             except Exception as err:  # noqa: BLE001
                 last_err = err
 
             if attempt < self.max_retries:
-                time.sleep(self.backoff_seconds * (2 ** (attempt - 1)))
+                time.sleep(self._backoff(attempt))
 
         return {"ok": False, "error": str(last_err) if last_err else "unknown error"}
+
+    async def asend_text(self, content: str, mentioned_list: list[str] | None = None) -> dict[str, Any]:
+        return await self._asend(self._text_payload(content, mentioned_list))
+
+    async def asend_markdown(self, content: str) -> dict[str, Any]:
+        return await self._asend(self._markdown_payload(content))
+
+    async def _asend(self, payload: dict[str, Any]) -> dict[str, Any]:
+        if not self.webhook_url:
+            return {"ok": False, "error": "missing webhook"}
+
+        if self._async_client is None:
+            self._async_client = build_async_client()
+
+        last_err: Exception | None = None
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                resp = await self._async_client.post(self.webhook_url, json=payload, timeout=self.timeout)
+                resp.raise_for_status()
+                data = resp.json()
+                last_err = self._check_response(data)
+                if last_err is None:
+                    return {"ok": True, "data": data, "attempt": attempt}
+            except Exception as err:  # noqa: BLE001
+                last_err = err
+
+            if attempt < self.max_retries:
+                await asyncio.sleep(self._backoff(attempt))
+
+        return {"ok": False, "error": str(last_err) if last_err else "unknown error"}
+
+    def close(self) -> None:
+        if self._owns_session:
+            self.session.close()
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
@@ -1,23 +1,551 @@
 from __future__ import annotations
 
+import json
+import multiprocessing
 import os
-from datetime import date, datetime, timedelta
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, timedelta, timezone
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Generator, Iterator
 from zoneinfo import ZoneInfo
 
-from agent_search.config import AppConfig, load_watchlist
+from agent_search.config import AppConfig, RateLimitConfig, SourceRateConfig, load_watchlist
 from agent_search.connectors import (
     AkShareConnector,
     AnnouncementConnector,
+    BulkAnnouncementConnector,
+    CallArchive,
+    RealtimeQuote,
     SerperConnector,
+    TradingCalendar,
     WecomConnector,
 )
-from agent_search.models import RunResult, SignalAction, TradeSignal
-from agent_search.reporting import ensure_daily_dir, write_daily_markdown, write_signals_json
-from agent_search.storage import SQLiteStore
-from agent_search.strategy import build_trade_signal, calculate_risk_state
+from agent_search.connectors.http import build_session
+from agent_search.connectors.ratelimit import AdaptiveRateLimiter
+from agent_search.connectors.resilience import CircuitBreaker, LatencyWindow, hedged_call
+from agent_search.metrics import RunMetrics
+from agent_search.models import MarketBar, NewsItem, RiskState, RunResult, SignalAction, TradeSignal
+from agent_search.outbox import AlertOutboxWorker
+from agent_search.reporting import (
+    DailyReportWriter,
+    build_alert_digests,
+    ensure_daily_dir,
+    write_daily_markdown,
+    write_signals_json,
+)
+from agent_search.storage import SearchCache, SQLiteStore
+from agent_search.strategy import build_trade_signal, calculate_risk_state, screen_universe
+from agent_search.utils import stable_hash
+
+
+KLINE_HISTORY_SLACK_DAYS = 15
+
+ShardComponents = Callable[[AppConfig], tuple[AkShareConnector, SerperConnector, AnnouncementConnector]]
+
+
+@dataclass
+class RunContext:
+    today: date
+    start: str
+    end: str
+    equity: float
+    risk_state: RiskState
+    cached_bars: dict[str, list[MarketBar]] | None = None
+    fingerprints: dict[str, tuple[str, TradeSignal]] | None = None
+    announcements: dict[str, list[NewsItem]] | None = None
+    metrics: RunMetrics = field(default_factory=RunMetrics)
 
 
-class TradingResearchAgent:
+@dataclass
+class SymbolScan:
+    symbol: str
+    bars: list[MarketBar] = field(default_factory=list)
+    new_bars: list[MarketBar] = field(default_factory=list)
+    news: list[NewsItem] = field(default_factory=list)
+    announcements: list[NewsItem] = field(default_factory=list)
+    errors: list[tuple[str, str]] = field(default_factory=list)
+    low_confidence_reason: str | None = None
+    signal: TradeSignal | None = None
+    fingerprint: str = ""
+    reused: bool = False
+
+    def fail(self, event: str, reason: str, err: Exception) -> None:
+        self.errors.append((event, str(err)))
+        self.low_confidence_reason = reason
+
+
+class SymbolScanner:
+    """Fetches inputs and builds signals; holds no store, so shard workers can run it."""
+
+    def __init__(
+        self,
+        config: AppConfig,
+        market_connector: AkShareConnector,
+        serper_connector: SerperConnector,
+        announcement_connector: AnnouncementConnector,
+    ) -> None:
+        self.config = config
+        self.market = market_connector
+        self.serper = serper_connector
+        self.announcements = announcement_connector
+        self._source_limits = {
+            "akshare": threading.BoundedSemaphore(max(1, config.scan.akshare_concurrency)),
+            "serper": threading.BoundedSemaphore(max(1, config.scan.serper_concurrency)),
+            # Bulk announcement pages are fetched one after another.
+            "cninfo": threading.BoundedSemaphore(1),
+        }
+        self._rate_limiters = build_rate_limiters(config.rate_limit)
+        self._breakers = self._build_breakers(config)
+        self._latency = {source: LatencyWindow() for source in config.resilience.hedge_sources}
+        self._hedge_lock = threading.Lock()
+        self._hedge_executor: ThreadPoolExecutor | None = None
+        self._signal_config_hash = stable_hash(
+            json.dumps({"signal": config.signal.model_dump(), "risk": config.risk.model_dump()}, sort_keys=True)
+        )
+        if isinstance(serper_connector, SerperConnector):
+            # Stale-while-revalidate refreshes share the scans' breaker, rate limit and concurrency cap.
+            serper_connector.guard = partial(self._call_source, None, "serper")
+
+    def _now(self) -> datetime:
+        return datetime.now(ZoneInfo(self.config.timezone))
+
+    def _date_range(self, lookback_days: int = 90) -> tuple[str, str]:
+        end_dt = self._now().date()
+        start_dt = end_dt - timedelta(days=lookback_days)
+        return start_dt.isoformat(), end_dt.isoformat()
+
+    @staticmethod
+    def _timed(ctx: RunContext | None, stage: str, source: str = "") -> ContextManager[None]:
+        if ctx is None:
+            return nullcontext()
+        return ctx.metrics.timer(stage, source)
+
+    def _build_breakers(self, config: AppConfig) -> dict[str, CircuitBreaker]:
+        settings = config.resilience
+        if settings.breaker_failures <= 0:
+            return {}
+        return {
+            source: CircuitBreaker(
+                source,
+                failure_threshold=settings.breaker_failures,
+                reset_seconds=settings.breaker_reset_seconds,
+            )
+            for source in ("akshare", "serper", "cninfo")
+        }
+
+    def _hedge_pool(self) -> ThreadPoolExecutor:
+        with self._hedge_lock:
+            if self._hedge_executor is None:
+                workers = 2 * max(self.config.scan.akshare_concurrency, self.config.scan.serper_concurrency)
+                self._hedge_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hedge")
+            return self._hedge_executor
+
+    def _hedge_delay(self, source: str) -> float | None:
+        """p95 of recent latencies once enough samples exist, or ``None`` to call directly."""
+        settings = self.config.resilience
+        window = self._latency.get(source)
+        if window is None or len(window) < settings.hedge_min_samples:
+            return None
+        return max(settings.hedge_min_delay_seconds, window.p95())
+
+    def _before_call(self, source: str) -> None:
+        breaker = self._breakers.get(source)
+        if breaker is not None:
+            breaker.before_call()
+
+    def _abandon_call(self, source: str) -> None:
+        # A cancelled or interrupted call says nothing about the source; let the next caller take the trial.
+        breaker = self._breakers.get(source)
+        if breaker is not None:
+            breaker.release_trial()
+
+    def _observe_call(
+        self, ctx: RunContext | None, source: str, started: float, error: BaseException | None = None
+    ) -> None:
+        elapsed = time.perf_counter() - started
+        breaker = self._breakers.get(source)
+        if breaker is not None:
+            if error is None:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+            if ctx is not None:
+                ctx.metrics.gauge(f"circuit.{source}", 1.0 if breaker.is_open else 0.0)
+        window = self._latency.get(source)
+        if window is not None and error is None:
+            window.add(elapsed)
+        limiter = self._rate_limiters.get(source)
+        if limiter is not None:
+            limiter.observe(elapsed, error)
+            if ctx is not None:
+                ctx.metrics.gauge(f"ratelimit.{source}", round(limiter.rate, 3))
+
+    def _guarded_call(self, ctx: RunContext | None, source: str, fn: Callable[..., Any], **kwargs: Any) -> Any:
+        """Circuit breaker, rate limit and optional hedging around one connector call."""
+        self._before_call(source)
+        limiter = self._rate_limiters.get(source)
+        if limiter is not None:
+            limiter.acquire()
+        delay = self._hedge_delay(source)
+        slots = self._source_limits.get(source)
+
+        def may_hedge() -> bool:
+            # The duplicate is one more request in flight: it needs its own concurrency slot and rate token.
+            if slots is not None and not slots.acquire(blocking=False):
+                return False
+            if limiter is None or limiter.try_acquire():
+                return True
+            if slots is not None:
+                slots.release()
+            return False
+
+        started = time.perf_counter()
+        try:
+            if delay is None:
+                result = fn(**kwargs)
+            else:
+                result, hedged = hedged_call(
+                    self._hedge_pool(),
+                    partial(fn, **kwargs),
+                    delay,
+                    may_hedge=may_hedge,
+                    release=slots.release if slots is not None else lambda: None,
+                )
+                if hedged and ctx is not None:
+                    ctx.metrics.record("hedge", delay, source)
+        except Exception as err:
+            self._observe_call(ctx, source, started, err)
+            raise
+        except BaseException:
+            self._abandon_call(source)
+            raise
+        self._observe_call(ctx, source, started)
+        return result
+
+    def close(self) -> None:
+        with self._hedge_lock:
+            if self._hedge_executor is not None:
+                self._hedge_executor.shutdown(wait=False, cancel_futures=True)
+                self._hedge_executor = None
+
+    def _call_source(self, ctx: RunContext | None, source: str, fn: Callable[..., Any], **kwargs: Any) -> Any:
+        with self._source_limits.get(source) or nullcontext():
+            with self._timed(ctx, f"connector.{fn.__name__}", source):
+                return self._guarded_call(ctx, source, fn, **kwargs)
+
+    def guarded(self, source: str, fn: Callable[..., Any], **kwargs: Any) -> Any:
+        """One connector call outside a run, under the same concurrency cap, breaker and rate limit as scans."""
+        return self._call_source(None, source, fn, **kwargs)
+
+    def _kline_fetch_start(self, symbol: str, ctx: RunContext) -> str:
+        """Return the first day to fetch: the last cached day, or the full window start."""
+        cached = (ctx.cached_bars or {}).get(symbol)
+        if not cached:
+            return ctx.start
+        window_start = date.fromisoformat(ctx.start)
+        if (cached[0].ts.date() - window_start).days > KLINE_HISTORY_SLACK_DAYS:
+            return ctx.start
+        return cached[-1].ts.date().isoformat()
+
+    @staticmethod
+    def _same_price(left: float, right: float) -> bool:
+        return abs(left - right) <= 1e-6 * max(1.0, abs(left))
+
+    def _merge_kline(
+        self, symbol: str, ctx: RunContext, fetch_start: str, fetched: list[MarketBar]
+    ) -> list[MarketBar] | None:
+        """Splice a fetched tail onto the cached history.
+
+        Returns ``None`` when the overlapping, already-closed bar no longer
+        matches the cache, which means the qfq factors moved and the whole
+        window has to be refetched.
+        """
+        if fetch_start == ctx.start:
+            return fetched
+        cached = ctx.cached_bars[symbol]
+        if not fetched:
+            return list(cached)
+
+        last = cached[-1]
+        overlap = next((bar for bar in fetched if bar.ts == last.ts), None)
+        if overlap is not None and last.ts.date() < ctx.today:
+            if not (self._same_price(overlap.close, last.close) and self._same_price(overlap.open, last.open)):
+                return None
+        head = [bar for bar in cached if bar.ts < fetched[0].ts]
+        return head + fetched
+
+    def _load_bars(self, symbol: str, ctx: RunContext) -> tuple[list[MarketBar], list[MarketBar]]:
+        """Return ``(bars, new_bars)``: the full lookback and the bars that still need saving."""
+        fetch_start = self._kline_fetch_start(symbol, ctx)
+        fetched = self._call_source(
+            ctx, "akshare", self.market.get_kline, symbol=symbol, start=fetch_start, end=ctx.end
+        )
+        bars = self._merge_kline(symbol, ctx, fetch_start, fetched)
+        if bars is None:
+            fetched = self._call_source(
+                ctx, "akshare", self.market.get_kline, symbol=symbol, start=ctx.start, end=ctx.end
+            )
+            bars = fetched
+        return bars, fetched
+
+    def _input_fingerprint(self, scan: SymbolScan, ctx: RunContext) -> str:
+        """Hash everything ``build_trade_signal`` reads for this symbol."""
+        bars = scan.bars
+        payload = {
+            "day": ctx.today.isoformat(),
+            "bars": len(bars),
+            "first": [bars[0].ts.isoformat(), bars[0].close] if bars else None,
+            "last": [bars[-1].ts.isoformat(), bars[-1].close, bars[-1].high, bars[-1].low, bars[-1].volume]
+            if bars
+            else None,
+            "news": sorted(item.id for item in scan.news),
+            "announcements": sorted(item.id for item in scan.announcements),
+            "risk": ctx.risk_state.model_dump(mode="json"),
+            "equity": ctx.equity,
+            "config": self._signal_config_hash,
+            "low_confidence": scan.low_confidence_reason,
+        }
+        return stable_hash(json.dumps(payload, sort_keys=True))
+
+    def _build_signal(self, scan: SymbolScan, ctx: RunContext) -> TradeSignal:
+        if ctx.fingerprints is not None:
+            scan.fingerprint = self._input_fingerprint(scan, ctx)
+            previous = ctx.fingerprints.get(scan.symbol)
+            if previous is not None and previous[0] == scan.fingerprint:
+                scan.reused = True
+                ctx.metrics.record("signal.reused", 0.0)
+                return previous[1].model_copy(deep=True)
+
+        with ctx.metrics.timer("build_trade_signal"):
+            signal = build_trade_signal(
+                symbol=scan.symbol,
+                bars=scan.bars,
+                news_items=scan.news,
+                announcements=scan.announcements,
+                config=self.config,
+                risk_state=ctx.risk_state,
+                equity=ctx.equity,
+                ts=self._now(),
+            )
+        if scan.low_confidence_reason:
+            signal.low_confidence = True
+            signal.reasons.append(scan.low_confidence_reason)
+        return signal
+
+    def _scan_symbol(self, symbol: str, ctx: RunContext) -> SymbolScan:
+        """Fetch inputs and build the signal for one symbol; never touches the store."""
+        scan = SymbolScan(symbol=symbol)
+
+        try:
+            scan.bars, scan.new_bars = self._load_bars(symbol, ctx)
+        except Exception as err:  # noqa: BLE001
+            scan.fail("market_error", f"行情获取失败: {err}", err)
+
+        try:
+            scan.news = self._call_source(ctx, "serper", self.serper.get_news, symbol=symbol, since_hours=48)
+        except Exception as err:  # noqa: BLE001
+            scan.fail("news_error", f"新闻获取失败: {err}", err)
+
+        if ctx.announcements is not None:
+            scan.announcements = ctx.announcements.get(symbol, [])
+        else:
+            try:
+                scan.announcements = self._call_source(
+                    ctx, "serper", self.announcements.get_announcements, symbol=symbol, since_days=7
+                )
+            except Exception as err:  # noqa: BLE001
+                scan.fail("announcement_error", f"公告获取失败: {err}", err)
+
+        scan.signal = self._build_signal(scan, ctx)
+        return scan
+
+    def _iter_scans(self, symbols: list[str], ctx: RunContext) -> Iterator[SymbolScan]:
+        """Yield symbol scans in input order, fanning out over a thread pool when configured."""
+        workers = min(max(1, self.config.scan.max_workers), len(symbols))
+        if workers <= 1:
+            for symbol in symbols:
+                yield self._scan_symbol(symbol, ctx)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan") as pool:
+            yield from pool.map(lambda symbol: self._scan_symbol(symbol, ctx), symbols)
+
+    def _iter_scans_as_completed(self, symbols: list[str], ctx: RunContext) -> Iterator[SymbolScan]:
+        """Yield symbol scans as they finish, keeping at most two scans per worker in flight."""
+        workers = min(max(1, self.config.scan.max_workers), len(symbols))
+        if workers <= 1:
+            yield from self._iter_scans(symbols, ctx)
+            return
+
+        remaining = iter(symbols)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan") as pool:
+            in_flight = {pool.submit(self._scan_symbol, symbol, ctx) for symbol in islice(remaining, workers * 2)}
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    symbol = next(remaining, None)
+                    if symbol is not None:
+                        in_flight.add(pool.submit(self._scan_symbol, symbol, ctx))
+                    yield future.result()
+
+
+def http_pool_size(config: AppConfig) -> int:
+    return max(1, config.scan.http_pool_size or config.scan.serper_concurrency)
+
+
+def source_limiter(settings: RateLimitConfig, limits: SourceRateConfig) -> AdaptiveRateLimiter:
+    return AdaptiveRateLimiter(
+        rate=limits.rate,
+        burst=limits.burst,
+        min_rate=limits.min_rate,
+        max_rate=limits.max_rate,
+        increase_step=settings.increase_step,
+        decrease_factor=settings.decrease_factor,
+        slow_seconds=limits.slow_seconds,
+    )
+
+
+def build_rate_limiters(settings: RateLimitConfig) -> dict[str, AdaptiveRateLimiter]:
+    """One AIMD limiter per upstream source, or none when ``rate_limit`` is disabled."""
+    if not settings.enabled:
+        return {}
+    return {
+        source: source_limiter(settings, limits)
+        for source, limits in (
+            ("akshare", settings.akshare),
+            ("serper", settings.serper),
+            ("cninfo", settings.cninfo),
+            ("wecom", settings.wecom),
+        )
+    }
+
+
+def build_store(config: AppConfig) -> SQLiteStore:
+    settings = config.storage
+    return SQLiteStore(
+        settings.db_path,
+        journal_mode=settings.journal_mode,
+        synchronous=settings.synchronous,
+        cache_size_kib=settings.cache_size_kib,
+        busy_timeout_ms=settings.busy_timeout_ms,
+        event_buffer_size=settings.event_buffer_size,
+        write_batch_size=settings.write_batch_size,
+    )
+
+
+def build_search_cache(config: AppConfig) -> SearchCache | None:
+    settings = config.search_cache
+    if not settings.enabled:
+        return None
+    return SearchCache(
+        config.storage.db_path,
+        ttls={"news": settings.news_ttl_seconds, "announcement": settings.announcement_ttl_seconds},
+        default_ttl=settings.default_ttl_seconds,
+        stale_seconds=settings.stale_seconds,
+        max_entries=settings.max_entries,
+    )
+
+
+def archive_config(config: AppConfig) -> AppConfig:
+    """Config for a record/replay run: every input comes from the upstream calls themselves."""
+    return config.model_copy(
+        update={
+            "scan": config.scan.model_copy(
+                update={"incremental_kline": False, "reuse_unchanged_signals": False, "spot_ttl_seconds": 0.0}
+            ),
+            "search_cache": config.search_cache.model_copy(update={"enabled": False}),
+            "rate_limit": config.rate_limit.model_copy(update={"enabled": False}),
+            # A hedged duplicate would make the recorded call sequence depend on timing.
+            "resilience": config.resilience.model_copy(update={"hedge_sources": []}),
+        }
+    )
+
+
+def replay_config(config: AppConfig, archive: CallArchive) -> AppConfig:
+    """Point a replay's store and reports at ``<archive>.replay/`` so the live DB and results stay untouched."""
+    out_dir = archive.path.with_name(archive.path.name + ".replay")
+    return config.model_copy(
+        update={
+            "results_dir": str(out_dir / "results"),
+            "storage": config.storage.model_copy(update={"db_path": str(out_dir / "agent.db")}),
+        }
+    )
+
+
+def default_shard_components(config: AppConfig) -> tuple[AkShareConnector, SerperConnector, AnnouncementConnector]:
+    serper = SerperConnector(
+        api_key=os.getenv(config.integrations.serper_api_key_env),
+        pool_size=http_pool_size(config),
+        cache=build_search_cache(config),
+    )
+    market = AkShareConnector(
+        calendar_path=config.storage.calendar_path,
+        spot_ttl_seconds=config.scan.spot_ttl_seconds,
+        timezone=config.timezone,
+    )
+    return market, serper, AnnouncementConnector(serper)
+
+
+def split_shards(symbols: list[str], shards: int) -> list[list[str]]:
+    """Split into at most ``shards`` contiguous, evenly sized chunks that keep input order."""
+    shards = max(1, min(shards, len(symbols)))
+    size, extra = divmod(len(symbols), shards)
+    chunks: list[list[str]] = []
+    start = 0
+    for index in range(shards):
+        end = start + size + (1 if index < extra else 0)
+        chunks.append(symbols[start:end])
+        start = end
+    return chunks
+
+
+def shard_context(ctx: RunContext, shard: list[str]) -> RunContext:
+    """The run context a worker needs for ``shard``: only its symbols' preloaded inputs get pickled."""
+
+    def only_shard(values: dict[str, Any] | None) -> dict[str, Any] | None:
+        return None if values is None else {symbol: values[symbol] for symbol in shard if symbol in values}
+
+    return replace(
+        ctx,
+        cached_bars=only_shard(ctx.cached_bars),
+        fingerprints=only_shard(ctx.fingerprints),
+        announcements=only_shard(ctx.announcements),
+        metrics=RunMetrics(run_id=ctx.metrics.run_id),
+    )
+
+
+@dataclass
+class ShardTask:
+    config: AppConfig
+    symbols: list[str]
+    ctx: RunContext
+    components: ShardComponents
+
+
+def scan_shard(task: ShardTask) -> tuple[list[SymbolScan], RunMetrics]:
+    """Process-pool entry point: scan one shard with freshly built connectors."""
+    market, serper, announcements = task.components(task.config)
+    scanner = SymbolScanner(task.config, market, serper, announcements)
+    try:
+        scans = list(scanner._iter_scans(task.symbols, task.ctx))
+    finally:
+        scanner.close()
+        closer = getattr(serper, "close", None)
+        if closer is not None:
+            closer()
+        cache = getattr(serper, "cache", None)
+        if cache is not None:
+            cache.close()
+    return scans, task.ctx.metrics
+
+
+class TradingResearchAgent(SymbolScanner):
     def __init__(
         self,
         config: AppConfig,
@@ -26,29 +554,110 @@ class TradingResearchAgent:
         announcement_connector: AnnouncementConnector | None = None,
         notifier: WecomConnector | None = None,
         store: SQLiteStore | None = None,
+        archive: CallArchive | None = None,
+        bulk_announcements: BulkAnnouncementConnector | None = None,
     ) -> None:
-        self.config = config
-        self.market = market_connector or AkShareConnector()
-        self.serper = serper_connector or SerperConnector(
-            api_key=os.getenv(config.integrations.serper_api_key_env)
+        self.archive = archive
+        if archive is not None:
+            config = archive_config(config)
+        if archive is not None and archive.replaying:
+            config = replay_config(config, archive)
+        # One keep-alive pool shared by the default Serper and WeCom connectors; released in close().
+        self._http_session = build_session(http_pool_size(config))
+        self._search_cache = None if serper_connector else build_search_cache(config)
+        market = market_connector or AkShareConnector(
+            calendar_path=config.storage.calendar_path,
+            spot_ttl_seconds=config.scan.spot_ttl_seconds,
+            archive=archive,
+            timezone=config.timezone,
+        )
+        serper = serper_connector or SerperConnector(
+            api_key=os.getenv(config.integrations.serper_api_key_env),
+            session=self._http_session,
+            cache=self._search_cache,
+            archive=archive,
         )
-        self.announcements = announcement_connector or AnnouncementConnector(self.serper)
-        self.notifier = notifier or WecomConnector(
-            webhook_url=os.getenv(config.integrations.wecom_webhook_env)
+        super().__init__(
+            config=config,
+            market_connector=market,
+            serper_connector=serper,
+            announcement_connector=announcement_connector or AnnouncementConnector(serper),
         )
-        self.store = store or SQLiteStore(config.storage.db_path)
+        # A replay stays offline: alerts are formatted and logged but never posted.
+        webhook_url = os.getenv(config.integrations.wecom_webhook_env)
+        if archive is not None and archive.replaying:
+            webhook_url = None
+        self.notifier = notifier or WecomConnector(webhook_url=webhook_url, session=self._http_session)
+        if config.alerts.mode == "digest" and "wecom" not in self._rate_limiters:
+            # Digests are always paced against the webhook limit, even with rate_limit disabled.
+            self._rate_limiters["wecom"] = source_limiter(config.rate_limit, config.rate_limit.wecom)
+        settings = config.announcements
+        if bulk_announcements is None and settings.mode == "bulk":
+            bulk_announcements = BulkAnnouncementConnector(
+                endpoint_url=settings.endpoint_url,
+                columns=settings.columns,
+                page_size=settings.page_size,
+                max_pages=settings.max_pages,
+                session=self._http_session,
+                archive=archive,
+            )
+        self.bulk_announcements = bulk_announcements
+        self._owns_store = store is None
+        self.store = store or build_store(config)
+        self.outbox: AlertOutboxWorker | None = None
+        # Replayed alerts must never reach the durable outbox, or a later live worker would post them.
+        if config.alerts.delivery == "outbox" and not (archive is not None and archive.replaying):
+            self.outbox = AlertOutboxWorker(
+                self.store.db_path,
+                self.notifier,
+                poll_seconds=config.alerts.outbox_poll_seconds,
+                max_attempts=config.alerts.outbox_max_attempts,
+                backoff_seconds=config.alerts.outbox_backoff_seconds,
+                limiter=self._rate_limiters.get("wecom"),
+                store=self.store,
+            )
+
+    def start_outbox(self) -> None:
+        """Deliver queued alerts from this process until ``close``; only the run commands call this."""
+        if self.outbox is not None:
+            self.outbox.start()
+
+    def close(self) -> None:
+        """Release the HTTP pool and, if the agent opened them, the search cache and store."""
+        super().close()
+        if self.outbox is not None:
+            self.outbox.stop()  # delivers what the last run queued, then releases the store
+        if self._search_cache is not None:
+            closer = getattr(self.serper, "close", None)
+            if closer is not None:
+                closer()  # drains pending stale-while-revalidate refreshes
+            self._search_cache.close()
+        if self.bulk_announcements is not None:
+            self.bulk_announcements.close()
+        self._http_session.close()
+        if self._owns_store:
+            self.store.close()
+
+    def _now(self) -> datetime:
+        if self.archive is None:
+            return super()._now()
+        return self.archive.recorded_at.astimezone(ZoneInfo(self.config.timezone))
+
+    def __enter__(self) -> TradingResearchAgent:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
 
     def _default_symbols(self) -> list[str]:
         return load_watchlist(self.config.universe_file)
 
-    def _date_range(self, lookback_days: int = 90) -> tuple[str, str]:
-        tz = ZoneInfo(self.config.timezone)
-        end_dt = datetime.now(tz).date()
-        start_dt = end_dt - timedelta(days=lookback_days)
-        return start_dt.isoformat(), end_dt.isoformat()
-
     def _build_risk_state(self, equity: float, today: date):
-        latest = self.store.get_latest_risk_state()
+        if self.archive is None:
+            latest = self.store.get_latest_risk_state()
+        else:
+            # The recording pins the peak it started from; a replay must not read it from its own DB.
+            latest = self.archive.call("store", "get_latest_risk_state", self.store.get_latest_risk_state)
         peak = latest.peak_equity if latest else equity
         return calculate_risk_state(
             equity=equity,
@@ -57,110 +666,522 @@ class TradingResearchAgent:
             on_date=today,
         )
 
-    def _maybe_send_alert(self, signal: TradeSignal) -> bool:
+    @staticmethod
+    def _format_alert(signal: TradeSignal) -> str | None:
         if signal.action not in (SignalAction.BUY, SignalAction.REDUCE):
-            return False
-        text = (
+            return None
+        return (
             f"[A股信号] {signal.symbol} {signal.action}\n"
             f"score={signal.score:.2f}, confidence={signal.confidence:.2f}\n"
             f"entry={signal.entry}, stop={signal.stop_loss}, take={signal.take_profit}\n"
             f"position={signal.position_size_pct:.2%}\n"
             f"evidence={signal.evidence_urls[0] if signal.evidence_urls else 'N/A'}"
         )
-        result = self.notifier.send_text(text)
-        self.store.log_event("wecom_alert", {"signal_id": signal.id, "result": result})
+
+    def _enqueue_alert(self, kind: str, content: str, signal_ids: list[str], ctx: RunContext | None) -> bool:
+        with self._timed(ctx, "store.enqueue_alert", "sqlite"):
+            queued = self.store.enqueue_alert(kind, content, signal_ids)
+        self.outbox.notify()
+        return queued
+
+    def _maybe_send_alert(self, signal: TradeSignal, ctx: RunContext | None = None) -> bool:
+        text = self._format_alert(signal)
+        if text is None:
+            return False
+        if self.outbox is not None:
+            return self._enqueue_alert("text", text, [signal.id], ctx)
+        with self._timed(ctx, "connector.send_text", "wecom"):
+            result = self._guarded_call(ctx, "wecom", self.notifier.send_text, content=text)
+        with self._timed(ctx, "store.log_event", "sqlite"):
+            self.store.log_event("wecom_alert", {"signal_id": signal.id, "result": result})
         return bool(result.get("ok"))
 
-    def run_once(self, symbols: list[str] | None = None, equity: float = 1_000_000.0) -> RunResult:
+    def _send_alerts(self, signals: list[TradeSignal], ctx: RunContext) -> int:
+        """Alert every actionable signal, one message each or packed into digests; returns signals alerted.
+
+        With outbox delivery the messages are only queued here and "alerted" counts queued signals.
+        """
+        if self.config.alerts.mode != "digest":
+            return sum(1 for signal in signals if self._maybe_send_alert(signal, ctx))
+        actionable = [signal for signal in signals if self._format_alert(signal) is not None]
+        sent = 0
+        for content, batch in build_alert_digests(actionable, ctx.today, self.config.alerts.max_bytes):
+            if self.outbox is not None:
+                if self._enqueue_alert("markdown", content, [signal.id for signal in batch], ctx):
+                    sent += len(batch)
+                continue
+            with self._timed(ctx, "connector.send_markdown", "wecom"):
+                result = self._guarded_call(ctx, "wecom", self.notifier.send_markdown, content=content)
+            payload = {"signal_ids": [signal.id for signal in batch], "result": result}
+            with self._timed(ctx, "store.log_event", "sqlite"):
+                self.store.log_event("wecom_digest", payload)
+            if result.get("ok"):
+                sent += len(batch)
+        return sent
+
+    def _start_run(
+        self,
+        target_symbols: list[str],
+        equity: float,
+        full_refresh: bool = False,
+        preload_bars: bool = False,
+    ) -> RunContext:
+        metrics = RunMetrics()
+        today = self._now().date()
+        start, end = self._date_range(lookback_days=self.config.scan.kline_lookback_days)
+
+        risk_state = self._build_risk_state(equity=equity, today=today)
+        with self.store.transaction():
+            with metrics.timer("store.save_risk_state", "sqlite"):
+                self.store.save_risk_state(risk_state)
+            with metrics.timer("store.log_event", "sqlite"):
+                self.store.log_event(
+                    "run_once_start",
+                    {"run_id": metrics.run_id, "symbols": target_symbols, "date": today.isoformat()},
+                )
+
+        cached_bars = None
+        if (self.config.scan.incremental_kline or preload_bars) and not full_refresh:
+            # Loaded up front on this thread: scan workers must not touch the store.
+            with metrics.timer("store.get_market_bars", "sqlite"):
+                cached_bars = {symbol: self.store.get_market_bars(symbol, start, end) for symbol in target_symbols}
+        fingerprints = None
+        if self.config.scan.reuse_unchanged_signals:
+            with metrics.timer("store.get_signal_fingerprints", "sqlite"):
+                fingerprints = self.store.get_signal_fingerprints(target_symbols)
+        ctx = RunContext(
+            today=today,
+            start=start,
+            end=end,
+            equity=equity,
+            risk_state=risk_state,
+            cached_bars=cached_bars,
+            fingerprints=fingerprints,
+            metrics=metrics,
+        )
+        if self.bulk_announcements is not None:
+            self._ingest_announcements(ctx)
+            since = self._now().astimezone(timezone.utc) - timedelta(days=self.config.announcements.since_days)
+            with metrics.timer("store.get_announcements", "sqlite"):
+                ctx.announcements = self.store.get_announcements(target_symbols, since)
+        return ctx
+
+    def _ingest_announcements(self, ctx: RunContext) -> None:
+        """Pull the market-wide announcement list for days not yet fetched (today every ``refresh_minutes``)."""
+        settings = self.config.announcements
+        today, metrics = ctx.today, ctx.metrics
+        now = self._now()
+        days = [today - timedelta(days=offset) for offset in range(settings.since_days, -1, -1)]
+        # Archive runs refetch the whole window so record and replay issue the same calls.
+        fetched = {} if self.archive is not None else self.store.get_announcement_ingest(days)
+        refresh = timedelta(minutes=settings.refresh_minutes)
+        pending = [
+            day
+            for day in days
+            if day not in fetched or (fetched[day].date() <= day and now - fetched[day] >= refresh)
+        ]
+        if not pending:
+            return
+        items: list[NewsItem] = []
+        counts: dict[date, int] = {}
+        for day in pending:
+            try:
+                # Every page goes through the cninfo breaker, rate limiter and metrics.
+                day_items, complete = self.bulk_announcements.fetch_day(
+                    day, guard=partial(self._call_source, ctx, "cninfo")
+                )
+            except Exception as err:  # noqa: BLE001
+                with metrics.timer("store.log_event", "sqlite"):
+                    self.store.log_event("announcement_ingest_error", {"day": day.isoformat(), "error": str(err)})
+                continue
+            items.extend(day_items)
+            if complete:
+                counts[day] = len(day_items)
+            else:
+                # Rows kept so far are saved, but the day stays pending for the next run.
+                with metrics.timer("store.log_event", "sqlite"):
+                    self.store.log_event(
+                        "announcement_ingest_truncated", {"day": day.isoformat(), "items": len(day_items)}
+                    )
+        with metrics.timer("store.save_announcements", "sqlite"):
+            self.store.save_announcements(items)
+            self.store.mark_announcement_ingest(counts, now)
+
+    def _record_scan(self, scan: SymbolScan, ctx: RunContext, save_news: bool = True) -> None:
+        for event, error in scan.errors:
+            with ctx.metrics.timer("store.log_event", "sqlite"):
+                self.store.log_event(event, {"symbol": scan.symbol, "error": error})
+        if scan.reused:
+            # Same inputs as the stored signal: the bars and news are already persisted.
+            return
+        if scan.new_bars:
+            with ctx.metrics.timer("store.save_market_bars", "sqlite"):
+                self.store.save_market_bars(scan.new_bars)
+        news = self._news_to_save(scan, ctx) if save_news else []
+        if news:
+            with ctx.metrics.timer("store.save_news_items", "sqlite"):
+                self.store.save_news_items(news)
+
+    @staticmethod
+    def _news_to_save(scan: SymbolScan, ctx: RunContext) -> list[NewsItem]:
+        # Bulk-ingested announcements already live in the announcements table.
+        if ctx.announcements is not None:
+            return scan.news
+        return scan.news + scan.announcements
+
+    def _finish_run(
+        self,
+        ctx: RunContext,
+        target_symbols: list[str],
+        signals: list[TradeSignal],
+        alerts_sent: int,
+        outputs: tuple[Path, Path] | None = None,
+        signal_count: int | None = None,
+    ) -> RunResult:
+        if outputs is None:
+            out_dir = ensure_daily_dir(self.config.results_dir, ctx.today)
+            with ctx.metrics.timer("report.write_signals_json"):
+                json_file = write_signals_json(out_dir, signals)
+            with ctx.metrics.timer("report.write_daily_markdown"):
+                md_file = write_daily_markdown(out_dir, ctx.today, signals, ctx.risk_state)
+            outputs = (json_file, md_file)
+        json_file, md_file = outputs
+
+        ctx.metrics.record("run", ctx.metrics.elapsed())
+        metrics = ctx.metrics.summary()
+        # Also flushes the audit events buffered since the last batch.
+        with self.store.transaction():
+            self.store.save_run_metrics(ctx.metrics.run_id, metrics)
+            self.store.log_event(
+                "run_once_end",
+                {
+                    "run_id": ctx.metrics.run_id,
+                    "date": ctx.today.isoformat(),
+                    "signals": len(signals) if signal_count is None else signal_count,
+                    "alerts_sent": alerts_sent,
+                    "output": str(json_file.parent),
+                    "duration_ms": round(ctx.metrics.elapsed() * 1000.0, 3),
+                    "gauges": ctx.metrics.gauges(),
+                },
+            )
+
+        return RunResult(
+            date=ctx.today,
+            symbols=target_symbols,
+            signals=signals,
+            risk_state=ctx.risk_state,
+            output_markdown=str(md_file),
+            output_json=str(json_file),
+            alerts_sent=alerts_sent,
+            run_id=ctx.metrics.run_id,
+            metrics=metrics,
+            gauges=ctx.metrics.gauges(),
+        )
+
+    def run_once(
+        self,
+        symbols: list[str] | None = None,
+        equity: float = 1_000_000.0,
+        full_refresh: bool = False,
+    ) -> RunResult:
         target_symbols = symbols or self._default_symbols()
         if not target_symbols:
             raise ValueError("No symbols provided and watchlist is empty.")
 
-        tz = ZoneInfo(self.config.timezone)
-        today = datetime.now(tz).date()
-        start, end = self._date_range(lookback_days=120)
+        ctx = self._start_run(target_symbols, equity, full_refresh=full_refresh)
+        scans = list(self._iter_scans(target_symbols, ctx))
+        self._persist_scans(scans, ctx)
+        return self._complete_run(ctx, target_symbols, scans)
 
-        risk_state = self._build_risk_state(equity=equity, today=today)
-        self.store.save_risk_state(risk_state)
-        self.store.log_event("run_once_start", {"symbols": target_symbols, "date": today.isoformat()})
+    def _persist_scans(self, scans: list[SymbolScan], ctx: RunContext, save_news: bool = True) -> None:
+        """Write a batch of scans and their signals in one transaction."""
+        with self.store.transaction():
+            for scan in scans:
+                self._record_scan(scan, ctx, save_news=save_news)
+            self._save_signals(scans, ctx)
 
-        all_signals: list[TradeSignal] = []
-        alerts_sent = 0
+    def _save_signals(self, scans: list[SymbolScan], ctx: RunContext) -> None:
+        """Persist freshly built signals and their input fingerprints; reused ones are skipped."""
+        fresh = [scan for scan in scans if not scan.reused]
+        with ctx.metrics.timer("store.save_signals", "sqlite"):
+            self.store.save_signals([scan.signal for scan in fresh])
+        if ctx.fingerprints is not None:
+            with ctx.metrics.timer("store.save_signal_fingerprints", "sqlite"):
+                self.store.save_signal_fingerprints(
+                    [(scan.symbol, scan.fingerprint, scan.signal) for scan in fresh if scan.fingerprint]
+                )
 
-        for symbol in target_symbols:
-            low_confidence_reason: str | None = None
-            bars = []
-            news = []
-            announcements = []
+    def _complete_run(self, ctx: RunContext, target_symbols: list[str], scans: list[SymbolScan]) -> RunResult:
+        """Alert and report on scans that ``_persist_scans`` already saved."""
+        alerts_sent = self._send_alerts([scan.signal for scan in scans if not scan.reused], ctx)
+        return self._finish_run(ctx, target_symbols, [scan.signal for scan in scans], alerts_sent)
 
-            try:
-                bars = self.market.get_kline(symbol=symbol, start=start, end=end)
-            except Exception as err:  # noqa: BLE001
-                low_confidence_reason = f"行情获取失败: {err}"
-                self.store.log_event("market_error", {"symbol": symbol, "error": str(err)})
+    def _calendar(self, today: date) -> TradingCalendar | None:
+        """The market's trading calendar, or ``None`` when it has no usable one."""
+        calendar = getattr(self.market, "trading_calendar", None)
+        if calendar is None:
+            return None
+        try:
+            return calendar(today=today)
+        except Exception:  # noqa: BLE001
+            return None
 
+    def _intraday_scan(
+        self,
+        symbol: str,
+        ctx: RunContext,
+        quote: RealtimeQuote | None,
+        last_session: date | None = None,
+        trading_day: bool = True,
+    ) -> SymbolScan:
+        scan = SymbolScan(symbol=symbol)
+        cached = (ctx.cached_bars or {}).get(symbol) or []
+        # No local history yet, or it stops before the last session: pull the missing K-lines first.
+        if not cached or (last_session is not None and cached[-1].ts.date() < last_session):
             try:
-                news = self.serper.get_news(symbol=symbol, since_hours=48)
+                cached, scan.new_bars = self._load_bars(symbol, ctx)
             except Exception as err:  # noqa: BLE001
-                low_confidence_reason = f"新闻获取失败: {err}"
-                self.store.log_event("news_error", {"symbol": symbol, "error": str(err)})
+                scan.fail("market_error", f"行情获取失败: {err}", err)
+
+        today_bar = None
+        if trading_day and quote is not None and cached:
+            ts = datetime.combine(ctx.today, datetime.min.time())
+            today_bar = quote.to_bar(ts, source=cached[-1].source)
+        if today_bar is not None:
+            # Scan-only: an unfinished bar is never saved as today's daily bar; the close run stores the real one.
+            scan.bars = [bar for bar in cached if bar.ts.date() < ctx.today] + [today_bar]
+        else:
+            scan.bars = list(cached)
+            if cached and trading_day and quote is None:
+                scan.low_confidence_reason = "实时行情缺失，使用最近收盘数据"
+
+        now = self._now().astimezone(timezone.utc)
+        with ctx.metrics.timer("store.get_news_items", "sqlite"):
+            recent = self.store.get_news_items(symbol, since=now - timedelta(hours=48))
+            if ctx.announcements is None:
+                week = self.store.get_news_items(symbol, since=now - timedelta(days=7))
+                scan.announcements = [item for item in week if item.source == "cninfo"]
+        scan.news = [item for item in recent if item.source != "cninfo"]
+        if ctx.announcements is not None:
+            scan.announcements = ctx.announcements.get(symbol, [])
+        return scan
+
+    def run_intraday(self, symbols: list[str] | None = None, equity: float = 1_000_000.0) -> RunResult:
+        """Intraday refresh from one market-wide spot snapshot.
+
+        Today's partial bar from ``get_realtime_quotes`` is patched onto the
+        stored daily history for the scan only, and news/announcements come
+        from the store, so a refresh costs one upstream request instead of
+        three per symbol. On a non-trading day no snapshot is taken and the
+        signals are rebuilt from the last session's close.
+        """
+        target_symbols = symbols or self._default_symbols()
+        if not target_symbols:
+            raise ValueError("No symbols provided and watchlist is empty.")
 
+        ctx = self._start_run(target_symbols, equity, preload_bars=True)
+        calendar = self._calendar(ctx.today)
+        # Without a calendar every day is treated as a session, as before.
+        trading_day = calendar is None or calendar.is_trading_day(ctx.today)
+        last_session = None if calendar is None else calendar.prev_trading_day(ctx.today)
+
+        quotes: dict[str, RealtimeQuote] = {}
+        snapshot_error: str | None = None
+        if trading_day:
             try:
-                announcements = self.announcements.get_announcements(symbol=symbol, since_days=7)
+                quotes = self._call_source(ctx, "akshare", self.market.get_realtime_quotes, symbols=target_symbols)
             except Exception as err:  # noqa: BLE001
-                low_confidence_reason = f"公告获取失败: {err}"
-                self.store.log_event("announcement_error", {"symbol": symbol, "error": str(err)})
+                snapshot_error = f"实时行情获取失败: {err}"
+                self.store.log_event("market_error", {"symbols": target_symbols, "error": str(err)})
 
-            if bars:
-                self.store.save_market_bars(bars)
-            if news or announcements:
-                self.store.save_news_items(news + announcements)
+        scans: list[SymbolScan] = []
+        for symbol in target_symbols:
+            scan = self._intraday_scan(symbol, ctx, quotes.get(symbol), last_session, trading_day)
+            if snapshot_error:
+                scan.low_confidence_reason = snapshot_error
+            scan.signal = self._build_signal(scan, ctx)
 
-            signal = build_trade_signal(
-                symbol=symbol,
-                bars=bars,
-                news_items=news,
-                announcements=announcements,
-                config=self.config,
-                risk_state=risk_state,
-                equity=equity,
-                ts=datetime.now(tz),
-            )
-            if low_confidence_reason:
-                signal.low_confidence = True
-                signal.reasons.append(low_confidence_reason)
+            scans.append(scan)
 
-            all_signals.append(signal)
+        # News and announcements were read back from the store; only refetched K-line tails are new.
+        self._persist_scans(scans, ctx, save_news=False)
+        return self._complete_run(ctx, target_symbols, scans)
 
-        self.store.save_signals(all_signals)
+    def iter_run(
+        self,
+        symbols: list[str] | None = None,
+        equity: float = 1_000_000.0,
+        full_refresh: bool = False,
+    ) -> Generator[TradeSignal, None, RunResult]:
+        """Streaming ``run_once``: yield each signal as soon as its symbol finishes.
 
-        for signal in all_signals:
-            if self._maybe_send_alert(signal):
-                alerts_sent += 1
+        Scans and signals are persisted in one transaction every
+        ``scan.signal_batch_size`` symbols (and before any alert, so the
+        alert's signal id resolves), alerts go out immediately (or as one
+        digest at the end) and the report files are appended as the run
+        progresses. The returned ``RunResult`` does not retain the signals.
+        """
+        target_symbols = symbols or self._default_symbols()
+        if not target_symbols:
+            raise ValueError("No symbols provided and watchlist is empty.")
 
-        out_dir = ensure_daily_dir(self.config.results_dir, today)
-        json_file = write_signals_json(out_dir, all_signals)
-        md_file = write_daily_markdown(out_dir, today, all_signals, risk_state)
+        ctx = self._start_run(target_symbols, equity, full_refresh=full_refresh)
+        batch_size = max(1, self.config.scan.signal_batch_size)
+        writer = DailyReportWriter(
+            ensure_daily_dir(self.config.results_dir, ctx.today), ctx.today, ctx.risk_state
+        )
 
-        self.store.log_event(
-            "run_once_end",
-            {
-                "date": today.isoformat(),
-                "signals": len(all_signals),
-                "alerts_sent": alerts_sent,
-                "output": str(out_dir),
-            },
+        pending: list[SymbolScan] = []
+        digest: list[TradeSignal] = []
+        alerts_sent = 0
+        try:
+            for scan in self._iter_scans_as_completed(target_symbols, ctx):
+                signal = scan.signal
+                pending.append(scan)
+                actionable = not scan.reused and self._format_alert(signal) is not None
+                send_now = actionable and self.config.alerts.mode != "digest"
+                if send_now or len(pending) >= batch_size:
+                    self._persist_scans(pending, ctx)
+                    pending = []
+                if actionable and not send_now:
+                    digest.append(signal)
+                elif send_now and self._maybe_send_alert(signal, ctx):
+                    alerts_sent += 1
+                with ctx.metrics.timer("report.append"):
+                    writer.add(signal)
+                yield signal
+            self._persist_scans(pending, ctx)
+            alerts_sent += self._send_alerts(digest, ctx)
+        except BaseException:
+            writer.discard()
+            raise
+
+        return self._finish_run(
+            ctx,
+            target_symbols,
+            [],
+            alerts_sent,
+            outputs=self._close_writer(writer, ctx),
+            signal_count=writer.count,
         )
 
-        return RunResult(
-            date=today,
-            symbols=target_symbols,
-            signals=all_signals,
-            risk_state=risk_state,
-            output_markdown=str(md_file),
-            output_json=str(json_file),
-            alerts_sent=alerts_sent,
+    def _close_writer(self, writer: DailyReportWriter, ctx: RunContext) -> tuple[Path, Path]:
+        with ctx.metrics.timer("report.close"):
+            return writer.close()
+
+    def _shard_config(self, processes: int) -> AppConfig:
+        # Split the per-source budgets so the whole pool keeps the configured totals.
+        scan = self.config.scan
+        rate_limit = self.config.rate_limit
+        return self.config.model_copy(
+            update={
+                "scan": scan.model_copy(
+                    update={
+                        "max_workers": max(1, scan.max_workers // processes),
+                        "akshare_concurrency": max(1, scan.akshare_concurrency // processes),
+                        "serper_concurrency": max(1, scan.serper_concurrency // processes),
+                    }
+                ),
+                "rate_limit": rate_limit.model_copy(
+                    update={
+                        source: limits.model_copy(
+                            update={
+                                "rate": limits.rate / processes,
+                                "min_rate": limits.min_rate / processes,
+                                "max_rate": limits.max_rate / processes,
+                                "burst": max(1, limits.burst // processes),
+                            }
+                        )
+                        for source, limits in (("akshare", rate_limit.akshare), ("serper", rate_limit.serper))
+                    }
+                ),
+            }
         )
 
+    def run_sharded(
+        self,
+        symbols: list[str] | None = None,
+        equity: float = 1_000_000.0,
+        processes: int | None = None,
+        full_refresh: bool = False,
+        components: ShardComponents = default_shard_components,
+    ) -> RunResult:
+        """Scan shards of the symbol list in a process pool and merge the results here.
+
+        Each worker builds its own connectors through ``components`` (which
+        must be picklable) and runs the fetch + signal pipeline for its shard.
+        The parent does all store writes in one batch and writes one report.
+        """
+        if self.archive is not None:
+            raise ValueError("record/replay runs are single-process; drop --processes.")
+        target_symbols = symbols or self._default_symbols()
+        if not target_symbols:
+            raise ValueError("No symbols provided and watchlist is empty.")
+
+        processes = max(1, processes or self.config.scan.processes or os.cpu_count() or 1)
+        shards = split_shards(target_symbols, processes)
+        ctx = self._start_run(target_symbols, equity, full_refresh=full_refresh)
+        shard_config = self._shard_config(len(shards))
+        tasks = [
+            ShardTask(
+                config=shard_config,
+                symbols=shard,
+                ctx=shard_context(ctx, shard),
+                components=components,
+            )
+            for shard in shards
+        ]
+
+        scans: list[SymbolScan] = []
+        with ctx.metrics.timer("shard.scan"):
+            with ProcessPoolExecutor(
+                max_workers=len(tasks), mp_context=multiprocessing.get_context("spawn")
+            ) as pool:
+                for shard_scans, shard_metrics in pool.map(scan_shard, tasks):
+                    scans.extend(shard_scans)
+                    ctx.metrics.merge(shard_metrics)
+
+        fresh = [scan for scan in scans if not scan.reused]
+        new_bars = [bar for scan in fresh for bar in scan.new_bars]
+        news = [item for scan in fresh for item in self._news_to_save(scan, ctx)]
+        with self.store.transaction():
+            for scan in scans:
+                for event, error in scan.errors:
+                    self.store.log_event(event, {"symbol": scan.symbol, "error": error})
+            if new_bars:
+                with ctx.metrics.timer("store.save_market_bars", "sqlite"):
+                    self.store.save_market_bars(new_bars)
+            if news:
+                with ctx.metrics.timer("store.save_news_items", "sqlite"):
+                    self.store.save_news_items(news)
+            self._save_signals(scans, ctx)
+
+        return self._complete_run(ctx, target_symbols, scans)
+
+    def screen_market(self, top_n: int | None = None) -> list[str]:
+        frame = self._call_source(None, "akshare", self.market.get_spot_frame)
+        shortlist = screen_universe(frame, self.config.screen, top_n=top_n)
+        symbols = shortlist["symbol"].tolist()
+        self.store.log_event(
+            "market_screen",
+            {"universe": int(len(frame)), "shortlist": symbols},
+        )
+        return symbols
+
+    def run_market_scan(
+        self,
+        equity: float = 1_000_000.0,
+        top_n: int | None = None,
+        full_refresh: bool = False,
+    ) -> RunResult:
+        """Screen the whole A-share spot snapshot, then deep-scan the ranked shortlist."""
+        symbols = self.screen_market(top_n=top_n)
+        if not symbols:
+            raise ValueError("Market screen returned no candidates.")
+        return self.run_once(symbols=symbols, equity=equity, full_refresh=full_refresh)
+
     def get_daily_signals(self, day: date):
         return self.store.get_signals_by_date(day)
+
+    def get_signals_between(self, start: date | None = None, end: date | None = None, symbol: str | None = None):
+        return self.store.get_signals_between(start, end, symbol=symbol)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any
+
+from agent_search.config import RetentionConfig
+from agent_search.storage import SQLiteStore
+from agent_search.storage.sqlite_store import VACUUM_MODES
+
+
+def run_maintenance(
+    store: SQLiteStore,
+    retention: RetentionConfig,
+    today: date,
+    vacuum: str = "incremental",
+) -> dict[str, Any]:
+    """Roll up and prune per the retention policy, then vacuum and ANALYZE.
+
+    ``vacuum`` is ``incremental``, ``full`` or ``none``; ``today`` is the UTC
+    day, matching ``audit_logs.ts``. Returns what was removed and the bytes
+    reclaimed on disk.
+    """
+    if vacuum not in VACUUM_MODES:
+        raise ValueError(f"unsupported vacuum mode: {vacuum}")
+    store.flush_events()
+    size_before = store.file_size()
+    report: dict[str, Any] = {"audit_rollup_rows": store.rollup_audit_logs(today), "deleted": {}}
+    if retention.audit_days > 0:
+        report["deleted"]["audit_logs"] = store.prune_audit_logs(today - timedelta(days=retention.audit_days))
+    if retention.news_days > 0:
+        report["deleted"].update(store.prune_news(today - timedelta(days=retention.news_days)))
+    report["vacuum"] = store.compact(vacuum)
+    report["bytes_before"] = size_before
+    report["bytes_after"] = store.file_size()
+    report["reclaimed_bytes"] = size_before - report["bytes_after"]
+    return report
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Iterator
+from uuid import uuid4
+
+from agent_search.models import StageMetrics
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class RunMetrics:
+    """Thread-safe wall-clock timers and call counters for one run."""
+
+    def __init__(self, run_id: str | None = None) -> None:
+        self.run_id = run_id or uuid4().hex
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+        self._samples: dict[tuple[str, str], list[float]] = defaultdict(list)
+        self._errors: dict[tuple[str, str], int] = defaultdict(int)
+        self._gauges: dict[str, float] = {}
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def merge(self, other: RunMetrics) -> None:
+        """Fold another recorder's raw samples in, e.g. from a shard worker process."""
+        with other._lock:
+            samples = {key: list(values) for key, values in other._samples.items()}
+            errors = dict(other._errors)
+            gauges = dict(other._gauges)
+        with self._lock:
+            for key, values in samples.items():
+                self._samples[key].extend(values)
+            for key, count in errors.items():
+                self._errors[key] += count
+            # Shards each run their own limiter, so their rates add up.
+            for name, value in gauges.items():
+                self._gauges[name] = self._gauges.get(name, 0.0) + value
+
+    def record(self, stage: str, seconds: float, source: str = "", error: bool = False) -> None:
+        key = (stage, source)
+        with self._lock:
+            self._samples[key].append(seconds)
+            if error:
+                self._errors[key] += 1
+
+    def gauge(self, name: str, value: float) -> None:
+        """Set a point-in-time value, e.g. a rate limiter's current rate."""
+        with self._lock:
+            self._gauges[name] = value
+
+    def gauges(self) -> dict[str, float]:
+        with self._lock:
+            return dict(sorted(self._gauges.items()))
+
+    @contextmanager
+    def timer(self, stage: str, source: str = "") -> Iterator[None]:
+        started = time.perf_counter()
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            self.record(stage, time.perf_counter() - started, source=source, error=failed)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def summary(self) -> list[StageMetrics]:
+        with self._lock:
+            items = [(key, sorted(values), self._errors.get(key, 0)) for key, values in self._samples.items()]
+
+        output: list[StageMetrics] = []
+        for (stage, source), values, errors in sorted(items, key=lambda item: item[0]):
+            output.append(
+                StageMetrics(
+                    stage=stage,
+                    source=source,
+                    count=len(values),
+                    errors=errors,
+                    total_ms=round(sum(values) * 1000.0, 3),
+                    p50_ms=round(percentile(values, 50) * 1000.0, 3),
+                    p95_ms=round(percentile(values, 95) * 1000.0, 3),
+                    max_ms=round(values[-1] * 1000.0, 3),
+                )
+            )
+        return output
@@ -68,6 +68,19 @@ class RiskState(BaseModel):
     allow_new_buy: bool = True
 
 
+class StageMetrics(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    stage: str
+    source: str = ""
+    count: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    max_ms: float = 0.0
+
+
 class RunResult(BaseModel):
     model_config = ConfigDict(extra="ignore")
 
@@ -78,6 +91,9 @@ class RunResult(BaseModel):
     output_markdown: str
     output_json: str
     alerts_sent: int = 0
+    run_id: str = ""
+    metrics: list[StageMetrics] = Field(default_factory=list)
+    gauges: dict[str, float] = Field(default_factory=dict)
 
 
 class BacktestResult(BaseModel):
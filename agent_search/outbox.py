@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable
+
+from agent_search.connectors.ratelimit import AdaptiveRateLimiter
+from agent_search.storage import SQLiteStore
+
+MAX_RETRY_DELAY_SECONDS = 600.0
+
+
+class AlertOutboxWorker:
+    """Delivers alerts queued in the ``alert_outbox`` table from a background thread.
+
+    Rows are claimed one at a time, so a lease only ever covers a single
+    paced send however far the limiter backs off. Each row is then marked
+    sent or rescheduled with exponential backoff, so queued alerts survive
+    a restart and a delivered alert is never picked up again. A crash
+    between the webhook call and ``mark_alert_sent`` leaves the lease to
+    expire and that one message may then repeat.
+
+    ``stop`` spends up to ``drain_seconds`` delivering what is already due
+    and always waits for the thread, so the store can be closed afterwards;
+    anything left stays queued for the next worker.
+
+    Pass ``store`` to share the caller's (thread-safe) store; otherwise the
+    worker thread opens its own on ``db_path``.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        notifier: Any,
+        poll_seconds: float = 2.0,
+        max_attempts: int = 8,
+        backoff_seconds: float = 5.0,
+        lease_seconds: float = 120.0,
+        drain_seconds: float = 30.0,
+        limiter: AdaptiveRateLimiter | None = None,
+        store: SQLiteStore | None = None,
+    ) -> None:
+        self.db_path = str(db_path)
+        self.store = store
+        self.notifier = notifier
+        self.poll_seconds = poll_seconds
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_seconds = backoff_seconds
+        self.lease_seconds = lease_seconds
+        self.drain_seconds = drain_seconds
+        self.limiter = limiter
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _deliver(self, alert: dict[str, Any]) -> dict[str, Any]:
+        if self.limiter is not None:
+            self.limiter.acquire()
+        try:
+            if alert["kind"] == "markdown":
+                return self.notifier.send_markdown(content=alert["content"])
+            return self.notifier.send_text(content=alert["content"])
+        except Exception as err:  # noqa: BLE001
+            return {"ok": False, "error": str(err)}
+
+    def _retry_at(self, attempts: int) -> datetime | None:
+        if attempts >= self.max_attempts:
+            return None
+        delay = min(MAX_RETRY_DELAY_SECONDS, self.backoff_seconds * (2 ** (attempts - 1)))
+        return datetime.utcnow() + timedelta(seconds=delay)
+
+    def drain_once(self, store: SQLiteStore, deadline: float | None = None) -> int:
+        """Send alerts that are due until none are left, one fails or ``deadline`` (monotonic) passes.
+
+        Returns how many were delivered.
+        """
+        return self._drain(store, lambda: deadline is None or time.monotonic() < deadline)
+
+    def _drain(self, store: SQLiteStore, keep_going: Callable[[], bool]) -> int:
+        delivered = 0
+        while keep_going():
+            alerts = store.claim_alerts(limit=1, lease_seconds=self.lease_seconds)
+            if not alerts:
+                break
+            alert = alerts[0]
+            result = self._deliver(alert)
+            if result.get("ok"):
+                store.mark_alert_sent(alert["id"])
+                delivered += 1
+            else:
+                store.mark_alert_failed(
+                    alert["id"], str(result.get("error", "unknown error")), self._retry_at(alert["attempts"])
+                )
+            store.log_event(
+                "wecom_outbox",
+                {"outbox_id": alert["id"], "signal_ids": alert["signal_ids"], "result": result},
+            )
+            if not result.get("ok"):
+                break  # the webhook is failing; leave the rest for the next poll
+        return delivered
+
+    def notify(self) -> None:
+        """Wake the worker early, e.g. right after a run queued new alerts."""
+        self._wake.set()
+
+    def _run(self) -> None:
+        store = self.store or SQLiteStore(self.db_path)
+        try:
+            while not self._stop.is_set():
+                try:
+                    # Yield to the bounded final pass as soon as stop() is called.
+                    self._drain(store, lambda: not self._stop.is_set())
+                except sqlite3.OperationalError:
+                    pass  # e.g. a long write transaction holds the lock; retry on the next poll
+                self._wake.wait(self.poll_seconds)
+                self._wake.clear()
+            # Final pass so alerts queued by the last run go out before exit, within the drain budget.
+            self.drain_once(store, deadline=time.monotonic() + self.drain_seconds)
+        finally:
+            if store is not self.store:
+                store.close()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="alert-outbox", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        # No join timeout: the drain is bounded by drain_seconds plus one send, and the caller
+        # may close the shared store right after this returns.
+        self._thread.join()
+        self._thread = None
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import json
+import os
+import textwrap
 from datetime import date
 from pathlib import Path
 
-from agent_search.models import RiskState, TradeSignal
+from agent_search.models import RiskState, SignalAction, TradeSignal
 
 
 def ensure_daily_dir(results_dir: str | Path, day: date) -> Path:
@@ -13,6 +15,13 @@ def ensure_daily_dir(results_dir: str | Path, day: date) -> Path:
     return out_dir
 
 
+def _signal_json_block(signal: TradeSignal) -> str:
+    return textwrap.indent(
+        json.dumps(signal.model_dump(mode="json"), ensure_ascii=False, indent=2),
+        "  ",
+    )
+
+
 def write_signals_json(output_dir: Path, signals: list[TradeSignal]) -> Path:
     payload = [signal.model_dump(mode="json") for signal in signals]
     output_file = output_dir / "signals.json"
@@ -23,12 +32,7 @@ def write_signals_json(output_dir: Path, signals: list[TradeSignal]) -> Path:
     return output_file
 
 
-def write_daily_markdown(
-    output_dir: Path,
-    day: date,
-    signals: list[TradeSignal],
-    risk_state: RiskState,
-) -> Path:
+def _markdown_header_lines(day: date, risk_state: RiskState) -> list[str]:
     lines: list[str] = []
     lines.append(f"# A股波段信号日报 {day.isoformat()}")
     lines.append("")
@@ -41,34 +45,143 @@ def write_daily_markdown(
     lines.append("")
     lines.append("## 交易信号")
     lines.append("")
+    return lines
+
+
+def _markdown_signal_lines(signal: TradeSignal) -> list[str]:
+    lines: list[str] = []
+    lines.append(f"### {signal.symbol} - {signal.action}")
+    lines.append("")
+    lines.append(f"- 分数: {signal.score:.2f}")
+    lines.append(f"- 置信度: {signal.confidence:.2f}")
+    if signal.entry is not None:
+        lines.append(f"- 入场参考: {signal.entry:.2f}")
+    if signal.stop_loss is not None:
+        lines.append(f"- 止损参考: {signal.stop_loss:.2f}")
+    if signal.take_profit is not None:
+        lines.append(f"- 止盈参考: {signal.take_profit:.2f}")
+    lines.append(f"- 建议仓位占比: {signal.position_size_pct:.2%}")
+    lines.append(f"- 低置信度标记: {'是' if signal.low_confidence else '否'}")
+    lines.append("- 原因:")
+    for reason in signal.reasons[:8]:
+        lines.append(f"  - {reason}")
+    lines.append("- 证据链接:")
+    if signal.evidence_urls:
+        for url in signal.evidence_urls:
+            lines.append(f"  - {url}")
+    else:
+        lines.append("  - 无")
+    lines.append("")
+    return lines
+
+
+def write_daily_markdown(
+    output_dir: Path,
+    day: date,
+    signals: list[TradeSignal],
+    risk_state: RiskState,
+) -> Path:
+    lines = _markdown_header_lines(day, risk_state)
 
     if not signals:
         lines.append("- 今日无信号")
     else:
         for signal in signals:
-            lines.append(f"### {signal.symbol} - {signal.action}")
-            lines.append("")
-            lines.append(f"- 分数: {signal.score:.2f}")
-            lines.append(f"- 置信度: {signal.confidence:.2f}")
-            if signal.entry is not None:
-                lines.append(f"- 入场参考: {signal.entry:.2f}")
-            if signal.stop_loss is not None:
-                lines.append(f"- 止损参考: {signal.stop_loss:.2f}")
-            if signal.take_profit is not None:
-                lines.append(f"- 止盈参考: {signal.take_profit:.2f}")
-            lines.append(f"- 建议仓位占比: {signal.position_size_pct:.2%}")
-            lines.append(f"- 低置信度标记: {'是' if signal.low_confidence else '否'}")
-            lines.append("- 原因:")
-            for reason in signal.reasons[:8]:
-                lines.append(f"  - {reason}")
-            lines.append("- 证据链接:")
-            if signal.evidence_urls:
-                for url in signal.evidence_urls:
-                    lines.append(f"  - {url}")
-            else:
-                lines.append("  - 无")
-            lines.append("")
+            lines.extend(_markdown_signal_lines(signal))
 
     output_file = output_dir / "daily_report.md"
     output_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
     return output_file
+
+
+def _digest_block(signal: TradeSignal) -> str:
+    action = SignalAction(signal.action).value
+    color = "info" if action == SignalAction.BUY.value else "warning"
+    prices = " / ".join(
+        f"{label} {value:.2f}"
+        for label, value in (("入场", signal.entry), ("止损", signal.stop_loss), ("止盈", signal.take_profit))
+        if value is not None
+    )
+    lines = [
+        f"> **{signal.symbol}** <font color=\"{color}\">{action}</font> "
+        f"分数 {signal.score:.2f} · 置信度 {signal.confidence:.2f}",
+        f"> {prices or '无价格参考'} · 仓位 {signal.position_size_pct:.2%}",
+    ]
+    if signal.evidence_urls:
+        lines.append(f"> [证据]({signal.evidence_urls[0]})")
+    return "\n".join(lines)
+
+
+def _fit_bytes(text: str, max_bytes: int) -> str:
+    return text.encode("utf-8")[:max_bytes].decode("utf-8", errors="ignore")
+
+
+def build_alert_digests(
+    signals: list[TradeSignal], day: date, max_bytes: int = 4096
+) -> list[tuple[str, list[TradeSignal]]]:
+    """Pack signals into as few markdown messages as fit in ``max_bytes`` (UTF-8) each."""
+    if not signals:
+        return []
+    title = f"## A股信号汇总 {day.isoformat()}"
+    # Room for the " (12/34)" part counter added once the number of messages is known.
+    budget = max_bytes - len(title.encode("utf-8")) - 16
+
+    chunks: list[tuple[list[str], list[TradeSignal]]] = []
+    used = budget
+    for signal in signals:
+        block = _fit_bytes(_digest_block(signal), budget - 2)
+        size = len(block.encode("utf-8")) + 2
+        if used + size > budget:
+            chunks.append(([], []))
+            used = 0
+        chunks[-1][0].append(block)
+        chunks[-1][1].append(signal)
+        used += size
+
+    messages: list[tuple[str, list[TradeSignal]]] = []
+    for index, (blocks, batch) in enumerate(chunks, start=1):
+        header = title if len(chunks) == 1 else f"{title} ({index}/{len(chunks)})"
+        messages.append(("\n\n".join([header, *blocks]), batch))
+    return messages
+
+
+class DailyReportWriter:
+    """Incrementally writes signals.json and daily_report.md.
+
+    Signals are appended as they arrive so nothing is held in memory; the
+    files are staged under a ``.partial`` suffix and moved into place by
+    ``close`` with the same content ``write_signals_json`` and
+    ``write_daily_markdown`` would produce.
+    """
+
+    def __init__(self, output_dir: Path, day: date, risk_state: RiskState) -> None:
+        self.json_file = output_dir / "signals.json"
+        self.markdown_file = output_dir / "daily_report.md"
+        self._json_tmp = self.json_file.with_name(self.json_file.name + ".partial")
+        self._markdown_tmp = self.markdown_file.with_name(self.markdown_file.name + ".partial")
+        self._json = self._json_tmp.open("w", encoding="utf-8")
+        self._markdown = self._markdown_tmp.open("w", encoding="utf-8")
+        self._markdown.write("\n".join(_markdown_header_lines(day, risk_state)) + "\n")
+        self.count = 0
+
+    def add(self, signal: TradeSignal) -> None:
+        self._json.write("[\n" if self.count == 0 else ",\n")
+        self._json.write(_signal_json_block(signal))
+        self._markdown.write("\n".join(_markdown_signal_lines(signal)) + "\n")
+        self.count += 1
+
+    def close(self) -> tuple[Path, Path]:
+        self._json.write("\n]" if self.count else "[]")
+        if not self.count:
+            self._markdown.write("- 今日无信号\n")
+        self._json.close()
+        self._markdown.close()
+        os.replace(self._json_tmp, self.json_file)
+        os.replace(self._markdown_tmp, self.markdown_file)
+        return self.json_file, self.markdown_file
+
+    def discard(self) -> None:
+        self._json.close()
+        self._markdown.close()
+        self._json_tmp.unlink(missing_ok=True)
+        self._markdown_tmp.unlink(missing_ok=True)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import time
-from datetime import datetime
+from datetime import date, datetime
 from zoneinfo import ZoneInfo
 
 from agent_search.engine import TradingResearchAgent
@@ -23,6 +23,12 @@ class AgentScheduler:
         self._last_run[slot_name] = minute_key
         return True
 
+    def _is_trading_day(self, day: date) -> bool:
+        try:
+            return self.agent.market.trading_calendar(today=day).is_trading_day(day)
+        except Exception:  # noqa: BLE001
+            return day.weekday() < 5
+
     @staticmethod
     def _in_intraday_window(now: datetime) -> bool:
         hhmm = now.strftime("%H:%M")
@@ -39,6 +45,9 @@ class AgentScheduler:
             now = datetime.now(self.tz)
             hhmm = now.strftime("%H:%M")
             minute_key = now.strftime("%Y-%m-%d %H:%M")
+            if not self._is_trading_day(now.date()):
+                time.sleep(20)
+                continue
 
             if hhmm == pre_open and self._should_run_slot("pre_open", minute_key):
                 self.agent.run_once(equity=equity)
@@ -48,6 +57,9 @@ class AgentScheduler:
 
             if self._in_intraday_window(now) and now.minute % interval == 0:
                 if self._should_run_slot("intraday", minute_key):
-                    self.agent.run_once(equity=equity)
+                    if self.agent.config.schedule.intraday_mode == "snapshot":
+                        self.agent.run_intraday(equity=equity)
+                    else:
+                        self.agent.run_once(equity=equity)
 
             time.sleep(20)
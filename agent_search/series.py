@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Sequence
+
+import numpy as np
+
+from agent_search.models import MarketBar
+
+PRICE_FIELDS = ("open", "high", "low", "close", "volume", "amount")
+
+HIST_COLUMNS = {
+    "日期": "ts",
+    "开盘": "open",
+    "最高": "high",
+    "最低": "low",
+    "收盘": "close",
+    "成交量": "volume",
+    "成交额": "amount",
+}
+
+
+@dataclass
+class BarSeries:
+    """Columnar daily bars for one symbol: ``ts`` is ``datetime64[us]``, the rest are float64.
+
+    Slicing returns views, so backtests can walk expanding windows without
+    copying. Use ``to_bars`` when ``MarketBar`` objects are needed.
+    """
+
+    symbol: str
+    ts: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    amount: np.ndarray
+    source: str = "akshare"
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    def __getitem__(self, index: slice) -> BarSeries:
+        if not isinstance(index, slice):
+            raise TypeError("BarSeries only supports slicing; use to_bars() for single bars")
+        return BarSeries(
+            symbol=self.symbol,
+            ts=self.ts[index],
+            source=self.source,
+            **{name: getattr(self, name)[index] for name in PRICE_FIELDS},
+        )
+
+    @classmethod
+    def empty(cls, symbol: str, source: str = "akshare") -> BarSeries:
+        return cls(
+            symbol=symbol,
+            ts=np.array([], dtype="datetime64[us]"),
+            source=source,
+            **{name: np.array([], dtype=float) for name in PRICE_FIELDS},
+        )
+
+    @classmethod
+    def from_frame(cls, symbol: str, frame: Any, source: str = "akshare") -> BarSeries:
+        """Bulk-convert an AkShare ``stock_zh_a_hist`` frame (Chinese column names)."""
+        import pandas as pd  # type: ignore
+
+        if frame is None or frame.empty:
+            return cls.empty(symbol, source)
+        frame = frame.rename(columns=HIST_COLUMNS)
+        ts = pd.to_datetime(frame["ts"]).to_numpy(dtype="datetime64[us]")
+        columns = {
+            name: pd.to_numeric(frame[name], errors="coerce").fillna(0.0).to_numpy(dtype=float)
+            if name in frame.columns
+            else np.zeros(len(frame))
+            for name in PRICE_FIELDS
+        }
+        series = cls(symbol=symbol, ts=ts, source=source, **columns)
+        return series.sorted()
+
+    @classmethod
+    def from_bars(cls, bars: Sequence[MarketBar], symbol: str = "") -> BarSeries:
+        if not bars:
+            return cls.empty(symbol)
+        return cls(
+            symbol=bars[0].symbol,
+            ts=np.array([bar.ts.replace(tzinfo=None) for bar in bars], dtype="datetime64[us]"),
+            source=bars[0].source,
+            **{
+                name: np.fromiter((getattr(bar, name) for bar in bars), dtype=float, count=len(bars))
+                for name in PRICE_FIELDS
+            },
+        )
+
+    @classmethod
+    def coerce(cls, bars: BarSeries | Sequence[MarketBar], symbol: str = "") -> BarSeries:
+        return bars if isinstance(bars, BarSeries) else cls.from_bars(bars, symbol)
+
+    def sorted(self) -> BarSeries:
+        if len(self.ts) < 2 or bool(np.all(self.ts[1:] >= self.ts[:-1])):
+            return self
+        order = np.argsort(self.ts, kind="stable")
+        return BarSeries(
+            symbol=self.symbol,
+            ts=self.ts[order],
+            source=self.source,
+            **{name: getattr(self, name)[order] for name in PRICE_FIELDS},
+        )
+
+    def timestamps(self) -> list[datetime]:
+        return self.ts.astype("datetime64[us]").tolist()
+
+    def to_bars(self) -> list[MarketBar]:
+        columns = [getattr(self, name).tolist() for name in PRICE_FIELDS]
+        return [
+            MarketBar(
+                symbol=self.symbol,
+                ts=ts,
+                open=open_,
+                high=high,
+                low=low,
+                close=close,
+                volume=volume,
+                amount=amount,
+                source=self.source,
+            )
+            for ts, open_, high, low, close, volume, amount in zip(self.timestamps(), *columns)
+        ]
@@ -1,3 +1,5 @@
+from .bar_archive import BarArchive
+from .search_cache import SearchCache
 from .sqlite_store import SQLiteStore
 
-__all__ = ["SQLiteStore"]
+__all__ = ["BarArchive", "SQLiteStore", "SearchCache"]
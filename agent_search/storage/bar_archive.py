@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from agent_search.series import PRICE_FIELDS, BarSeries
+from agent_search.storage.sqlite_store import SQLiteStore
+
+MANIFEST_NAME = "manifest.json"
+
+
+class BarArchive:
+    """Daily bars exported from ``market_bars`` into one memory-mapped ``.npy`` file per symbol.
+
+    Each file holds a ``(7, n)`` int64 matrix: row 0 is ``ts`` in
+    microseconds, rows 1-6 are the float64 bit patterns of ``PRICE_FIELDS``.
+    Reads map the file and slice it with ``searchsorted``, so every
+    ``BarSeries`` column is a view into the page cache and no per-row Python
+    objects are built. ``sync`` is the export/compaction step that keeps the
+    archive in line with SQLite.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.root / MANIFEST_NAME
+        self.manifest: dict[str, dict[str, Any]] = (
+            json.loads(self.manifest_path.read_text(encoding="utf-8")) if self.manifest_path.exists() else {}
+        )
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.manifest
+
+    def _path(self, symbol: str) -> Path:
+        return self.root / f"{symbol}.npy"
+
+    def _write_manifest(self) -> None:
+        partial_path = self.manifest_path.with_name(MANIFEST_NAME + ".partial")
+        partial_path.write_text(json.dumps(self.manifest, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+        os.replace(partial_path, self.manifest_path)
+
+    def _write(self, series: BarSeries, fingerprint: list[Any] | None = None) -> int:
+        series = series.sorted()
+        if len(series) > 1:
+            # Same day from several sources: keep the last row, like a read of market_bars would.
+            keep = np.append(series.ts[1:] != series.ts[:-1], True)
+            series = BarSeries(
+                symbol=series.symbol,
+                ts=series.ts[keep],
+                source=series.source,
+                **{name: getattr(series, name)[keep] for name in PRICE_FIELDS},
+            )
+        if not len(series):
+            self._remove(series.symbol)
+            return 0
+        data = np.empty((len(PRICE_FIELDS) + 1, len(series)), dtype=np.int64)
+        data[0] = series.ts.astype("datetime64[us]").view(np.int64)
+        for row, name in enumerate(PRICE_FIELDS, start=1):
+            data[row] = np.ascontiguousarray(getattr(series, name), dtype=np.float64).view(np.int64)
+        path = self._path(series.symbol)
+        partial_path = path.with_name(path.name + ".partial")
+        with partial_path.open("wb") as handle:
+            np.save(handle, data)
+        os.replace(partial_path, path)
+        self.manifest[series.symbol] = {"source": series.source, "rows": len(series), "fingerprint": fingerprint}
+        return len(series)
+
+    def _remove(self, symbol: str) -> None:
+        self._path(symbol).unlink(missing_ok=True)
+        self.manifest.pop(symbol, None)
+
+    def save(self, series: BarSeries) -> int:
+        """Replace one symbol's file; ``sync`` will rewrite it again on the next export."""
+        rows = self._write(series)
+        self._write_manifest()
+        return rows
+
+    def sync(self, store: SQLiteStore, symbols: list[str] | None = None, full: bool = False) -> dict[str, int]:
+        """Export symbols whose ``market_bars`` rows changed since the last sync.
+
+        Without ``symbols`` this also drops files for symbols no longer in
+        SQLite. ``full`` rewrites every file regardless of the fingerprints.
+        """
+        stats = store.get_market_bar_stats()
+        targets = list(stats) if symbols is None else [symbol for symbol in symbols if symbol in stats]
+        summary = {"written": 0, "unchanged": 0, "removed": 0, "rows": 0}
+        for symbol in targets:
+            fingerprint = list(stats[symbol])
+            entry = self.manifest.get(symbol)
+            if not full and entry and entry["fingerprint"] == fingerprint and self._path(symbol).exists():
+                summary["unchanged"] += 1
+                continue
+            summary["rows"] += self._write(store.get_bar_series(symbol, "", "9999-12-31"), fingerprint)
+            summary["written"] += 1
+        if symbols is None:
+            for symbol in [symbol for symbol in self.manifest if symbol not in stats]:
+                self._remove(symbol)
+                summary["removed"] += 1
+        self._write_manifest()
+        return summary
+
+    def get_bar_series(self, symbol: str, start: str, end: str) -> BarSeries:
+        entry = self.manifest.get(symbol)
+        path = self._path(symbol)
+        if entry is None or not path.exists():
+            return BarSeries.empty(symbol)
+        # asarray drops the memmap subclass but keeps the mapping alive through .base.
+        data = np.asarray(np.load(path, mmap_mode="r"))
+        ts = data[0].view("datetime64[us]")
+        lo = int(np.searchsorted(ts, np.datetime64(start or "1970-01-01", "us"), side="left"))
+        if len(end) == 10:
+            # Date-only bound: include every bar stamped on the end day.
+            hi = int(np.searchsorted(ts, np.datetime64(end, "D") + np.timedelta64(1, "D"), side="left"))
+        else:
+            hi = int(np.searchsorted(ts, np.datetime64(end, "us"), side="right"))
+        return BarSeries(
+            symbol=symbol,
+            ts=ts[lo:hi],
+            source=entry["source"],
+            **{name: data[row, lo:hi].view(np.float64) for row, name in enumerate(PRICE_FIELDS, start=1)},
+        )
+
+    def load(self, symbols: list[str], start: str, end: str) -> dict[str, BarSeries]:
+        return {symbol: self.get_bar_series(symbol, start, end) for symbol in symbols}
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+
+class SearchCache:
+    """Search responses kept in SQLite with per-kind TTLs and LRU eviction.
+
+    Uses its own connection (shared across threads behind a lock) so scan
+    workers can read it without going through ``SQLiteStore``. Hits only
+    note their access time in memory; those are written in one statement on
+    the next ``put`` (before eviction picks its victims), every
+    ``touch_batch_size`` hits, and on ``close``.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        ttls: dict[str, int] | None = None,
+        default_ttl: int = 3600,
+        stale_seconds: int = 3600,
+        max_entries: int = 5000,
+        clock: Callable[[], float] = time.time,
+        touch_batch_size: int = 256,
+    ) -> None:
+        self.ttls = ttls or {}
+        self.default_ttl = default_ttl
+        self.stale_seconds = stale_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self.touch_batch_size = max(1, touch_batch_size)
+        self._touched: dict[str, float] = {}
+        self._lock = threading.Lock()
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS search_cache (
+                key TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                query TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_search_cache_access ON search_cache(last_access);
+            """
+        )
+        self.conn.commit()
+
+    def ttl(self, kind: str) -> int:
+        return self.ttls.get(kind, self.default_ttl)
+
+    def lookup(self, key: str, kind: str) -> tuple[dict[str, Any], bool] | None:
+        """Return ``(payload, fresh)``, or ``None`` when missing or past the stale window."""
+        now = self._clock()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT payload, fetched_at FROM search_cache WHERE key=?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            age = now - row[1]
+            ttl = self.ttl(kind)
+            if age > ttl + self.stale_seconds:
+                return None
+            self._touched[key] = now
+            if len(self._touched) >= self.touch_batch_size:
+                self._write_touches()
+                self.conn.commit()
+        return json.loads(row[0]), age <= ttl
+
+    def _write_touches(self) -> None:
+        """Persist pending ``last_access`` updates; the caller holds the lock and commits."""
+        if self._touched:
+            touched, self._touched = self._touched, {}
+            self.conn.executemany(
+                "UPDATE search_cache SET last_access=? WHERE key=?", [(at, key) for key, at in touched.items()]
+            )
+
+    def put(self, key: str, kind: str, query: str, payload: dict[str, Any]) -> None:
+        now = self._clock()
+        with self._lock:
+            self._write_touches()
+            self.conn.execute(
+                """
+                INSERT OR REPLACE INTO search_cache (key, kind, query, payload, fetched_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (key, kind, query, json.dumps(payload, ensure_ascii=False), now, now),
+            )
+            self.conn.execute(
+                """
+                DELETE FROM search_cache WHERE key IN (
+                    SELECT key FROM search_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+            self.conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._touched:
+                self._write_touches()
+                self.conn.commit()
+            self.conn.close()
@@ -1,25 +1,254 @@
 from __future__ import annotations
 
 import json
+import queue
 import sqlite3
-from datetime import date, datetime
+import threading
+import weakref
+from concurrent.futures import Future
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator, Sequence
 
-from agent_search.models import MarketBar, NewsItem, RiskState, TradeSignal
+import numpy as np
+
+from agent_search.models import MarketBar, NewsItem, RiskState, StageMetrics, TradeSignal
+from agent_search.series import PRICE_FIELDS, BarSeries
 from agent_search.utils import stable_hash
 
 
+JOURNAL_MODES = ("delete", "truncate", "persist", "memory", "wal")
+SYNCHRONOUS_LEVELS = ("off", "normal", "full", "extra")
+VACUUM_MODES = ("incremental", "full", "none")
+
+
+class _Session:
+    """Queue marker: the writer thread hands its connection to one caller's ``transaction()``."""
+
+    def __init__(self) -> None:
+        self.granted = Future()
+        self.released = threading.Event()
+
+
+class _Reader:
+    """Holder for one thread's reader; dropped with that thread's locals, which closes the connection."""
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+
+def _release_reader(conn: sqlite3.Connection, readers: set[sqlite3.Connection], lock: threading.Lock) -> None:
+    with lock:
+        readers.discard(conn)
+    conn.close()
+
+
+_STOP = object()
+
+
 class SQLiteStore:
-    def __init__(self, db_path: str) -> None:
+    """SQLite persistence for bars, news, signals and run bookkeeping.
+
+    Safe to share across threads. Each thread reads on its own connection;
+    all writes go through one writer thread, which drains its queue and
+    commits whatever producers have submitted in a single transaction.
+    A write returns once that transaction has committed.
+
+    ``transaction()`` takes the writer connection for the calling thread.
+    Writes and reads inside it run directly on that connection and commit
+    once on exit. With ``event_buffer_size`` > 0, ``log_event`` rows are
+    held in memory and written in one batch when the buffer fills, when
+    the outermost transaction commits, on ``flush_events`` and on ``close``.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        journal_mode: str | None = None,
+        synchronous: str | None = None,
+        cache_size_kib: int = 0,
+        busy_timeout_ms: int = 5000,
+        event_buffer_size: int = 0,
+        write_batch_size: int = 256,
+    ) -> None:
+        if journal_mode is not None and journal_mode.lower() not in JOURNAL_MODES:
+            raise ValueError(f"unsupported journal_mode: {journal_mode}")
+        if synchronous is not None and synchronous.lower() not in SYNCHRONOUS_LEVELS:
+            raise ValueError(f"unsupported synchronous level: {synchronous}")
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row
+        self.synchronous = synchronous.lower() if synchronous is not None else None
+        self.cache_size_kib = cache_size_kib
+        self.busy_timeout_ms = busy_timeout_ms
+        self.event_buffer_size = max(0, event_buffer_size)
+        self.write_batch_size = max(1, write_batch_size)
+        self._events: list[tuple[str, str, str]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._readers: set[sqlite3.Connection] = set()
+        self._closed = False
+
+        # The writer issues BEGIN/COMMIT itself.
+        self._writer = self._connect()
+        if self._writer.execute("PRAGMA page_count").fetchone()[0] == 0:
+            # Only takes effect before the first table exists; lets maintenance free pages incrementally.
+            self._writer.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        if journal_mode is not None:
+            self._writer.execute(f"PRAGMA journal_mode={journal_mode.lower()}")
         self._init_schema()
+        self._queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._writer_thread = threading.Thread(target=self._write_loop, name="sqlite-writer", daemon=True)
+        self._writer_thread.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit: a reader never holds a lock past its statement, so it cannot stall the writer.
+        conn = sqlite3.connect(
+            self.db_path, timeout=self.busy_timeout_ms / 1000.0, check_same_thread=False, isolation_level=None
+        )
+        conn.row_factory = sqlite3.Row
+        if self.synchronous is not None:
+            conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        if self.cache_size_kib > 0:
+            # Negative cache_size is in KiB rather than pages.
+            conn.execute(f"PRAGMA cache_size=-{int(self.cache_size_kib)}")
+        return conn
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """This thread's connection: the writer inside ``transaction()``, else a private reader."""
+        if getattr(self._local, "depth", 0):
+            return self._writer
+        holder = getattr(self._local, "reader", None)
+        if holder is None:
+            conn = self._connect()
+            holder = self._local.reader = _Reader(conn)
+            with self._lock:
+                self._readers.add(conn)
+            # Not bound to self: the finalizer must not keep the store alive.
+            weakref.finalize(holder, _release_reader, conn, self._readers, self._lock)
+        return holder.conn
+
+    def _write_loop(self) -> None:
+        pending: Any = None
+        while True:
+            item = pending if pending is not None else self._queue.get()
+            pending = None
+            if item is _STOP:
+                return
+            if isinstance(item, _Session):
+                item.granted.set_result(None)
+                item.released.wait()
+                continue
+            batch = [item]
+            while len(batch) < self.write_batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP or isinstance(item, _Session):
+                    pending = item
+                    break
+                batch.append(item)
+            self._run_batch(batch)
+
+    def _run_batch(self, batch: list[tuple[Callable[[sqlite3.Connection], Any], Future]]) -> None:
+        conn = self._writer
+        results: list[tuple[Future, Any, BaseException | None]] = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for fn, future in batch:
+                # A savepoint per job, so one failing producer does not roll back the others.
+                conn.execute("SAVEPOINT job")
+                try:
+                    results.append((future, fn(conn), None))
+                except Exception as err:  # noqa: BLE001
+                    conn.execute("ROLLBACK TO job")
+                    results.append((future, None, err))
+                conn.execute("RELEASE job")
+            conn.execute("COMMIT")
+        except Exception as err:  # noqa: BLE001
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            for _, future in batch:
+                future.set_exception(err)
+            return
+        for future, result, error in results:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def _write(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        if getattr(self._local, "depth", 0):
+            return fn(self._writer)
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed store.")
+        future: Future = Future()
+        self._queue.put((fn, future))
+        return future.result()
+
+    def _execute(self, sql: str, params: Sequence[Any] = ()) -> int:
+        return self._write(lambda conn: conn.execute(sql, params).rowcount)
+
+    def _executemany(self, sql: str, rows: list[Sequence[Any]]) -> None:
+        self._write(lambda conn: conn.executemany(sql, rows))
+
+    @contextmanager
+    def _writer_session(self) -> Iterator[sqlite3.Connection]:
+        """Borrow the writer connection for the calling thread; queued writes wait until release."""
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed store.")
+        session = _Session()
+        self._queue.put(session)
+        session.granted.result()
+        try:
+            yield self._writer
+        finally:
+            session.released.set()
+
+    @contextmanager
+    def transaction(self) -> Iterator[SQLiteStore]:
+        """Unit of work: writes inside commit together on exit, or roll back on error; nests."""
+        depth = getattr(self._local, "depth", 0)
+        if depth:
+            self._local.depth = depth + 1
+            try:
+                yield self
+            finally:
+                self._local.depth = depth
+            return
+        with self._writer_session() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            self._local.depth = 1
+            try:
+                yield self
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            finally:
+                self._local.depth = 0
+            try:
+                self._write_events(conn)
+                conn.execute("COMMIT")
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+
+    def _write_events(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            events, self._events = self._events, []
+        if events:
+            conn.executemany("INSERT INTO audit_logs (ts, event, payload) VALUES (?, ?, ?)", events)
+
+    def flush_events(self) -> None:
+        """Write buffered audit-log rows now."""
+        if self._events:
+            self._write(self._write_events)
 
     def _init_schema(self) -> None:
-        self.conn.executescript(
+        self._writer.executescript(
             """
             CREATE TABLE IF NOT EXISTS market_bars (
                 symbol TEXT NOT NULL,
@@ -64,7 +293,8 @@ class SQLiteStore:
                 evidence_urls TEXT NOT NULL,
                 position_size_pct REAL NOT NULL,
                 low_confidence INTEGER NOT NULL,
-                created_at TEXT NOT NULL
+                created_at TEXT NOT NULL,
+                trade_date TEXT NOT NULL DEFAULT ''
             );
 
             CREATE TABLE IF NOT EXISTS risk_states (
@@ -82,32 +312,115 @@ class SQLiteStore:
                 event TEXT NOT NULL,
                 payload TEXT NOT NULL
             );
+
+            CREATE TABLE IF NOT EXISTS run_metrics (
+                run_id TEXT NOT NULL,
+                ts TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                source TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                errors INTEGER NOT NULL,
+                total_ms REAL NOT NULL,
+                p50_ms REAL NOT NULL,
+                p95_ms REAL NOT NULL,
+                max_ms REAL NOT NULL,
+                PRIMARY KEY (run_id, stage, source)
+            );
+
+            CREATE TABLE IF NOT EXISTS signal_fingerprints (
+                symbol TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                signal TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS announcements (
+                id TEXT PRIMARY KEY,
+                symbol TEXT NOT NULL,
+                ts TEXT NOT NULL,
+                title TEXT NOT NULL,
+                url TEXT NOT NULL,
+                source TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_announcements_symbol_ts
+            ON announcements(symbol, ts);
+
+            CREATE TABLE IF NOT EXISTS alert_outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                dedupe_key TEXT NOT NULL UNIQUE,
+                kind TEXT NOT NULL,
+                content TEXT NOT NULL,
+                signal_ids TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at TEXT NOT NULL,
+                last_error TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_alert_outbox_due
+            ON alert_outbox(status, next_attempt_at);
+
+            CREATE TABLE IF NOT EXISTS announcement_ingest (
+                day TEXT PRIMARY KEY,
+                fetched_at TEXT NOT NULL,
+                count INTEGER NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS audit_rollups (
+                day TEXT NOT NULL,
+                event TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                timed INTEGER NOT NULL,
+                total_ms REAL NOT NULL,
+                max_ms REAL,
+                PRIMARY KEY (day, event)
+            );
             """
         )
-        self.conn.commit()
+        self._migrate_signals()
+
+    def _migrate_signals(self) -> None:
+        columns = {row["name"] for row in self._writer.execute("PRAGMA table_info(signals)")}
+        if "trade_date" not in columns:
+            # Databases created before the column existed: backfill from the local ts prefix.
+            self._writer.execute("BEGIN IMMEDIATE")
+            self._writer.execute("ALTER TABLE signals ADD COLUMN trade_date TEXT NOT NULL DEFAULT ''")
+            self._writer.execute("UPDATE signals SET trade_date = substr(ts, 1, 10)")
+            self._writer.execute("COMMIT")
+        self._writer.execute("CREATE INDEX IF NOT EXISTS idx_signals_trade_date ON signals(trade_date, ts)")
+        self._writer.execute("CREATE INDEX IF NOT EXISTS idx_signals_symbol_date ON signals(symbol, trade_date)")
 
     @staticmethod
     def _hour_bucket(dt: datetime) -> str:
         return dt.strftime("%Y%m%d%H")
 
-    def save_market_bars(self, bars: list[MarketBar]) -> None:
-        if not bars:
+    def save_market_bars(self, bars: list[MarketBar] | BarSeries) -> None:
+        if not len(bars):
             return
-        rows = [
-            (
-                bar.symbol,
-                bar.ts.isoformat(),
-                bar.open,
-                bar.high,
-                bar.low,
-                bar.close,
-                bar.volume,
-                bar.amount,
-                bar.source,
-            )
-            for bar in bars
-        ]
-        self.conn.executemany(
+        if isinstance(bars, BarSeries):
+            columns = [getattr(bars, name).tolist() for name in PRICE_FIELDS]
+            rows = [
+                (bars.symbol, ts.isoformat(), *values, bars.source)
+                for ts, *values in zip(bars.timestamps(), *columns)
+            ]
+        else:
+            rows = [
+                (
+                    bar.symbol,
+                    bar.ts.isoformat(),
+                    bar.open,
+                    bar.high,
+                    bar.low,
+                    bar.close,
+                    bar.volume,
+                    bar.amount,
+                    bar.source,
+                )
+                for bar in bars
+            ]
+        self._executemany(
             """
             INSERT OR REPLACE INTO market_bars
             (symbol, ts, open, high, low, close, volume, amount, source)
@@ -115,7 +428,6 @@ class SQLiteStore:
             """,
             rows,
         )
-        self.conn.commit()
 
     def save_news_items(self, items: list[NewsItem]) -> None:
         if not items:
@@ -138,7 +450,7 @@ class SQLiteStore:
                     now,
                 )
             )
-        self.conn.executemany(
+        self._executemany(
             """
             INSERT OR IGNORE INTO news_items
             (id, symbol, ts, title, url, source, sentiment, relevance, url_hash, hour_bucket, created_at)
@@ -146,7 +458,6 @@ class SQLiteStore:
             """,
             rows,
         )
-        self.conn.commit()
 
     def save_signals(self, signals: list[TradeSignal]) -> None:
         if not signals:
@@ -170,22 +481,22 @@ class SQLiteStore:
                     signal.position_size_pct,
                     1 if signal.low_confidence else 0,
                     now,
+                    signal.ts.date().isoformat(),
                 )
             )
 
-        self.conn.executemany(
+        self._executemany(
             """
             INSERT OR REPLACE INTO signals
             (id, symbol, ts, action, entry, stop_loss, take_profit, confidence, score,
-            reasons, evidence_urls, position_size_pct, low_confidence, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            reasons, evidence_urls, position_size_pct, low_confidence, created_at, trade_date)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             rows,
         )
-        self.conn.commit()
 
     def save_risk_state(self, risk_state: RiskState) -> None:
-        self.conn.execute(
+        self._execute(
             """
             INSERT OR REPLACE INTO risk_states
             (date, equity, peak_equity, drawdown, allow_new_buy, created_at)
@@ -200,14 +511,214 @@ class SQLiteStore:
                 datetime.utcnow().isoformat(),
             ),
         )
-        self.conn.commit()
 
     def log_event(self, event: str, payload: dict[str, Any]) -> None:
-        self.conn.execute(
-            "INSERT INTO audit_logs (ts, event, payload) VALUES (?, ?, ?)",
-            (datetime.utcnow().isoformat(), event, json.dumps(payload, ensure_ascii=False)),
+        row = (datetime.utcnow().isoformat(), event, json.dumps(payload, ensure_ascii=False))
+        with self._lock:
+            self._events.append(row)
+            full = len(self._events) > self.event_buffer_size
+        if full:
+            self.flush_events()
+
+    def enqueue_alert(self, kind: str, content: str, signal_ids: list[str]) -> bool:
+        """Queue an alert for the outbox worker; False if the same alert was queued before."""
+        now = datetime.utcnow().isoformat()
+        inserted = self._execute(
+            """
+            INSERT OR IGNORE INTO alert_outbox
+            (dedupe_key, kind, content, signal_ids, status, attempts, next_attempt_at, created_at, updated_at)
+            VALUES (?, ?, ?, ?, 'pending', 0, ?, ?, ?)
+            """,
+            (
+                stable_hash(f"{kind}|{','.join(signal_ids)}|{content}"),
+                kind,
+                content,
+                json.dumps(signal_ids),
+                now,
+                now,
+                now,
+            ),
+        )
+        return inserted > 0
+
+    def claim_alerts(self, limit: int = 20, lease_seconds: float = 120.0) -> list[dict[str, Any]]:
+        """Lease due alerts to the caller; leases older than ``lease_seconds`` are taken over."""
+        now = datetime.utcnow()
+        expired = (now - timedelta(seconds=lease_seconds)).isoformat()
+
+        def claim(conn: sqlite3.Connection) -> list[sqlite3.Row]:
+            # Runs inside the writer's BEGIN IMMEDIATE, so select-then-update is atomic across processes.
+            rows = conn.execute(
+                """
+                SELECT id, kind, content, signal_ids, attempts
+                FROM alert_outbox
+                WHERE (status='pending' AND next_attempt_at <= ?) OR (status='sending' AND updated_at <= ?)
+                ORDER BY id ASC
+                LIMIT ?
+                """,
+                (now.isoformat(), expired, limit),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE alert_outbox SET status='sending', attempts=attempts+1, updated_at=? WHERE id=?",
+                [(now.isoformat(), row["id"]) for row in rows],
+            )
+            return rows
+
+        return [
+            {
+                "id": row["id"],
+                "kind": row["kind"],
+                "content": row["content"],
+                "signal_ids": json.loads(row["signal_ids"]),
+                "attempts": row["attempts"] + 1,
+            }
+            for row in self._write(claim)
+        ]
+
+    def mark_alert_sent(self, alert_id: int) -> None:
+        self._execute(
+            "UPDATE alert_outbox SET status='sent', last_error=NULL, updated_at=? WHERE id=?",
+            (datetime.utcnow().isoformat(), alert_id),
+        )
+
+    def mark_alert_failed(self, alert_id: int, error: str, retry_at: datetime | None) -> None:
+        """Reschedule the alert for ``retry_at``, or give up on it when that is ``None``."""
+        now = datetime.utcnow().isoformat()
+        if retry_at is None:
+            self._execute(
+                "UPDATE alert_outbox SET status='failed', last_error=?, updated_at=? WHERE id=?",
+                (error, now, alert_id),
+            )
+        else:
+            self._execute(
+                """
+                UPDATE alert_outbox SET status='pending', last_error=?, next_attempt_at=?, updated_at=?
+                WHERE id=?
+                """,
+                (error, retry_at.isoformat(), now, alert_id),
+            )
+
+    def get_outbox_counts(self) -> dict[str, int]:
+        rows = self.conn.execute("SELECT status, COUNT(*) AS n FROM alert_outbox GROUP BY status").fetchall()
+        return {row["status"]: int(row["n"]) for row in rows}
+
+    def save_run_metrics(self, run_id: str, metrics: list[StageMetrics]) -> None:
+        if not metrics:
+            return
+        now = datetime.utcnow().isoformat()
+        rows = [
+            (
+                run_id,
+                now,
+                item.stage,
+                item.source,
+                item.count,
+                item.errors,
+                item.total_ms,
+                item.p50_ms,
+                item.p95_ms,
+                item.max_ms,
+            )
+            for item in metrics
+        ]
+        self._executemany(
+            """
+            INSERT OR REPLACE INTO run_metrics
+            (run_id, ts, stage, source, count, errors, total_ms, p50_ms, p95_ms, max_ms)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+
+    def get_run_metrics(self, run_id: str) -> list[StageMetrics]:
+        rows = self.conn.execute(
+            """
+            SELECT stage, source, count, errors, total_ms, p50_ms, p95_ms, max_ms
+            FROM run_metrics
+            WHERE run_id=?
+            ORDER BY stage ASC, source ASC
+            """,
+            (run_id,),
+        ).fetchall()
+        return [StageMetrics(**dict(row)) for row in rows]
+
+    def save_signal_fingerprints(self, entries: list[tuple[str, str, TradeSignal]]) -> None:
+        if not entries:
+            return
+        now = datetime.utcnow().isoformat()
+        self._executemany(
+            """
+            INSERT OR REPLACE INTO signal_fingerprints (symbol, fingerprint, signal, updated_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            [(symbol, fingerprint, signal.model_dump_json(), now) for symbol, fingerprint, signal in entries],
+        )
+
+    def get_signal_fingerprints(self, symbols: list[str]) -> dict[str, tuple[str, TradeSignal]]:
+        """Latest input fingerprint and the signal built from it, keyed by symbol."""
+        wanted = set(symbols)
+        output: dict[str, tuple[str, TradeSignal]] = {}
+        for row in self.conn.execute("SELECT symbol, fingerprint, signal FROM signal_fingerprints"):
+            if row["symbol"] in wanted:
+                output[row["symbol"]] = (row["fingerprint"], TradeSignal.model_validate_json(row["signal"]))
+        return output
+
+    def save_announcements(self, items: list[NewsItem]) -> None:
+        if not items:
+            return
+        now = datetime.utcnow().isoformat()
+        self._executemany(
+            """
+            INSERT OR IGNORE INTO announcements (id, symbol, ts, title, url, source, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            [(item.id, item.symbol, item.ts.isoformat(), item.title, item.url, item.source, now) for item in items],
+        )
+
+    def get_announcements(self, symbols: list[str], since: datetime) -> dict[str, list[NewsItem]]:
+        """Stored announcements at or after ``since``, newest first, keyed by symbol."""
+        output: dict[str, list[NewsItem]] = {}
+        unique = list(dict.fromkeys(symbols))
+        for offset in range(0, len(unique), 500):
+            chunk = unique[offset : offset + 500]
+            rows = self.conn.execute(
+                f"""
+                SELECT id, symbol, ts, title, url, source
+                FROM announcements
+                WHERE symbol IN ({",".join("?" * len(chunk))}) AND ts >= ?
+                ORDER BY symbol, ts DESC
+                """,
+                (*chunk, since.isoformat()),
+            ).fetchall()
+            for row in rows:
+                output.setdefault(row["symbol"], []).append(
+                    NewsItem(
+                        id=row["id"],
+                        symbol=row["symbol"],
+                        ts=datetime.fromisoformat(row["ts"]),
+                        title=row["title"],
+                        url=row["url"],
+                        source=row["source"],
+                        sentiment=0.0,
+                        relevance=1.0,
+                    )
+                )
+        return output
+
+    def get_announcement_ingest(self, days: list[date]) -> dict[date, datetime]:
+        """When each day's announcement list was last fetched."""
+        wanted = {day.isoformat() for day in days}
+        output: dict[date, datetime] = {}
+        for row in self.conn.execute("SELECT day, fetched_at FROM announcement_ingest"):
+            if row["day"] in wanted:
+                output[date.fromisoformat(row["day"])] = datetime.fromisoformat(row["fetched_at"])
+        return output
+
+    def mark_announcement_ingest(self, counts: dict[date, int], fetched_at: datetime) -> None:
+        self._executemany(
+            "INSERT OR REPLACE INTO announcement_ingest (day, fetched_at, count) VALUES (?, ?, ?)",
+            [(day.isoformat(), fetched_at.isoformat(), count) for day, count in counts.items()],
         )
-        self.conn.commit()
 
     def get_latest_risk_state(self) -> RiskState | None:
         row = self.conn.execute(
@@ -224,40 +735,8 @@ class SQLiteStore:
             allow_new_buy=bool(row["allow_new_buy"]),
         )
 
-    def get_signals_by_date(self, day: date) -> list[dict[str, Any]]:
-        prefix = day.isoformat()
-        rows = self.conn.execute(
-            "SELECT * FROM signals WHERE ts LIKE ? ORDER BY ts ASC",
-            (f"{prefix}%",),
-        ).fetchall()
-        output: list[dict[str, Any]] = []
-        for row in rows:
-            output.append(
-                {
-                    "id": row["id"],
-                    "symbol": row["symbol"],
-                    "ts": row["ts"],
-                    "action": row["action"],
-                    "entry": row["entry"],
-                    "stop_loss": row["stop_loss"],
-                    "take_profit": row["take_profit"],
-                    "confidence": row["confidence"],
-                    "score": row["score"],
-                    "reasons": json.loads(row["reasons"]),
-                    "evidence_urls": json.loads(row["evidence_urls"]),
-                    "position_size_pct": row["position_size_pct"],
-                    "low_confidence": bool(row["low_confidence"]),
-                }
-            )
-        return output
-
-    def get_signal_by_id(self, signal_id: str) -> dict[str, Any] | None:
-        row = self.conn.execute(
-            "SELECT * FROM signals WHERE id=? LIMIT 1",
-            (signal_id,),
-        ).fetchone()
-        if not row:
-            return None
+    @staticmethod
+    def _signal_dict(row: sqlite3.Row) -> dict[str, Any]:
         return {
             "id": row["id"],
             "symbol": row["symbol"],
@@ -274,8 +753,86 @@ class SQLiteStore:
             "low_confidence": bool(row["low_confidence"]),
         }
 
-    def get_market_bars(self, symbol: str, start: str, end: str) -> list[MarketBar]:
+    def get_signals_by_date(self, day: date) -> list[dict[str, Any]]:
+        rows = self.conn.execute(
+            "SELECT * FROM signals WHERE trade_date=? ORDER BY ts ASC",
+            (day.isoformat(),),
+        ).fetchall()
+        return [self._signal_dict(row) for row in rows]
+
+    def get_signals_between(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        symbol: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Signals with ``start <= trade_date <= end`` (either bound optional), optionally for one symbol."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        if symbol is not None:
+            clauses.append("symbol=?")
+            params.append(symbol)
+        if start is not None:
+            clauses.append("trade_date>=?")
+            params.append(start.isoformat())
+        if end is not None:
+            clauses.append("trade_date<=?")
+            params.append(end.isoformat())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.conn.execute(f"SELECT * FROM signals {where} ORDER BY ts ASC", params).fetchall()
+        return [self._signal_dict(row) for row in rows]
+
+    def get_latest_signals(self, symbols: list[str] | None = None) -> dict[str, dict[str, Any]]:
+        """Most recent signal per symbol, for all symbols or just ``symbols``."""
+        # SQLite returns the other columns from the row that holds MAX(ts).
+        query = "SELECT *, MAX(ts) AS latest_ts FROM signals"
+        params: list[Any] = []
+        if symbols is not None:
+            if not symbols:
+                return {}
+            query += f" WHERE symbol IN ({','.join('?' * len(symbols))})"
+            params.extend(symbols)
+        rows = self.conn.execute(query + " GROUP BY symbol ORDER BY symbol", params).fetchall()
+        return {row["symbol"]: self._signal_dict(row) for row in rows}
+
+    def get_signal_by_id(self, signal_id: str) -> dict[str, Any] | None:
+        row = self.conn.execute(
+            "SELECT * FROM signals WHERE id=? LIMIT 1",
+            (signal_id,),
+        ).fetchone()
+        if not row:
+            return None
+        return self._signal_dict(row)
+
+    def get_news_items(self, symbol: str, since: datetime) -> list[NewsItem]:
         rows = self.conn.execute(
+            """
+            SELECT id, symbol, ts, title, url, source, sentiment, relevance
+            FROM news_items
+            WHERE symbol=? AND ts >= ?
+            ORDER BY ts DESC
+            """,
+            (symbol, since.isoformat()),
+        ).fetchall()
+        return [
+            NewsItem(
+                id=row["id"],
+                symbol=row["symbol"],
+                ts=datetime.fromisoformat(row["ts"]),
+                title=row["title"],
+                url=row["url"],
+                source=row["source"],
+                sentiment=float(row["sentiment"]),
+                relevance=float(row["relevance"]),
+            )
+            for row in rows
+        ]
+
+    def _select_market_bars(self, symbol: str, start: str, end: str) -> list[sqlite3.Row]:
+        if len(end) == 10:
+            # Date-only bound: include every bar stamped on the end day.
+            end = f"{end}T23:59:59.999999"
+        return self.conn.execute(
             """
             SELECT symbol, ts, open, high, low, close, volume, amount, source
             FROM market_bars
@@ -284,6 +841,27 @@ class SQLiteStore:
             """,
             (symbol, start, end),
         ).fetchall()
+
+    def get_bar_series(self, symbol: str, start: str, end: str) -> BarSeries:
+        rows = self._select_market_bars(symbol, start, end)
+        if not rows:
+            return BarSeries.empty(symbol)
+        return BarSeries(
+            symbol=symbol,
+            ts=np.array([row["ts"] for row in rows], dtype="datetime64[us]"),
+            source=rows[-1]["source"],
+            **{name: np.array([row[name] for row in rows], dtype=float) for name in PRICE_FIELDS},
+        )
+
+    def get_market_bar_stats(self) -> dict[str, tuple[int, str, str, float]]:
+        """Per-symbol ``(rows, first_ts, last_ts, close_sum)``; cheap change detection for exports."""
+        rows = self.conn.execute(
+            "SELECT symbol, COUNT(*), MIN(ts), MAX(ts), TOTAL(close) FROM market_bars GROUP BY symbol"
+        ).fetchall()
+        return {row[0]: (int(row[1]), row[2], row[3], float(row[4])) for row in rows}
+
+    def get_market_bars(self, symbol: str, start: str, end: str) -> list[MarketBar]:
+        rows = self._select_market_bars(symbol, start, end)
         bars: list[MarketBar] = []
         for row in rows:
             bars.append(
@@ -301,5 +879,120 @@ class SQLiteStore:
             )
         return bars
 
+    def rollup_audit_logs(self, until: date) -> int:
+        """(Re)compute per-day event counts and ``duration_ms`` totals for days before ``until``.
+
+        Days are UTC like ``audit_logs.ts``. Raw rows are only ever pruned by
+        whole day, so every day still present is complete and can be replaced.
+        """
+
+        def rollup(conn: sqlite3.Connection) -> int:
+            return conn.execute(
+                """
+                INSERT OR REPLACE INTO audit_rollups (day, event, count, timed, total_ms, max_ms)
+                SELECT day, event, COUNT(*), COUNT(duration_ms), TOTAL(duration_ms), MAX(duration_ms)
+                FROM (
+                    SELECT substr(ts, 1, 10) AS day, event,
+                           json_extract(
+                               CASE WHEN json_valid(payload) THEN payload END, '$.duration_ms'
+                           ) AS duration_ms
+                    FROM audit_logs
+                    WHERE ts < ?
+                )
+                GROUP BY day, event
+                """,
+                (until.isoformat(),),
+            ).rowcount
+
+        return self._write(rollup)
+
+    def get_audit_rollups(self, start: date | None = None, end: date | None = None) -> list[dict[str, Any]]:
+        rows = self.conn.execute(
+            """
+            SELECT day, event, count, timed, total_ms, max_ms
+            FROM audit_rollups
+            WHERE day >= ? AND day <= ?
+            ORDER BY day ASC, event ASC
+            """,
+            (start.isoformat() if start else "", end.isoformat() if end else "9999-12-31"),
+        ).fetchall()
+        return [
+            {
+                "day": row["day"],
+                "event": row["event"],
+                "count": row["count"],
+                "avg_ms": round(row["total_ms"] / row["timed"], 3) if row["timed"] else None,
+                "max_ms": row["max_ms"],
+            }
+            for row in rows
+        ]
+
+    def prune_audit_logs(self, before: date) -> int:
+        """Delete raw audit rows from days before ``before``; roll them up first."""
+        with self.transaction():
+            self.rollup_audit_logs(before)
+            return self._execute("DELETE FROM audit_logs WHERE ts < ?", (before.isoformat(),))
+
+    def prune_news(self, before: date) -> dict[str, int]:
+        """Delete news items, announcements and ingest marks dated before ``before``."""
+        cutoff = before.isoformat()
+        with self.transaction():
+            return {
+                "news_items": self._execute("DELETE FROM news_items WHERE ts < ?", (cutoff,)),
+                "announcements": self._execute("DELETE FROM announcements WHERE ts < ?", (cutoff,)),
+                "announcement_ingest": self._execute("DELETE FROM announcement_ingest WHERE day < ?", (cutoff,)),
+            }
+
+    def file_size(self) -> int:
+        """Bytes on disk for the database and its WAL file."""
+        wal_path = self.db_path.with_name(self.db_path.name + "-wal")
+        return sum(path.stat().st_size for path in (self.db_path, wal_path) if path.exists())
+
+    def compact(self, vacuum: str = "incremental") -> str:
+        """Return free pages to the filesystem and refresh planner statistics; returns the vacuum run.
+
+        ``vacuum`` is ``incremental``, ``full`` or ``none``. A database
+        created before incremental auto-vacuum was enabled is converted by
+        one full ``VACUUM`` the first time it is compacted.
+        """
+        if vacuum not in VACUUM_MODES:
+            raise ValueError(f"unsupported vacuum mode: {vacuum}")
+        self.flush_events()
+        with self._writer_session() as conn:
+            if vacuum != "none" and (vacuum == "full" or conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2):
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                conn.execute("VACUUM")
+                vacuum = "full"
+            elif vacuum == "incremental":
+                # execute() steps the pragma once, which frees a single page; a script runs it to completion.
+                conn.executescript("PRAGMA incremental_vacuum;")
+            conn.execute("ANALYZE")
+            # Fold the WAL back into the main file so the freed space shows up on disk.
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+        return vacuum
+
     def close(self) -> None:
-        self.conn.close()
+        """Flush buffered events, stop the writer thread and close every connection."""
+        if self._closed:
+            return
+        if getattr(self._local, "depth", 0):
+            # The writer thread is parked on this caller's session and would never see the stop.
+            raise sqlite3.ProgrammingError("Cannot close the store inside transaction().")
+        self.flush_events()
+        self._closed = True
+        self._queue.put(_STOP)
+        self._writer_thread.join()
+        # Producers that raced close() must not wait forever on a stopped writer.
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            future = item.granted if isinstance(item, _Session) else item[1]
+            future.set_exception(sqlite3.ProgrammingError("Cannot operate on a closed store."))
+        self._writer.close()
+        with self._lock:
+            readers = list(self._readers)
+            self._readers.clear()
+        for reader in readers:
+            reader.close()
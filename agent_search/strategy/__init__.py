@@ -6,6 +6,7 @@ from .risk import (
     stop_loss_price,
     take_profit_price,
 )
+from .screen import screen_universe
 from .signal import build_trade_signal
 
 __all__ = [
@@ -19,4 +20,5 @@ __all__ = [
     "stop_loss_price",
     "take_profit_price",
     "build_trade_signal",
+    "screen_universe",
 ]
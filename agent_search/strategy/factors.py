@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
 
 from agent_search.models import MarketBar
+from agent_search.series import BarSeries
 from agent_search.utils import clamp
 
+Bars = BarSeries | Sequence[MarketBar]
+
 
 @dataclass
 class TechnicalSnapshot:
@@ -17,86 +23,74 @@ class TechnicalSnapshot:
     breakout20: bool
 
 
-def moving_average(values: list[float], window: int) -> float | None:
+def moving_average(values: Sequence[float], window: int) -> float | None:
     if window <= 0 or len(values) < window:
         return None
-    return sum(values[-window:]) / window
+    return float(np.sum(values[-window:])) / window
 
 
-def calculate_rsi(closes: list[float], period: int = 14) -> float | None:
+def calculate_rsi(closes: Sequence[float], period: int = 14) -> float | None:
     if len(closes) <= period:
         return None
 
-    gains: list[float] = []
-    losses: list[float] = []
-    for idx in range(-period, 0):
-        delta = closes[idx] - closes[idx - 1]
-        gains.append(max(delta, 0.0))
-        losses.append(abs(min(delta, 0.0)))
-
-    avg_gain = sum(gains) / period
-    avg_loss = sum(losses) / period
+    deltas = np.diff(np.asarray(closes[-(period + 1) :], dtype=float))
+    avg_gain = float(np.sum(np.maximum(deltas, 0.0))) / period
+    avg_loss = float(np.sum(np.abs(np.minimum(deltas, 0.0)))) / period
     if avg_loss == 0:
         return 100.0
     rs = avg_gain / avg_loss
     return 100.0 - (100.0 / (1.0 + rs))
 
 
-def calculate_atr(bars: list[MarketBar], period: int = 14) -> float | None:
+def calculate_atr(bars: Bars, period: int = 14) -> float | None:
     if len(bars) <= period:
         return None
 
-    tr_values: list[float] = []
-    for idx in range(1, len(bars)):
-        curr = bars[idx]
-        prev = bars[idx - 1]
-        tr = max(
-            curr.high - curr.low,
-            abs(curr.high - prev.close),
-            abs(curr.low - prev.close),
-        )
-        tr_values.append(tr)
-
-    if len(tr_values) < period:
-        return None
-    return sum(tr_values[-period:]) / period
+    # Only the last ``period`` true ranges are averaged, so only look at those bars.
+    tail = BarSeries.coerce(bars[-(period + 1) :])
+    prev_close = tail.close[:-1]
+    high = tail.high[1:]
+    low = tail.low[1:]
+    tr = np.maximum.reduce([high - low, np.abs(high - prev_close), np.abs(low - prev_close)])
+    return float(np.sum(tr)) / period
 
 
-def volume_ratio(bars: list[MarketBar], window: int = 5) -> float | None:
+def volume_ratio(bars: Bars, window: int = 5) -> float | None:
     if len(bars) < window + 1:
         return None
-    latest = bars[-1].volume
-    base = sum(item.volume for item in bars[-(window + 1) : -1]) / window
+    volumes = BarSeries.coerce(bars[-(window + 1) :]).volume
+    base = float(np.sum(volumes[:-1])) / window
     if base <= 0:
         return None
-    return latest / base
+    return float(volumes[-1]) / base
 
 
-def is_breakout_20d(bars: list[MarketBar]) -> bool:
+def is_breakout_20d(bars: Bars) -> bool:
     if len(bars) < 21:
         return False
-    latest = bars[-1].close
-    prev_high = max(item.high for item in bars[-21:-1])
-    return latest > prev_high
+    tail = BarSeries.coerce(bars[-21:])
+    return bool(tail.close[-1] > np.max(tail.high[:-1]))
 
 
-def compute_technical_score(bars: list[MarketBar]) -> tuple[float, list[str], TechnicalSnapshot]:
-    if not bars:
+def compute_technical_score(bars: Bars) -> tuple[float, list[str], TechnicalSnapshot]:
+    if not len(bars):
         snapshot = TechnicalSnapshot(None, None, None, None, None, None, False)
         return 0.0, ["缺少K线数据"], snapshot
 
-    closes = [item.close for item in bars]
+    # Factors only read the last few weeks; avoid converting a long MarketBar list wholesale.
+    series = BarSeries.coerce(bars[-30:]) if not isinstance(bars, BarSeries) else bars
+    closes = series.close
     ma5 = moving_average(closes, 5)
     ma10 = moving_average(closes, 10)
     ma20 = moving_average(closes, 20)
     rsi14 = calculate_rsi(closes, 14)
-    atr14 = calculate_atr(bars, 14)
-    vr5 = volume_ratio(bars, 5)
-    breakout20 = is_breakout_20d(bars)
+    atr14 = calculate_atr(series, 14)
+    vr5 = volume_ratio(series, 5)
+    breakout20 = is_breakout_20d(series)
 
     reasons: list[str] = []
     score = 0.0
-    last_close = closes[-1]
+    last_close = float(closes[-1])
 
     if ma5 is not None and last_close > ma5:
         score += 1.0
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from agent_search.config import ScreenConfig
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+RANK_WEIGHTS = {
+    "volume_ratio": 0.4,
+    "change_pct": 0.3,
+    "turnover": 0.3,
+}
+
+
+def screen_universe(frame: pd.DataFrame, config: ScreenConfig, top_n: int | None = None) -> pd.DataFrame:
+    """Cheap vectorized pre-screen over a ``get_spot_frame`` snapshot.
+
+    Rows passing every threshold are ranked by a weighted percentile score of
+    volume ratio, change and turnover; the best ``top_n`` are returned with a
+    ``screen_score`` column.
+    """
+    limit = config.top_n if top_n is None else top_n
+    mask = (
+        frame["price"].between(config.min_price, config.max_price)
+        & (frame["volume_ratio"] >= config.min_volume_ratio)
+        & frame["change_pct"].between(config.min_change_pct, config.max_change_pct)
+        & frame["turnover"].between(config.min_turnover, config.max_turnover)
+        & (frame["amount"] >= config.min_amount)
+    )
+    if config.exclude_st:
+        mask &= ~frame["name"].str.upper().str.contains("ST", regex=False, na=False)
+
+    passed = frame.loc[mask].copy()
+    score = sum(passed[column].rank(pct=True) * weight for column, weight in RANK_WEIGHTS.items())
+    passed["screen_score"] = score.round(6)
+    ranked = passed.sort_values(["screen_score", "amount", "symbol"], ascending=[False, False, True])
+    return ranked.head(max(0, limit)).reset_index(drop=True)
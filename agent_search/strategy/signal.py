@@ -5,6 +5,7 @@ from uuid import uuid4
 
 from agent_search.config import AppConfig
 from agent_search.models import NewsItem, RiskState, SignalAction, TradeSignal
+from agent_search.series import BarSeries
 from agent_search.strategy.factors import compute_technical_score
 from agent_search.strategy.risk import (
     calculate_position_size_pct,
@@ -74,7 +75,10 @@ def build_trade_signal(
         reduce_threshold=config.signal.reduce_threshold,
     )
 
-    latest_close = bars[-1].close if bars else None
+    if isinstance(bars, BarSeries):
+        latest_close = float(bars.close[-1]) if len(bars) else None
+    else:
+        latest_close = bars[-1].close if bars else None
     atr = snapshot.atr14
     stop_loss = stop_loss_price(latest_close or 0.0, atr, config.risk.atr_stop_multiple) if latest_close else None
     take_profit = take_profit_price(latest_close or 0.0, atr, config.risk.atr_stop_multiple) if latest_close else None
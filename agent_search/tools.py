@@ -103,23 +103,29 @@ def build_tool_schemas() -> list[dict]:
 
 
 class ToolService:
+    """LLM tool endpoints; every upstream call goes through the agent's breaker and rate limiter."""
+
     def __init__(self, config: AppConfig) -> None:
         self.agent = TradingResearchAgent(config)
 
     def get_kline(self, symbol: str, start: str, end: str, adjust: str = "qfq"):
-        bars = self.agent.market.get_kline(symbol=symbol, start=start, end=end, adjust=adjust)
+        bars = self.agent.guarded(
+            "akshare", self.agent.market.get_kline, symbol=symbol, start=start, end=end, adjust=adjust
+        )
         return [bar.model_dump(mode="json") for bar in bars]
 
     def get_realtime_quotes(self, symbols: list[str]):
-        quotes = self.agent.market.get_realtime_quotes(symbols)
+        quotes = self.agent.guarded("akshare", self.agent.market.get_realtime_quotes, symbols=symbols)
         return {symbol: quote.__dict__ for symbol, quote in quotes.items()}
 
     def get_news(self, symbol: str, since_hours: int = 48):
-        items = self.agent.serper.get_news(symbol=symbol, since_hours=since_hours)
+        items = self.agent.guarded("serper", self.agent.serper.get_news, symbol=symbol, since_hours=since_hours)
         return [item.model_dump(mode="json") for item in items]
 
     def get_announcements(self, symbol: str, since_days: int = 7):
-        items = self.agent.announcements.get_announcements(symbol=symbol, since_days=since_days)
+        items = self.agent.guarded(
+            "serper", self.agent.announcements.get_announcements, symbol=symbol, since_days=since_days
+        )
         return [item.model_dump(mode="json") for item in items]
 
     def build_signal(self, symbol: str, equity: float = 1_000_000.0):
@@ -141,7 +147,7 @@ class ToolService:
                 f"entry={signal['entry']}, stop={signal['stop_loss']}, take={signal['take_profit']}\n"
                 f"position={signal['position_size_pct']:.2%}"
             )
-        return self.agent.notifier.send_text(body or "")
+        return self.agent.guarded("wecom", self.agent.notifier.send_text, content=body or "")
 
 
 def default_date_range(days: int = 60) -> tuple[str, str]:
@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from agent_search.config import AppConfig
+from agent_search.engine import TradingResearchAgent
+from agent_search.models import MarketBar, NewsItem
+from agent_search.storage import SQLiteStore
+
+
+class UptrendMarket:
+    """Forty rising daily bars ending on a volume spike: every symbol scores a BUY."""
+
+    def get_kline(self, symbol, start, end, adjust="qfq", period="daily"):
+        base = datetime(2026, 1, 1)
+        bars = []
+        for i in range(40):
+            price = 10 + i * 0.3
+            volume = 1_000_000 + i * 20_000
+            if i == 39:
+                volume *= 2.2
+            bars.append(
+                MarketBar(
+                    symbol=symbol,
+                    ts=base + timedelta(days=i),
+                    open=price - 0.2,
+                    high=price,
+                    low=price - 0.4,
+                    close=price,
+                    volume=volume,
+                    amount=volume * price,
+                    source="fake",
+                )
+            )
+        return bars
+
+
+class OrderNews:
+    def get_news(self, symbol, since_hours=48):
+        return [
+            NewsItem(
+                id=f"n-{symbol}",
+                symbol=symbol,
+                ts=datetime(2026, 2, 27),
+                title="公司中标新项目且订单增长",
+                url=f"https://finance.example.com/{symbol}",
+                source="finance.example.com",
+            )
+        ]
+
+
+class NoNews:
+    def get_news(self, symbol, since_hours=48):
+        return []
+
+
+class NoAnnouncements:
+    def get_announcements(self, symbol, since_days=7):
+        return []
+
+
+class SilentWecom:
+    def send_text(self, content, mentioned_list=None):
+        return {"ok": True}
+
+
+@pytest.fixture
+def uptrend_market() -> UptrendMarket:
+    return UptrendMarket()
+
+
+@pytest.fixture
+def order_news() -> OrderNews:
+    return OrderNews()
+
+
+@pytest.fixture
+def no_news() -> NoNews:
+    return NoNews()
+
+
+@pytest.fixture
+def no_announcements() -> NoAnnouncements:
+    return NoAnnouncements()
+
+
+@pytest.fixture
+def silent_wecom() -> SilentWecom:
+    return SilentWecom()
+
+
+@pytest.fixture
+def make_agent(tmp_path):
+    """Build an agent on ``tmp_path`` with quiet fakes for every connector the test does not pass.
+
+    Extra keyword arguments are config sections; ``results_dir`` and ``storage.db_path``
+    default to the test's tmp dir.
+    """
+
+    def make(
+        market_connector=None,
+        serper_connector=None,
+        announcement_connector=None,
+        notifier=None,
+        store=None,
+        bulk_announcements=None,
+        cls=TradingResearchAgent,
+        **settings,
+    ):
+        settings.setdefault("results_dir", str(tmp_path / "results"))
+        settings["storage"] = {"db_path": str(tmp_path / "agent.db"), **settings.get("storage", {})}
+        config = AppConfig.model_validate(settings)
+        return cls(
+            config=config,
+            market_connector=market_connector or UptrendMarket(),
+            serper_connector=serper_connector or NoNews(),
+            announcement_connector=announcement_connector or NoAnnouncements(),
+            notifier=notifier or SilentWecom(),
+            store=store or SQLiteStore(config.storage.db_path),
+            bulk_announcements=bulk_announcements,
+        )
+
+    return make
@@ -16,3 +16,81 @@ def test_map_hist_row() -> None:
     assert bar.open == 85.36
     assert bar.close == 83.6
     assert bar.volume == 1175500
+
+
+def test_get_spot_frame_normalizes_columns(monkeypatch) -> None:
+    import pandas as pd
+
+    raw = pd.DataFrame(
+        {
+            "代码": [" 002463", "600519"],
+            "名称": ["沪电股份", "贵州茅台"],
+            "最新价": [85.0, "-"],
+            "涨跌幅": [2.5, 0.0],
+            "成交量": [100, 0],
+            "成交额": [8.5e8, 0],
+            "量比": [1.8, None],
+            "换手率": [3.2, 0.0],
+        }
+    )
+
+    class _FakeAk:
+        @staticmethod
+        def stock_zh_a_spot_em():
+            return raw
+
+    monkeypatch.setattr(AkShareConnector, "_import_akshare", staticmethod(lambda: _FakeAk))
+    frame = AkShareConnector().get_spot_frame()
+    assert frame["symbol"].tolist() == ["002463", "600519"]
+    assert frame.loc[0, "volume_ratio"] == 1.8
+    assert pd.isna(frame.loc[1, "price"])
+    assert pd.isna(frame.loc[0, "open"])
+
+
+def test_realtime_quotes_share_one_snapshot(monkeypatch) -> None:
+    import threading
+
+    import pandas as pd
+
+    from agent_search.connectors.akshare_connector import SPOT_SNAPSHOT_CACHE
+
+    calls = {"count": 0}
+
+    class _FakeAk:
+        @staticmethod
+        def stock_zh_a_spot_em():
+            calls["count"] += 1
+            return pd.DataFrame(
+                {
+                    "代码": ["002463", "600519", "000001"],
+                    "名称": ["沪电股份", "贵州茅台", "平安银行"],
+                    "最新价": [85.0, "-", 11.2],
+                    "涨跌幅": [2.5, 0.0, -0.4],
+                    "成交量": [100, 0, 300],
+                    "成交额": [8.5e8, 0, 3.3e8],
+                    "今开": [83.0, "-", 11.3],
+                }
+            )
+
+    monkeypatch.setattr(AkShareConnector, "_import_akshare", staticmethod(lambda: _FakeAk))
+    SPOT_SNAPSHOT_CACHE.clear()
+    connector = AkShareConnector(spot_ttl_seconds=60)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(connector.get_realtime_quotes(["002463", "600519"])))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    SPOT_SNAPSHOT_CACHE.clear()
+
+    assert calls["count"] == 1
+    quotes = results[0]
+    assert sorted(quotes) == ["002463", "600519"]
+    assert quotes["002463"].price == 85.0
+    assert quotes["002463"].open == 83.0
+    assert quotes["002463"].high == 0.0
+    assert quotes["600519"].price == 0.0
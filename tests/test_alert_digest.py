@@ -0,0 +1,93 @@
+from datetime import date, datetime
+
+import pytest
+
+from agent_search.engine import TradingResearchAgent
+from agent_search.models import SignalAction, TradeSignal
+from agent_search.reporting import build_alert_digests
+
+
+class DigestWecom:
+    def __init__(self):
+        self.markdown = []
+
+    def send_text(self, content, mentioned_list=None):
+        raise AssertionError("digest mode must not send per-signal text alerts")
+
+    def send_markdown(self, content):
+        self.markdown.append(content)
+        return {"ok": True}
+
+
+def _signal(symbol: str, action: SignalAction = SignalAction.BUY) -> TradeSignal:
+    return TradeSignal(
+        id=f"s-{symbol}",
+        symbol=symbol,
+        ts=datetime(2026, 2, 27),
+        action=action,
+        entry=10.0,
+        stop_loss=9.5,
+        take_profit=11.2,
+        score=0.8,
+        confidence=0.7,
+        position_size_pct=0.05,
+        evidence_urls=[f"https://finance.example.com/{symbol}"],
+    )
+
+
+def test_digests_fill_messages_up_to_the_byte_limit() -> None:
+    signals = [_signal(f"{i:06d}", SignalAction.BUY if i % 2 else SignalAction.REDUCE) for i in range(40)]
+
+    messages = build_alert_digests(signals, date(2026, 2, 27), max_bytes=1024)
+
+    assert 1 < len(messages) < len(signals)
+    assert all(len(content.encode("utf-8")) <= 1024 for content, _ in messages)
+    assert [signal.symbol for _, batch in messages for signal in batch] == [signal.symbol for signal in signals]
+    assert messages[0][0].startswith(f"## A股信号汇总 2026-02-27 (1/{len(messages)})")
+    assert '<font color="warning">REDUCE</font>' in messages[0][0]
+    assert build_alert_digests([_signal("600519")], date(2026, 2, 27))[0][0].startswith("## A股信号汇总 2026-02-27\n")
+
+
+@pytest.fixture
+def digest_agent(make_agent, order_news) -> TradingResearchAgent:
+    return make_agent(
+        serper_connector=order_news,
+        notifier=DigestWecom(),
+        scan={"max_workers": 4},
+        alerts={"mode": "digest", "max_bytes": 1024},
+        rate_limit={"wecom": {"rate": 100, "burst": 10, "max_rate": 100}},
+    )
+
+
+def test_run_once_sends_one_paced_digest_for_all_signals(digest_agent) -> None:
+    agent = digest_agent
+    notifier = agent.notifier
+    symbols = [f"{i:06d}" for i in range(1, 6)]
+
+    result = agent.run_once(symbols=symbols)
+
+    assert result.alerts_sent == len(symbols)
+    assert len(notifier.markdown) == 1
+    assert all(symbol in notifier.markdown[0] for symbol in symbols)
+    assert "wecom" in agent._rate_limiters
+    stages = {item.stage for item in result.metrics}
+    assert "connector.send_markdown" in stages
+
+
+def test_iter_run_holds_alerts_for_the_closing_digest(digest_agent) -> None:
+    agent = digest_agent
+    notifier = agent.notifier
+    symbols = [f"{i:06d}" for i in range(1, 6)]
+
+    stream = agent.iter_run(symbols=symbols)
+    next(stream)
+    assert notifier.markdown == []
+    while True:
+        try:
+            next(stream)
+        except StopIteration as stop:
+            result = stop.value
+            break
+
+    assert result.alerts_sent == len(symbols)
+    assert len(notifier.markdown) == 1
@@ -0,0 +1,122 @@
+import threading
+import time
+
+from agent_search.outbox import AlertOutboxWorker
+from agent_search.storage import SQLiteStore
+
+
+class GatedWecom:
+    """Blocks every send until released, like a webhook stuck in retry backoff."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.sent = []
+
+    def send_text(self, content, mentioned_list=None):
+        self.release.wait(10)
+        self.sent.append(content)
+        return {"ok": True}
+
+
+class FlakyWecom:
+    def __init__(self, ok: bool):
+        self.ok = ok
+        self.sent = []
+
+    def send_text(self, content, mentioned_list=None):
+        if not self.ok:
+            return {"ok": False, "error": "wecom errcode=45009 errmsg=api freq out of limit"}
+        self.sent.append(content)
+        return {"ok": True}
+
+
+def test_run_once_only_queues_alerts(make_agent, order_news) -> None:
+    notifier = GatedWecom()
+    agent = make_agent(
+        serper_connector=order_news,
+        notifier=notifier,
+        alerts={"delivery": "outbox", "outbox_poll_seconds": 0.05},
+    )
+    agent.start_outbox()
+    symbols = ["000001", "000002", "000003"]
+
+    result = agent.run_once(symbols=symbols)
+    assert result.alerts_sent == len(symbols)
+    assert notifier.sent == []
+
+    notifier.release.set()
+    agent.close()
+    assert len(notifier.sent) == len(symbols)
+    assert agent.store.get_outbox_counts() == {"sent": len(symbols)}
+
+
+def test_queued_alerts_survive_restart_and_send_once(tmp_path) -> None:
+    db_path = tmp_path / "agent.db"
+    store = SQLiteStore(str(db_path))
+    assert store.enqueue_alert("text", "[A股信号] 002463 BUY", ["s1"])
+    assert not store.enqueue_alert("text", "[A股信号] 002463 BUY", ["s1"])
+
+    down = FlakyWecom(ok=False)
+    assert AlertOutboxWorker(db_path, down, backoff_seconds=0).drain_once(store) == 0
+    assert store.get_outbox_counts() == {"pending": 1}
+    store.close()
+
+    # A fresh process: new connection, new worker.
+    store = SQLiteStore(str(db_path))
+    up = FlakyWecom(ok=True)
+    worker = AlertOutboxWorker(db_path, up, backoff_seconds=0)
+    assert worker.drain_once(store) == 1
+    assert worker.drain_once(store) == 0
+    assert up.sent == ["[A股信号] 002463 BUY"]
+    assert store.get_outbox_counts() == {"sent": 1}
+
+
+def test_outbox_gives_up_after_max_attempts(tmp_path) -> None:
+    store = SQLiteStore(str(tmp_path / "agent.db"))
+    store.enqueue_alert("text", "hello", ["s1"])
+    worker = AlertOutboxWorker(store.db_path, FlakyWecom(ok=False), max_attempts=2, backoff_seconds=0)
+
+    worker.drain_once(store)
+    worker.drain_once(store)
+
+    assert store.get_outbox_counts() == {"failed": 1}
+
+
+def test_claimed_alert_is_leased(tmp_path) -> None:
+    store = SQLiteStore(str(tmp_path / "agent.db"))
+    store.enqueue_alert("text", "hello", ["s1"])
+
+    assert len(store.claim_alerts(lease_seconds=60)) == 1
+    assert store.claim_alerts(lease_seconds=60) == []
+    # The claimant died without reporting back: once the lease lapses another worker takes over.
+    assert [alert["attempts"] for alert in store.claim_alerts(lease_seconds=0)] == [2]
+
+
+class SlowWecom:
+    """Checks the outbox mid-send: only the alert being sent may be leased."""
+
+    def __init__(self, store):
+        self.store = store
+        self.leased = []
+
+    def send_text(self, content, mentioned_list=None):
+        self.leased.append(self.store.get_outbox_counts().get("sending", 0))
+        time.sleep(0.05)
+        return {"ok": True}
+
+
+def test_alerts_are_leased_one_at_a_time_and_stop_releases_cleanly(tmp_path) -> None:
+    store = SQLiteStore(str(tmp_path / "agent.db"))
+    for i in range(40):
+        store.enqueue_alert("text", f"alert {i}", [f"s{i}"])
+    notifier = SlowWecom(store)
+    worker = AlertOutboxWorker(store.db_path, notifier, poll_seconds=60, drain_seconds=0.2, store=store)
+
+    worker.start()
+    worker.stop()
+
+    counts = store.get_outbox_counts()
+    assert set(notifier.leased) == {1}
+    assert "sending" not in counts
+    assert 0 < counts["sent"] < 40 and counts["sent"] + counts["pending"] == 40
+    store.log_event("after_stop", {})  # the shared store is still usable
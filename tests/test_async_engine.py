@@ -0,0 +1,164 @@
+import asyncio
+import threading
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from agent_search.async_engine import AsyncTradingResearchAgent
+from agent_search.config import AppConfig
+from agent_search.connectors.announcement_connector import AnnouncementConnector
+from agent_search.connectors.resilience import CircuitBreaker
+from agent_search.engine import RunContext, TradingResearchAgent
+from agent_search.models import MarketBar, NewsItem
+from agent_search.storage import SQLiteStore
+
+SEARCH_RESULT = {
+    "organic": [
+        {"title": "关于回购股份的公告", "link": "https://www.cninfo.com.cn/a/1", "date": "2026-02-27"},
+    ]
+}
+
+
+class FakeMarket:
+    def get_kline(self, symbol, start, end, adjust="qfq", period="daily"):
+        base = datetime(2026, 1, 1)
+        return [
+            MarketBar(
+                symbol=symbol,
+                ts=base + timedelta(days=i),
+                open=10 + i * 0.2,
+                high=10.4 + i * 0.2,
+                low=9.8 + i * 0.2,
+                close=10.2 + i * 0.2,
+                volume=1_000_000 + i * 5_000,
+                amount=10_000_000,
+                source="fake",
+            )
+            for i in range(40)
+        ]
+
+
+class FakeSerper:
+    def _news(self, symbol):
+        return [
+            NewsItem(
+                id=f"news-{symbol}",
+                symbol=symbol,
+                ts=datetime(2026, 2, 27),
+                title="公司中标重大订单",
+                url=f"https://finance.example.com/{symbol}",
+                source="finance.example.com",
+            )
+        ]
+
+    def get_news(self, symbol, since_hours=48):
+        return self._news(symbol)
+
+    async def aget_news(self, symbol, since_hours=48):
+        await asyncio.sleep(0)
+        return self._news(symbol)
+
+    def search(self, query, num=10, kind="search"):
+        return SEARCH_RESULT
+
+    async def asearch(self, query, num=10, kind="search"):
+        await asyncio.sleep(0)
+        return SEARCH_RESULT
+
+    @staticmethod
+    def parse_time(raw, default=None):
+        return datetime(2026, 2, 27)
+
+
+class FakeWecom:
+    def __init__(self):
+        self.sent = []
+
+    def send_text(self, content, mentioned_list=None):
+        self.sent.append(content)
+        return {"ok": True}
+
+    async def asend_text(self, content, mentioned_list=None):
+        return self.send_text(content, mentioned_list)
+
+
+def _agent(cls, tmp_path, name):
+    config = AppConfig.model_validate(
+        {
+            "results_dir": str(tmp_path / name),
+            "storage": {"db_path": str(tmp_path / f"{name}.db")},
+        }
+    )
+    serper = FakeSerper()
+    return cls(
+        config=config,
+        market_connector=FakeMarket(),
+        serper_connector=serper,
+        announcement_connector=AnnouncementConnector(serper),
+        notifier=FakeWecom(),
+        store=SQLiteStore(config.storage.db_path),
+    )
+
+
+def test_async_run_once_matches_sync(tmp_path) -> None:
+    symbols = ["002463", "600519", "000858"]
+    sync_result = _agent(TradingResearchAgent, tmp_path, "sync").run_once(symbols=symbols)
+
+    async_agent = _agent(AsyncTradingResearchAgent, tmp_path, "async")
+    async_result = asyncio.run(async_agent.arun_once(symbols=symbols))
+
+    fields = {"symbol", "action", "entry", "stop_loss", "score", "confidence", "reasons", "evidence_urls"}
+    assert [s.model_dump(include=fields) for s in async_result.signals] == [
+        s.model_dump(include=fields) for s in sync_result.signals
+    ]
+    assert async_result.alerts_sent == sync_result.alerts_sent
+    assert async_result.risk_state == sync_result.risk_state
+    assert len(async_agent.notifier.sent) == async_result.alerts_sent
+
+
+def test_async_agent_keeps_the_sync_entry_points(tmp_path) -> None:
+    symbols = ["002463", "600519"]
+    agent = _agent(AsyncTradingResearchAgent, tmp_path, "async")
+
+    # run_market_scan and AgentScheduler call run_once synchronously.
+    result = agent.run_once(symbols=symbols)
+
+    assert [signal.symbol for signal in result.signals] == symbols
+
+
+def test_cancelled_half_open_trial_frees_the_breaker(tmp_path) -> None:
+    now = [0.0]
+    agent = _agent(AsyncTradingResearchAgent, tmp_path, "async")
+    breaker = CircuitBreaker("serper", failure_threshold=1, reset_seconds=60, clock=lambda: now[0])
+    agent._breakers["serper"] = breaker
+    breaker.record_failure()
+    now[0] = 61.0
+    ctx = RunContext(today=date(2026, 2, 27), start="20260101", end="20260227", equity=0.0, risk_state=None)
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    async def trial():
+        await asyncio.wait_for(agent._acall_source(ctx, "serper", hang()), timeout=0.05)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(trial())
+
+    # The abandoned trial is neither a success nor a failure; the next caller may try again.
+    breaker.before_call()
+    assert breaker.is_open
+
+
+def test_aclose_runs_the_blocking_close_off_the_loop(tmp_path) -> None:
+    agent = _agent(AsyncTradingResearchAgent, tmp_path, "async")
+    loop_threads = []
+    close = agent.close
+    agent.close = lambda: loop_threads.append(threading.get_ident()) or close()
+
+    async def main():
+        await agent.aclose()
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(main())
+
+    assert len(loop_threads) == 1 and loop_threads[0] != loop_thread
@@ -0,0 +1,114 @@
+import math
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from agent_search.backtest.engine import BacktestEngine
+from agent_search.config import AppConfig
+from agent_search.models import MarketBar
+from agent_search.series import BarSeries
+from agent_search.storage import BarArchive, SQLiteStore
+
+
+def _bars(symbol: str, count: int = 80, shift: float = 0.0) -> list[MarketBar]:
+    start = datetime(2026, 1, 1)
+    return [
+        MarketBar(
+            symbol=symbol,
+            ts=start + timedelta(days=i),
+            open=10 + math.sin(i / 3) + shift,
+            high=10.6 + math.sin(i / 3) + i * 0.01 + shift,
+            low=9.5 + math.sin(i / 3) + shift,
+            close=10.2 + math.sin(i / 3) + i * 0.02 + shift,
+            volume=1_000_000 + (i % 7) * 90_000,
+            amount=10_000_000 + i,
+            source="akshare",
+        )
+        for i in range(count)
+    ]
+
+
+def test_sync_exports_and_reads_through_mmap(tmp_path) -> None:
+    store = SQLiteStore(str(tmp_path / "agent.db"))
+    store.save_market_bars(_bars("002463"))
+    store.save_market_bars(_bars("600519", 30))
+    archive = BarArchive(tmp_path / "bars")
+
+    assert archive.sync(store) == {"written": 2, "unchanged": 0, "removed": 0, "rows": 110}
+
+    series = BarArchive(tmp_path / "bars").get_bar_series("002463", "2026-01-05", "2026-01-10")
+    assert series.to_bars() == store.get_market_bars("002463", "2026-01-05", "2026-01-10")
+    assert not series.close.flags.owndata and not series.ts.flags.owndata
+    assert len(archive.get_bar_series("300750", "2026-01-01", "2026-12-31")) == 0
+
+
+def test_sync_rewrites_only_changed_symbols_and_drops_removed_ones(tmp_path) -> None:
+    store = SQLiteStore(str(tmp_path / "agent.db"))
+    store.save_market_bars(_bars("002463"))
+    store.save_market_bars(_bars("600519", 30))
+    archive = BarArchive(tmp_path / "bars")
+    archive.sync(store)
+
+    # An intraday refresh overwrites the last bar in place: same row count, new close.
+    store.save_market_bars(_bars("600519", 30, shift=0.5)[-1:])
+    assert archive.sync(store) == {"written": 1, "unchanged": 1, "removed": 0, "rows": 30}
+    last = archive.get_bar_series("600519", "2026-01-30", "2026-01-30")
+    assert last.close.tolist() == [_bars("600519", 30, shift=0.5)[-1].close]
+
+    store.conn.execute("DELETE FROM market_bars WHERE symbol='002463'")
+    store.conn.commit()
+    assert archive.sync(store)["removed"] == 1
+    assert "002463" not in archive and not (tmp_path / "bars" / "002463.npy").exists()
+
+
+class SourceOnlyForBenchmark:
+    def get_kline_series(self, symbol, start, end, adjust="qfq", period="daily"):
+        assert adjust == "", "qfq history should come from the bar archive"
+        return BarSeries.from_bars(_bars(symbol))
+
+
+def test_backtest_reads_history_from_the_archive(tmp_path) -> None:
+    store = SQLiteStore(str(tmp_path / "agent.db"))
+    store.save_market_bars(_bars("002463"))
+    archive = BarArchive(tmp_path / "bars")
+    archive.sync(store)
+
+    result = BacktestEngine(
+        config=AppConfig(), market_connector=SourceOnlyForBenchmark(), bar_archive=archive
+    ).run(symbols=["002463"], start="2026-01-01", end="2026-03-31")
+
+    assert result.details["days"] == 59
+    assert np.isfinite(result.total_return)
+
+
+class RecordingSource:
+    def __init__(self):
+        self.calls = []
+
+    def get_kline_series(self, symbol, start, end, adjust="qfq", period="daily"):
+        self.calls.append((symbol, adjust))
+        return BarSeries.from_bars(_bars(symbol))
+
+
+def test_backtest_falls_back_when_the_archive_only_holds_the_scan_window(tmp_path) -> None:
+    store = SQLiteStore(str(tmp_path / "agent.db"))
+    store.save_market_bars(_bars("002463")[40:])
+    archive = BarArchive(tmp_path / "bars")
+    archive.sync(store)
+    market = RecordingSource()
+
+    BacktestEngine(config=AppConfig(), market_connector=market, bar_archive=archive).run(
+        symbols=["002463"], start="2026-01-01", end="2026-03-21"
+    )
+
+    assert ("002463", "qfq") in market.calls
+
+
+def test_archive_coverage_counts_days_on_the_exchange_calendar() -> None:
+    ahead = BacktestEngine(config=AppConfig(timezone="Etc/GMT-14"), market_connector=RecordingSource())
+    behind = BacktestEngine(config=AppConfig(timezone="Etc/GMT+12"), market_connector=RecordingSource())
+
+    # UTC+14 and UTC-12 never share a calendar date, whatever the host clock's zone.
+    assert ahead._today() == datetime.now(ZoneInfo("Etc/GMT-14")).date()
+    assert ahead._today() - behind._today() in (timedelta(days=1), timedelta(days=2))
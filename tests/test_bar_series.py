@@ -0,0 +1,101 @@
+import math
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from agent_search.backtest.engine import BacktestEngine
+from agent_search.config import AppConfig
+from agent_search.connectors.akshare_connector import AkShareConnector
+from agent_search.models import MarketBar
+from agent_search.series import BarSeries
+from agent_search.storage import SQLiteStore
+from agent_search.strategy.factors import compute_technical_score
+
+
+def _bars(count: int = 60) -> list[MarketBar]:
+    start = datetime(2026, 1, 1)
+    return [
+        MarketBar(
+            symbol="002463",
+            ts=start + timedelta(days=i),
+            open=10 + math.sin(i / 3),
+            high=10.6 + math.sin(i / 3) + i * 0.01,
+            low=9.5 + math.sin(i / 3),
+            close=10.2 + math.sin(i / 3) + i * 0.02,
+            volume=1_000_000 + (i % 7) * 90_000,
+            amount=10_000_000 + i,
+            source="akshare",
+        )
+        for i in range(count)
+    ]
+
+
+def test_kline_series_from_frame_is_sorted_and_round_trips(monkeypatch) -> None:
+    frame = pd.DataFrame(
+        {
+            "日期": ["2026-02-27", "2026-02-26"],
+            "开盘": [85.36, 84.0],
+            "最高": [85.8, 85.0],
+            "最低": [82.5, 83.1],
+            "收盘": [83.6, 84.9],
+            "成交量": [1175500, 990000],
+            "成交额": [9.8e9, 8.1e9],
+        }
+    )
+
+    class _FakeAk:
+        @staticmethod
+        def stock_zh_a_hist(**kwargs):
+            return frame
+
+    monkeypatch.setattr(AkShareConnector, "_import_akshare", staticmethod(lambda: _FakeAk))
+    connector = AkShareConnector()
+    series = connector.get_kline_series("002463", "2026-02-01", "2026-02-28")
+
+    assert series.close.tolist() == [84.9, 83.6]
+    bars = connector.get_kline("002463", "2026-02-01", "2026-02-28")
+    assert [bar.ts for bar in bars] == [datetime(2026, 2, 26), datetime(2026, 2, 27)]
+    assert bars[1] == AkShareConnector.map_hist_row("002463", frame.iloc[0].to_dict())
+
+
+def test_factors_match_between_bar_lists_and_series() -> None:
+    bars = _bars()
+    series = BarSeries.from_bars(bars)
+
+    for end in (1, 15, 21, 30, 60):
+        list_score, list_reasons, list_snapshot = compute_technical_score(bars[:end])
+        series_score, series_reasons, series_snapshot = compute_technical_score(series[:end])
+        assert list_score == series_score
+        assert list_reasons == series_reasons
+        assert list_snapshot == series_snapshot
+
+
+def test_store_round_trips_bar_series(tmp_path) -> None:
+    store = SQLiteStore(str(tmp_path / "agent.db"))
+    bars = _bars(10)
+    store.save_market_bars(BarSeries.from_bars(bars))
+
+    assert store.get_market_bars("002463", "2026-01-01", "2026-01-10") == bars
+    series = store.get_bar_series("002463", "2026-01-03", "2026-01-04")
+    assert series.to_bars() == bars[2:4]
+
+
+class SeriesMarket:
+    def __init__(self):
+        self.list_calls = 0
+
+    def get_kline_series(self, symbol, start, end, adjust="qfq", period="daily"):
+        return BarSeries.from_bars(_bars(80))
+
+    def get_kline(self, *args, **kwargs):
+        self.list_calls += 1
+        raise AssertionError("backtest should use the columnar path")
+
+
+def test_backtest_consumes_bar_series() -> None:
+    market = SeriesMarket()
+    result = BacktestEngine(config=AppConfig(), market_connector=market).run(
+        symbols=["002463"], start="2026-01-01", end="2026-03-31"
+    )
+    assert result.details["days"] == 59
+    assert market.list_calls == 0
@@ -0,0 +1,183 @@
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from agent_search.connectors import BulkAnnouncementConnector
+from agent_search.engine import TradingResearchAgent
+from agent_search.models import MarketBar
+
+SHANGHAI = ZoneInfo("Asia/Shanghai")
+
+
+def _row(symbol: str, title: str, ts: datetime, n: int) -> dict:
+    return {
+        "secCode": symbol,
+        "announcementTitle": f"<em>{title}</em>",
+        "announcementTime": int(ts.timestamp() * 1000),
+        "adjunctUrl": f"finalpage/{ts.date().isoformat()}/{n}.PDF",
+    }
+
+
+class _Resp:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self.payload
+
+
+class StubEndpoint:
+    """Paged per exchange column and filtered by ``seDate`` like cninfo's full-text announcement list."""
+
+    def __init__(self):
+        self.calls = []
+        now = datetime.now(timezone.utc) - timedelta(hours=1)
+        self.rows = {
+            "szse": [
+                _row("002463", "关于回购股份的公告", now, 1),
+                _row("000001", "年度报告", now, 2),
+                _row("002463", "董事会决议公告", now - timedelta(days=2), 3),
+            ],
+            "sse": [_row("600519", "关于分红派息的公告", now, 4)],
+        }
+
+    def post(self, url, data=None, timeout=None):
+        self.calls.append((url, data["column"], data["pageNum"], data["seDate"]))
+        first, last = data["seDate"].split("~")
+        rows = [
+            row
+            for row in self.rows.get(data["column"], [])
+            if first <= datetime.fromtimestamp(row["announcementTime"] / 1000, SHANGHAI).date().isoformat() <= last
+        ]
+        size, page = data["pageSize"], data["pageNum"]
+        return _Resp({"announcements": rows[(page - 1) * size : page * size], "hasMore": page * size < len(rows)})
+
+    def close(self):
+        return None
+
+
+class QuietMarket:
+    def get_kline(self, symbol, start, end, adjust="qfq", period="daily"):
+        last = datetime.fromisoformat(end) - timedelta(days=1)
+        return [
+            MarketBar(
+                symbol=symbol,
+                ts=last - timedelta(days=39 - i),
+                open=10 + i * 0.1,
+                high=10.3 + i * 0.1,
+                low=9.9 + i * 0.1,
+                close=10.2 + i * 0.1,
+                volume=1_000_000,
+                amount=10_000_000,
+                source="akshare",
+            )
+            for i in range(40)
+        ]
+
+
+class ForbiddenAnnouncements:
+    def get_announcements(self, symbol, since_days=7):
+        raise AssertionError("bulk mode must not search per symbol")
+
+
+def test_fetch_day_pages_through_every_column() -> None:
+    endpoint = StubEndpoint()
+    connector = BulkAnnouncementConnector(endpoint_url="http://stub/query", session=endpoint, page_size=1)
+    day = (datetime.now(timezone.utc) - timedelta(hours=1)).astimezone(SHANGHAI).date()
+
+    items, complete = connector.fetch_day(day)
+
+    assert complete
+    assert sorted(item.symbol for item in items) == ["000001", "002463", "600519"]
+    assert [(column, page) for _, column, page, _ in endpoint.calls] == [("szse", 1), ("szse", 2), ("sse", 1)]
+    assert all(url == "http://stub/query" and se_date == f"{day}~{day}" for url, _, _, se_date in endpoint.calls)
+    first = next(item for item in items if item.title == "关于回购股份的公告")
+    assert first.url == f"http://static.cninfo.com.cn/finalpage/{first.ts.date().isoformat()}/1.PDF"
+    assert first.source == "cninfo"
+
+
+def test_fetch_day_reports_a_column_cut_off_by_max_pages() -> None:
+    connector = BulkAnnouncementConnector(session=StubEndpoint(), page_size=1, max_pages=1)
+    day = (datetime.now(timezone.utc) - timedelta(hours=1)).astimezone(SHANGHAI).date()
+
+    items, complete = connector.fetch_day(day)
+
+    assert not complete
+    assert len(items) == 2
+
+
+def test_run_once_reads_announcements_from_store(make_agent) -> None:
+    endpoint = StubEndpoint()
+    agent = _bulk_agent(make_agent, BulkAnnouncementConnector(session=endpoint), announcements={"mode": "bulk"})
+
+    result = agent.run_once(symbols=["002463", "600519"])
+    # One query per column for each of the since_days + 1 days; none of them needs a second page.
+    assert len(endpoint.calls) == 2 * 8
+    stored = agent.store.get_announcements(["002463", "600519"], datetime.now(timezone.utc) - timedelta(days=7))
+    assert [item.title for item in stored["002463"]] == ["关于回购股份的公告", "董事会决议公告"]
+    assert len(stored["600519"]) == 1
+    assert "000001" not in stored
+    assert any("cninfo" in url for signal in result.signals for url in signal.evidence_urls)
+    news_rows = agent.store.conn.execute("SELECT COUNT(*) FROM news_items").fetchone()[0]
+    assert news_rows == 0
+
+    agent.run_once(symbols=["002463", "600519"])
+    assert len(endpoint.calls) == 2 * 8  # today's list is still fresh
+
+
+def _bulk_agent(make_agent, connector: BulkAnnouncementConnector, **settings) -> TradingResearchAgent:
+    settings.setdefault("announcements", {"mode": "bulk", "since_days": 0})
+    return make_agent(
+        market_connector=QuietMarket(),
+        announcement_connector=ForbiddenAnnouncements(),
+        bulk_announcements=connector,
+        **settings,
+    )
+
+
+def test_truncated_day_is_not_marked_as_fetched(make_agent) -> None:
+    endpoint = StubEndpoint()
+    agent = _bulk_agent(make_agent, BulkAnnouncementConnector(session=endpoint, page_size=1, max_pages=1))
+    today = agent._now().date()
+    if (datetime.now(timezone.utc) - timedelta(hours=1)).astimezone(SHANGHAI).date() != today:
+        pytest.skip("stub rows fall on yesterday right after local midnight")
+
+    agent.run_once(symbols=["002463"])
+    assert agent.store.get_announcement_ingest([today]) == {}
+    events = agent.store.conn.execute("SELECT payload FROM audit_logs WHERE event='announcement_ingest_truncated'")
+    assert len(events.fetchall()) == 1
+
+    calls = len(endpoint.calls)
+    agent.run_once(symbols=["002463"])
+    assert len(endpoint.calls) == 2 * calls  # the day is queried again instead of being treated as complete
+
+
+def test_ingest_pages_go_through_the_cninfo_limiter_and_breaker(make_agent) -> None:
+    endpoint = StubEndpoint()
+    agent = _bulk_agent(
+        make_agent,
+        BulkAnnouncementConnector(session=endpoint),
+        announcements={"mode": "bulk", "since_days": 1},
+        rate_limit={"enabled": True, "cninfo": {"rate": 1000, "burst": 1000, "max_rate": 1000}},
+        resilience={"breaker_failures": 1, "breaker_reset_seconds": 600},
+    )
+    acquired = []
+    limiter = agent._rate_limiters["cninfo"]
+    original = limiter.acquire
+    limiter.acquire = lambda *args, **kwargs: acquired.append(1) or original(*args, **kwargs)
+
+    result = agent.run_once(symbols=["002463"])
+
+    stages = {(item.stage, item.source): item for item in result.metrics}
+    assert stages[("connector.fetch_page", "cninfo")].count == len(endpoint.calls) == 4
+    assert len(acquired) == 4
+
+    # An open cninfo circuit stops the ingest instead of hammering the endpoint.
+    agent._breakers["cninfo"].record_failure()
+    agent.store.conn.execute("DELETE FROM announcement_ingest")
+    agent.run_once(symbols=["002463"])
+    assert len(endpoint.calls) == 4
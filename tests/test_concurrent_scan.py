@@ -0,0 +1,91 @@
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+
+from agent_search.models import MarketBar
+
+
+class _Gauge:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def __enter__(self):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+
+    def __exit__(self, *exc):
+        with self.lock:
+            self.active -= 1
+
+
+class SlowMarket:
+    def __init__(self):
+        self.gauge = _Gauge()
+
+    def get_kline(self, symbol, start, end, adjust="qfq", period="daily"):
+        with self.gauge:
+            if symbol == "000002":
+                raise RuntimeError("upstream down")
+            base = datetime(2026, 1, 1)
+            return [
+                MarketBar(
+                    symbol=symbol,
+                    ts=base + timedelta(days=i),
+                    open=10 + i * 0.1,
+                    high=10.3 + i * 0.1,
+                    low=9.8 + i * 0.1,
+                    close=10.1 + i * 0.1,
+                    volume=1_000_000,
+                    amount=10_000_000,
+                    source="fake",
+                )
+                for i in range(30)
+            ]
+
+
+class SlowSerper:
+    def __init__(self):
+        self.gauge = _Gauge()
+
+    def get_news(self, symbol, since_hours=48):
+        with self.gauge:
+            return []
+
+
+class SlowAnnouncements:
+    def __init__(self, gauge):
+        self.gauge = gauge
+
+    def get_announcements(self, symbol, since_days=7):
+        with self.gauge:
+            return []
+
+
+def test_concurrent_run_once_keeps_order_and_limits(make_agent) -> None:
+    market = SlowMarket()
+    serper = SlowSerper()
+    agent = make_agent(
+        market_connector=market,
+        serper_connector=serper,
+        announcement_connector=SlowAnnouncements(serper.gauge),
+        scan={"max_workers": 8, "akshare_concurrency": 2, "serper_concurrency": 3},
+    )
+
+    symbols = [f"{i:06d}" for i in range(1, 13)]
+    result = agent.run_once(symbols=symbols)
+
+    assert [signal.symbol for signal in result.signals] == symbols
+    assert market.gauge.peak == 2
+    assert 1 < serper.gauge.peak <= 3
+
+    failed = result.signals[1]
+    assert failed.low_confidence is True
+    assert any("行情获取失败" in reason for reason in failed.reasons)
+
+    payload = json.loads(open(result.output_json, encoding="utf-8").read())
+    assert [item["symbol"] for item in payload] == symbols
@@ -0,0 +1,25 @@
+import sys
+from pathlib import Path
+
+from agent_search.config import _simple_yaml_parse, load_config
+
+CONFIG = Path(__file__).resolve().parents[1] / "config" / "config.yaml"
+
+
+def test_shipped_config_loads_without_pyyaml(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "yaml", None)
+
+    config = load_config(CONFIG)
+
+    assert config.schedule.intraday_mode == "full"
+    assert config.schedule.pre_open == "09:05"
+    assert config.announcements.columns == ["szse", "sse"]
+    assert config.announcements.endpoint_url.startswith("http://www.cninfo.com.cn/")
+    assert config.resilience.hedge_sources == []
+    assert config.retention.audit_days == 30
+
+
+def test_fallback_parser_keeps_hashes_inside_quotes() -> None:
+    payload = _simple_yaml_parse('a:\n  b: "x # y"  # note\n  c: [1, 2.5, on]\n')
+
+    assert payload == {"a": {"b": "x # y", "c": [1, 2.5, "on"]}}
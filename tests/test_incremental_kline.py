@@ -0,0 +1,57 @@
+from datetime import date, datetime, timedelta
+
+from agent_search.models import MarketBar
+
+
+class DailyMarket:
+    def __init__(self):
+        self.calls = []
+        self.factor = 1.0
+
+    def get_kline(self, symbol, start, end, adjust="qfq", period="daily"):
+        self.calls.append((symbol, start, end))
+        day = date.fromisoformat(start)
+        last = date.fromisoformat(end)
+        bars = []
+        while day <= last:
+            price = (10 + (day.toordinal() % 50) * 0.1) * self.factor
+            bars.append(
+                MarketBar(
+                    symbol=symbol,
+                    ts=datetime.combine(day, datetime.min.time()),
+                    open=price,
+                    high=price + 0.2,
+                    low=price - 0.2,
+                    close=price + 0.1,
+                    volume=1_000_000,
+                    amount=10_000_000,
+                    source="fake",
+                )
+            )
+            day += timedelta(days=1)
+        return bars
+
+
+def test_incremental_kline_fetches_tail_and_detects_qfq_change(make_agent) -> None:
+    market = DailyMarket()
+    agent = make_agent(market_connector=market, scan={"incremental_kline": True, "kline_lookback_days": 60})
+    start, end = agent._date_range(lookback_days=60)
+
+    first = agent.run_once(symbols=["002463"])
+    assert market.calls == [("002463", start, end)]
+
+    second = agent.run_once(symbols=["002463"])
+    assert market.calls[-1] == ("002463", end, end)
+    assert second.signals[0].entry == first.signals[0].entry
+    assert len(agent.store.get_market_bars("002463", start, end)) == 61
+
+    market.factor = 0.9
+    agent.store.conn.execute("DELETE FROM market_bars WHERE ts >= ?", (f"{end}T00:00:00",))
+    market.calls.clear()
+    agent.run_once(symbols=["002463"])
+    yesterday = (date.fromisoformat(end) - timedelta(days=1)).isoformat()
+    assert market.calls == [("002463", yesterday, end), ("002463", start, end)]
+
+    market.calls.clear()
+    agent.run_once(symbols=["002463"], full_refresh=True)
+    assert market.calls == [("002463", start, end)]
@@ -0,0 +1,153 @@
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from agent_search.connectors import RealtimeQuote
+from agent_search.connectors.trading_calendar import TradingCalendar
+from agent_search.models import MarketBar, NewsItem
+
+
+class SnapshotMarket:
+    def __init__(self):
+        self.kline_calls = 0
+        self.snapshot_calls = 0
+
+    def get_kline(self, symbol, start, end, adjust="qfq", period="daily"):
+        self.kline_calls += 1
+        last = datetime.fromisoformat(end) - timedelta(days=1)
+        return [
+            MarketBar(
+                symbol=symbol,
+                ts=last - timedelta(days=39 - i),
+                open=10 + i * 0.1,
+                high=10.3 + i * 0.1,
+                low=9.9 + i * 0.1,
+                close=10.2 + i * 0.1,
+                volume=1_000_000,
+                amount=10_000_000,
+                source="akshare",
+            )
+            for i in range(40)
+        ]
+
+    def get_realtime_quotes(self, symbols):
+        self.snapshot_calls += 1
+        return {
+            "002463": RealtimeQuote(
+                symbol="002463",
+                price=15.5,
+                change_pct=3.0,
+                volume=2_000_000,
+                amount=30_000_000,
+                open=14.2,
+                high=15.8,
+                low=14.1,
+                prev_close=14.1,
+            )
+        }
+
+
+class StoredNewsSerper:
+    def get_news(self, symbol, since_hours=48):
+        return [
+            NewsItem(
+                id=f"n-{symbol}",
+                symbol=symbol,
+                ts=datetime.now().astimezone(),
+                title="公司中标重大订单",
+                url=f"https://finance.example.com/{symbol}",
+                source="finance.example.com",
+            )
+        ]
+
+
+def test_run_intraday_patches_snapshot_onto_stored_history(make_agent) -> None:
+    market = SnapshotMarket()
+    agent = make_agent(market_connector=market, serper_connector=StoredNewsSerper())
+    symbols = ["002463", "600519"]
+    agent.run_once(symbols=symbols)
+    assert market.kline_calls == 2
+
+    result = agent.run_intraday(symbols=symbols)
+    assert market.kline_calls == 2
+    assert market.snapshot_calls == 1
+
+    patched, missing = result.signals
+    assert patched.entry == 15.5
+    assert patched.evidence_urls == ["https://finance.example.com/002463"]
+    assert missing.entry is not None
+    assert missing.low_confidence is True
+    assert "实时行情缺失，使用最近收盘数据" in missing.reasons
+
+    # The unfinished bar is only scanned, never stored as today's daily bar.
+    _, end = agent._date_range(lookback_days=1)
+    assert agent.store.get_market_bars("002463", end, end) == []
+
+
+class CalendarMarket(SnapshotMarket):
+    """Every calendar day is a session (or only weekdays), so the last one before today is yesterday."""
+
+    def __init__(self, weekdays_only=False):
+        super().__init__()
+        self.kline_starts = []
+        self.weekdays_only = weekdays_only
+
+    def get_kline(self, symbol, start, end, adjust="qfq", period="daily"):
+        self.kline_starts.append(start)
+        return self.bars(symbol, start, end)
+
+    @staticmethod
+    def bars(symbol, start, end):
+        # Prices depend on the date only, so a tail fetch overlaps the stored history exactly.
+        first, last = datetime.fromisoformat(start), datetime.fromisoformat(end)
+        days = [first + timedelta(days=i) for i in range((last - first).days)]
+        return [
+            MarketBar(
+                symbol=symbol,
+                ts=day,
+                open=10 + (day.toordinal() % 100) * 0.01,
+                high=10.3 + (day.toordinal() % 100) * 0.01,
+                low=9.9 + (day.toordinal() % 100) * 0.01,
+                close=10.2 + (day.toordinal() % 100) * 0.01,
+                volume=1_000_000,
+                amount=10_000_000,
+                source="akshare",
+            )
+            for day in days
+        ]
+
+    def trading_calendar(self, today=None):
+        days = [today - timedelta(days=offset) for offset in range(90)]
+        return TradingCalendar(day for day in days if not self.weekdays_only or day.weekday() < 5)
+
+
+def test_run_intraday_fetches_the_tail_when_stored_history_is_stale(make_agent) -> None:
+    market = CalendarMarket()
+    agent = make_agent(market_connector=market, serper_connector=StoredNewsSerper())
+    today = agent._now().date()
+    start, end = agent._date_range(lookback_days=agent.config.scan.kline_lookback_days)
+    history = CalendarMarket.bars("002463", start, (today - timedelta(days=4)).isoformat())
+    agent.store.save_market_bars(history)
+
+    result = agent.run_intraday(symbols=["002463"])
+
+    assert market.kline_starts == [history[-1].ts.date().isoformat()]
+    stored = agent.store.get_market_bars("002463", start, end)
+    assert stored[-1].ts.date() == today - timedelta(days=1)
+    assert result.signals[0].entry == 15.5
+
+
+def test_run_intraday_on_a_weekend_keeps_the_last_session(make_agent) -> None:
+    market = CalendarMarket(weekdays_only=True)
+    agent = make_agent(market_connector=market, serper_connector=StoredNewsSerper())
+    saturday = datetime(2026, 10, 17, 10, 30, tzinfo=ZoneInfo(agent.config.timezone))
+    agent._now = lambda: saturday
+    start, end = agent._date_range(lookback_days=agent.config.scan.kline_lookback_days)
+    history = CalendarMarket.bars("002463", start, "2026-10-17")
+    agent.store.save_market_bars(history)
+
+    result = agent.run_intraday(symbols=["002463"])
+
+    assert market.snapshot_calls == 0
+    assert agent.store.get_market_bars("002463", "2026-10-17", "2026-10-17") == []
+    assert result.signals[0].entry == history[-1].close
+    assert "实时行情缺失，使用最近收盘数据" not in result.signals[0].reasons
@@ -0,0 +1,44 @@
+import json
+
+
+class RecordingWecom:
+    def __init__(self):
+        self.sent = []
+
+    def send_text(self, content, mentioned_list=None):
+        self.sent.append(content)
+        return {"ok": True}
+
+
+def test_iter_run_streams_signals_and_alerts(make_agent, order_news) -> None:
+    notifier = RecordingWecom()
+    agent = make_agent(
+        serper_connector=order_news,
+        notifier=notifier,
+        scan={"max_workers": 4, "signal_batch_size": 2},
+    )
+    symbols = [f"{i:06d}" for i in range(1, 8)]
+
+    stream = agent.iter_run(symbols=symbols)
+    first = next(stream)
+    assert first.action == "BUY"
+    assert len(notifier.sent) == 1
+    assert agent.store.get_signal_by_id(first.id) is not None
+
+    seen = [first.symbol]
+    while True:
+        try:
+            seen.append(next(stream).symbol)
+        except StopIteration as stop:
+            result = stop.value
+            break
+
+    assert sorted(seen) == symbols
+    assert result.alerts_sent == len(symbols)
+    assert result.signals == []
+    assert len(agent.get_daily_signals(result.date)) == len(symbols)
+
+    payload = json.loads(open(result.output_json, encoding="utf-8").read())
+    assert [item["symbol"] for item in payload] == seen
+    markdown = open(result.output_markdown, encoding="utf-8").read()
+    assert markdown.count("### ") == len(symbols)
@@ -0,0 +1,103 @@
+import json
+import sqlite3
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from agent_search.cli import build_parser
+from agent_search.config import RetentionConfig
+from agent_search.maintenance import run_maintenance
+from agent_search.models import NewsItem
+from agent_search.storage import SQLiteStore
+
+TODAY = date(2026, 10, 17)
+
+
+def _log(store: SQLiteStore, day: date, event: str, payload: dict, copies: int = 1) -> None:
+    store._executemany(
+        "INSERT INTO audit_logs (ts, event, payload) VALUES (?, ?, ?)",
+        [(f"{day.isoformat()}T08:00:00", event, json.dumps(payload))] * copies,
+    )
+
+
+def _news(symbol: str, day: date) -> NewsItem:
+    return NewsItem(
+        id=f"{symbol}-{day}",
+        symbol=symbol,
+        ts=datetime.combine(day, datetime.min.time()),
+        title="公司公告",
+        url=f"https://finance.example.com/{symbol}/{day}",
+        source="finance.example.com",
+    )
+
+
+def test_rollups_survive_pruning_and_are_idempotent(tmp_path) -> None:
+    store = SQLiteStore(str(tmp_path / "agent.db"))
+    old, recent = TODAY - timedelta(days=40), TODAY - timedelta(days=3)
+    _log(store, old, "run_once_end", {"duration_ms": 100.0})
+    _log(store, old, "run_once_end", {"duration_ms": 300.0})
+    _log(store, old, "market_error", {"error": "timeout"})
+    _log(store, recent, "run_once_end", {"duration_ms": 50.0})
+    _log(store, TODAY, "run_once_start", {})
+    store.save_news_items([_news("002463", old), _news("002463", recent)])
+
+    retention = RetentionConfig(audit_days=30, news_days=30)
+    report = run_maintenance(store, retention, TODAY, vacuum="none")
+    assert report["deleted"] == {"audit_logs": 3, "news_items": 1, "announcements": 0, "announcement_ingest": 0}
+    run_maintenance(store, retention, TODAY, vacuum="none")
+
+    assert store.get_audit_rollups() == [
+        {"day": old.isoformat(), "event": "market_error", "count": 1, "avg_ms": None, "max_ms": None},
+        {"day": old.isoformat(), "event": "run_once_end", "count": 2, "avg_ms": 200.0, "max_ms": 300.0},
+        {"day": recent.isoformat(), "event": "run_once_end", "count": 1, "avg_ms": 50.0, "max_ms": 50.0},
+    ]
+    assert store.conn.execute("SELECT COUNT(*) FROM audit_logs").fetchone()[0] == 2
+    assert [item.id for item in store.get_news_items("002463", datetime(2026, 1, 1))] == [f"002463-{recent}"]
+
+
+def test_incremental_vacuum_reclaims_pruned_pages(tmp_path) -> None:
+    store = SQLiteStore(str(tmp_path / "agent.db"), journal_mode="wal")
+    _log(store, TODAY - timedelta(days=60), "wecom_alert", {"result": "x" * 4000}, copies=500)
+    store.compact("none")
+
+    report = run_maintenance(store, RetentionConfig(audit_days=30), TODAY)
+
+    assert report["vacuum"] == "incremental"
+    assert report["deleted"]["audit_logs"] == 500
+    assert report["reclaimed_bytes"] > 1_000_000
+    assert report["bytes_after"] == (tmp_path / "agent.db").stat().st_size
+
+
+def test_existing_database_is_converted_by_one_full_vacuum(tmp_path) -> None:
+    db_path = tmp_path / "old.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE legacy (id INTEGER)")
+    store = SQLiteStore(str(db_path))
+
+    assert store.compact() == "full"
+    assert store.compact() == "incremental"
+    assert store.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+
+def test_news_retention_keeps_the_scan_window() -> None:
+    with pytest.raises(ValueError):
+        RetentionConfig(news_days=3)
+
+
+def test_maintenance_cli_reports_json(tmp_path, capsys) -> None:
+    db_path = tmp_path / "agent.db"
+    store = SQLiteStore(str(db_path))
+    _log(store, TODAY - timedelta(days=400), "run_once_end", {"duration_ms": 1.0})
+    store.close()
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        f"results_dir: {tmp_path / 'results'}\nstorage:\n  db_path: {db_path}\nretention:\n  audit_days: 30\n",
+        encoding="utf-8",
+    )
+
+    args = build_parser().parse_args(["--config", str(config_path), "maintenance", "--vacuum", "full"])
+    assert args.func(args) == 0
+
+    report = json.loads(capsys.readouterr().out)
+    assert report["deleted"] == {"audit_logs": 1}
+    assert report["vacuum"] == "full"
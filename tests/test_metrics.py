@@ -0,0 +1,24 @@
+import pytest
+
+from agent_search.metrics import RunMetrics, percentile
+
+
+def test_percentile_nearest_rank() -> None:
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile([], 95) == 0.0
+
+
+def test_run_metrics_summary_counts_errors() -> None:
+    metrics = RunMetrics(run_id="r1")
+    for seconds in (0.01, 0.02, 0.03):
+        metrics.record("connector.get_kline", seconds, source="akshare")
+    with pytest.raises(RuntimeError):
+        with metrics.timer("connector.get_news", "serper"):
+            raise RuntimeError("boom")
+
+    summary = {(item.stage, item.source): item for item in metrics.summary()}
+    kline = summary[("connector.get_kline", "akshare")]
+    assert (kline.count, kline.errors, kline.p50_ms, kline.max_ms) == (3, 0, 20.0, 30.0)
+    assert summary[("connector.get_news", "serper")].errors == 1
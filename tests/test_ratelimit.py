@@ -0,0 +1,120 @@
+import pytest
+import requests
+
+from agent_search.backtest.engine import BacktestEngine
+from agent_search.config import AppConfig
+from agent_search.connectors.ratelimit import AdaptiveRateLimiter, is_throttle_error
+from agent_search.tools import ToolService
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _http_error(status: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f"status {status}", response=response)
+
+
+def test_token_bucket_reserves_and_refills() -> None:
+    clock = _Clock()
+    limiter = AdaptiveRateLimiter(rate=2.0, burst=2, clock=clock)
+
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == 0.5
+    assert limiter.reserve() == 1.0
+
+    clock.now += 0.5
+    assert limiter.reserve() == 1.0
+    clock.now += 3.0
+    assert limiter.reserve() == 0.0
+
+
+def test_aimd_backs_off_on_throttling_and_ramps_up() -> None:
+    clock = _Clock()
+    limiter = AdaptiveRateLimiter(
+        rate=4.0, min_rate=1.0, max_rate=5.0, increase_step=0.5, slow_seconds=2.0, clock=clock
+    )
+    assert is_throttle_error(_http_error(429))
+    assert is_throttle_error(_http_error(503))
+    assert not is_throttle_error(_http_error(404))
+    assert not is_throttle_error(ValueError("bad payload"))
+
+    limiter.observe(0.1, _http_error(429))
+    limiter.observe(0.1, _http_error(429))  # same cooldown window: counted once
+    assert limiter.rate == 2.0
+
+    limiter.observe(0.1, _http_error(404))
+    assert limiter.rate == 2.0
+
+    clock.now += 5
+    limiter.observe(3.0)  # slow response
+    assert limiter.rate == 1.0
+    clock.now += 5
+    limiter.observe(0.1, _http_error(500))
+    assert limiter.rate == 1.0
+
+    for _ in range(10):
+        limiter.observe(0.1)
+    assert limiter.rate == 5.0
+
+
+class ThrottledMarket:
+    def __init__(self):
+        self.calls = 0
+
+    def get_kline(self, symbol, start, end, adjust="qfq", period="daily"):
+        self.calls += 1
+        raise _http_error(429)
+
+
+def test_run_reports_rate_gauges(make_agent) -> None:
+    agent = make_agent(
+        market_connector=ThrottledMarket(),
+        rate_limit={
+            "enabled": True,
+            "akshare": {"rate": 50, "burst": 10, "min_rate": 1, "max_rate": 50},
+            "serper": {"rate": 50, "burst": 10, "min_rate": 1, "max_rate": 50},
+        },
+    )
+
+    result = agent.run_once(symbols=["000001"])
+
+    assert result.gauges["ratelimit.akshare"] == 25.0
+    assert result.gauges["ratelimit.serper"] == 50.0
+
+
+def _limited_config(tmp_path) -> AppConfig:
+    return AppConfig.model_validate(
+        {
+            "results_dir": str(tmp_path / "results"),
+            "storage": {"db_path": str(tmp_path / "agent.db")},
+            "rate_limit": {"enabled": True, "akshare": {"rate": 50, "burst": 10, "min_rate": 1, "max_rate": 50}},
+        }
+    )
+
+
+def test_backtest_kline_pulls_share_the_akshare_limiter(tmp_path) -> None:
+    engine = BacktestEngine(config=_limited_config(tmp_path), market_connector=ThrottledMarket())
+
+    with pytest.raises(requests.HTTPError):
+        engine._load_series("000001", "2026-01-01", "2026-03-31")
+
+    assert engine.limiter.rate == 25.0
+
+
+def test_tool_calls_go_through_the_agent_limiter(tmp_path) -> None:
+    tools = ToolService(_limited_config(tmp_path))
+    tools.agent.market = ThrottledMarket()
+
+    with pytest.raises(requests.HTTPError):
+        tools.get_kline("000001", "2026-01-01", "2026-03-31")
+
+    assert tools.agent._rate_limiters["akshare"].rate == 25.0
+    tools.agent.close()
@@ -0,0 +1,162 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from agent_search.config import AppConfig
+from agent_search.connectors import AkShareConnector, CallArchive, ReplayMissError
+from agent_search.engine import TradingResearchAgent
+
+
+def _hist_frame(end: str):
+    import pandas as pd
+
+    last = datetime.strptime(end, "%Y%m%d")
+    return pd.DataFrame(
+        {
+            "日期": [(last - timedelta(days=39 - i)).strftime("%Y-%m-%d") for i in range(40)],
+            "开盘": [10 + i * 0.1 for i in range(40)],
+            "最高": [10.3 + i * 0.1 for i in range(40)],
+            "最低": [9.9 + i * 0.1 for i in range(40)],
+            "收盘": [10.2 + i * 0.1 for i in range(40)],
+            "成交量": [1_000_000] * 40,
+            "成交额": [10_000_000] * 40,
+        }
+    )
+
+
+class _Resp:
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return {
+            "organic": [
+                {
+                    "title": "公司业绩预增",
+                    "link": "https://example.com/a",
+                    "snippet": "利好",
+                    "date": "1 hour ago",
+                }
+            ]
+        }
+
+
+def _config(tmp_path, name):
+    return AppConfig.model_validate(
+        {
+            "results_dir": str(tmp_path / name),
+            "storage": {"db_path": str(tmp_path / f"{name}.db")},
+            "integrations": {"serper_api_key_env": "TEST_SERPER_KEY"},
+        }
+    )
+
+
+def _run(tmp_path, name, archive, equity=1_000_000.0):
+    with TradingResearchAgent(_config(tmp_path, name), archive=archive) as agent:
+        return agent.run_once(symbols=["002463", "600519"], equity=equity)
+
+
+def test_replay_matches_recording_offline(tmp_path, monkeypatch) -> None:
+    import requests
+
+    calls = {"akshare": 0, "serper": 0}
+
+    class _FakeAk:
+        @staticmethod
+        def stock_zh_a_hist(symbol, period, start_date, end_date, adjust):
+            calls["akshare"] += 1
+            return _hist_frame(end_date)
+
+    def _fake_post(self, *args, **kwargs):
+        calls["serper"] += 1
+        return _Resp()
+
+    monkeypatch.setenv("TEST_SERPER_KEY", "dummy")
+    monkeypatch.setattr(AkShareConnector, "_import_akshare", staticmethod(lambda: _FakeAk))
+    monkeypatch.setattr(requests.Session, "post", _fake_post)
+
+    path = tmp_path / "run.pkl.gz"
+    with CallArchive(path, mode="record") as archive:
+        recorded = _run(tmp_path, "record", archive)
+    assert calls["akshare"] == 2 and calls["serper"] > 0
+
+    def _offline(*args, **kwargs):
+        raise AssertionError("replay must not touch the network")
+
+    monkeypatch.delenv("TEST_SERPER_KEY")
+    monkeypatch.setattr(AkShareConnector, "_import_akshare", staticmethod(_offline))
+    monkeypatch.setattr(requests.Session, "post", _offline)
+
+    replay = CallArchive(path, mode="replay")
+    assert replay.recorded_at == archive.recorded_at
+    replayed = _run(tmp_path, "replay", replay)
+
+    assert replayed.date == recorded.date
+    assert [(s.symbol, s.action, s.score, s.entry) for s in replayed.signals] == [
+        (s.symbol, s.action, s.score, s.entry) for s in recorded.signals
+    ]
+    assert [s.evidence_urls for s in replayed.signals] == [s.evidence_urls for s in recorded.signals]
+
+
+def test_replay_writes_beside_the_archive_and_restores_the_starting_risk_state(tmp_path, monkeypatch) -> None:
+    class _FakeAk:
+        @staticmethod
+        def stock_zh_a_hist(symbol, period, start_date, end_date, adjust):
+            return _hist_frame(end_date)
+
+    monkeypatch.setattr(AkShareConnector, "_import_akshare", staticmethod(lambda: _FakeAk))
+    monkeypatch.setenv("TEST_SERPER_KEY", "")
+
+    with TradingResearchAgent(_config(tmp_path, "live")) as agent:
+        agent.run_once(symbols=["002463"], equity=1_200_000.0)
+    path = tmp_path / "run.pkl.gz"
+    with CallArchive(path, mode="record") as archive:
+        recorded = _run(tmp_path, "live", archive)
+    assert recorded.risk_state.peak_equity == 1_200_000.0
+
+    live_db = (tmp_path / "live.db").read_bytes()
+    live_reports = sorted(p.stat().st_mtime_ns for p in (tmp_path / "live").rglob("*"))
+    for _ in range(2):
+        replayed = _run(tmp_path, "live", CallArchive(path, mode="replay"))
+        assert replayed.risk_state == recorded.risk_state
+
+    assert (tmp_path / "live.db").read_bytes() == live_db
+    assert sorted(p.stat().st_mtime_ns for p in (tmp_path / "live").rglob("*")) == live_reports
+    assert (tmp_path / "run.pkl.gz.replay" / "agent.db").exists()
+    assert any((tmp_path / "run.pkl.gz.replay" / "results").rglob("*.md"))
+
+
+def test_replay_miss_raises(tmp_path) -> None:
+    path = tmp_path / "empty.pkl.gz"
+    CallArchive(path, mode="record").close()
+
+    replay = CallArchive(path, mode="replay")
+    market = AkShareConnector(archive=replay)
+    with pytest.raises(ReplayMissError):
+        market.get_kline_series("002463", "2026-01-01", "2026-02-01")
+    assert replay.recorded_at <= datetime.now(timezone.utc)
+
+
+def test_sharded_run_rejects_archive(tmp_path) -> None:
+    config = AppConfig.model_validate(
+        {"results_dir": str(tmp_path / "results"), "storage": {"db_path": str(tmp_path / "a.db")}}
+    )
+    archive = CallArchive(tmp_path / "a.pkl.gz", mode="record")
+    with TradingResearchAgent(config, archive=archive) as agent:
+        assert agent.config.search_cache.enabled is False
+        with pytest.raises(ValueError):
+            agent.run_sharded(symbols=["002463"], processes=2)
+
+
+def test_replay_never_queues_alerts_for_delivery(tmp_path) -> None:
+    path = tmp_path / "empty.pkl.gz"
+    CallArchive(path, mode="record").close()
+    config = AppConfig.model_validate(
+        {
+            "results_dir": str(tmp_path / "results"),
+            "storage": {"db_path": str(tmp_path / "a.db")},
+            "alerts": {"delivery": "outbox"},
+        }
+    )
+    with TradingResearchAgent(config, archive=CallArchive(path, mode="replay")) as agent:
+        assert agent.outbox is None
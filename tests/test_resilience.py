@@ -0,0 +1,150 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from agent_search.config import AppConfig
+from agent_search.connectors.resilience import CircuitBreaker, CircuitOpenError, hedged_call
+from agent_search.engine import TradingResearchAgent, archive_config
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_breaker_opens_fails_fast_and_recovers() -> None:
+    clock = _Clock()
+    breaker = CircuitBreaker("akshare", failure_threshold=2, reset_seconds=30, clock=clock)
+
+    breaker.before_call()
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.is_open
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    # Half-open: one trial call; a failure re-opens for another period.
+    clock.now += 30
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    clock.now += 30
+    breaker.before_call()
+    breaker.record_success()
+    assert not breaker.is_open
+    breaker.before_call()
+
+
+def test_hedged_call_takes_the_first_answer() -> None:
+    calls = {"count": 0}
+    lock = threading.Lock()
+
+    def fetch():
+        with lock:
+            calls["count"] += 1
+            attempt = calls["count"]
+        if attempt == 1:
+            time.sleep(0.5)
+        return attempt
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        result, hedged = hedged_call(pool, fetch, delay=0.05)
+        assert (result, hedged) == (2, True)
+
+        calls["count"] = 1  # next call is fast
+        assert hedged_call(pool, fetch, delay=0.05) == (2, False)
+
+        calls["count"] = 0
+        assert hedged_call(pool, fetch, delay=0.05, may_hedge=lambda: False) == (1, False)
+
+
+def test_hedged_call_releases_the_duplicate_slot_after_both_attempts() -> None:
+    released = threading.Event()
+    slow_done = threading.Event()
+
+    def fetch():
+        if not slow_done.is_set():
+            slow_done.set()
+            time.sleep(0.3)
+        return threading.get_ident()
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        _, hedged = hedged_call(pool, fetch, delay=0.05, release=released.set)
+        # The duplicate won, but the slow primary still holds the extra slot.
+        assert hedged and not released.is_set()
+        assert released.wait(2)
+
+
+class DownMarket:
+    def __init__(self):
+        self.calls = 0
+
+    def get_kline(self, symbol, start, end, adjust="qfq", period="daily"):
+        self.calls += 1
+        raise TimeoutError("read timed out")
+
+
+def test_open_circuit_fails_fast_and_flags_low_confidence(make_agent) -> None:
+    market = DownMarket()
+    agent = make_agent(market_connector=market, resilience={"breaker_failures": 2})
+
+    result = agent.run_once(symbols=[f"{i:06d}" for i in range(1, 6)])
+
+    assert market.calls == 2
+    assert all(signal.low_confidence for signal in result.signals)
+    assert any("circuit open" in reason for reason in result.signals[-1].reasons)
+    assert result.gauges["circuit.akshare"] == 1.0
+    assert result.gauges["circuit.serper"] == 0.0
+
+
+class SlowSerper:
+    def __init__(self):
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def get_news(self, symbol, since_hours=48):
+        with self.lock:
+            self.calls += 1
+        time.sleep(0.2)
+        return []
+
+
+def _hedging_agent(make_agent, concurrency: int) -> TradingResearchAgent:
+    agent = make_agent(
+        market_connector=DownMarket(),
+        serper_connector=SlowSerper(),
+        scan={"serper_concurrency": concurrency},
+        resilience={"hedge_sources": ["serper"], "hedge_min_samples": 1, "hedge_min_delay_seconds": 0.01},
+    )
+    agent._latency["serper"].add(0.01)
+    return agent
+
+
+@pytest.mark.parametrize("concurrency, calls", [(1, 1), (2, 2)])
+def test_hedge_duplicate_needs_a_free_concurrency_slot(make_agent, concurrency, calls) -> None:
+    agent = _hedging_agent(make_agent, concurrency)
+
+    agent._call_source(None, "serper", agent.serper.get_news, symbol="002463")
+    agent.close()
+    time.sleep(0.3)  # let the losing attempt finish
+
+    assert agent.serper.calls == calls
+    # Every slot is back once both attempts have finished.
+    slots = agent._source_limits["serper"]
+    assert all(slots.acquire(blocking=False) for _ in range(concurrency))
+    assert not slots.acquire(blocking=False)
+
+
+def test_recording_disables_hedging() -> None:
+    config = AppConfig.model_validate({"resilience": {"hedge_sources": ["serper"]}})
+    assert archive_config(config).resilience.hedge_sources == []
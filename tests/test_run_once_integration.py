@@ -105,3 +105,37 @@ def test_run_once_outputs(tmp_path) -> None:
     payload = json.loads(out_json.read_text(encoding="utf-8"))
     assert payload[0]["symbol"] == "002463"
     assert payload[0]["entry"] is not None
+
+
+def test_run_once_records_stage_metrics(tmp_path) -> None:
+    db_path = tmp_path / "data" / "agent.db"
+    config = AppConfig.model_validate(
+        {
+            "results_dir": str(tmp_path / "results"),
+            "storage": {"db_path": str(db_path)},
+        }
+    )
+    store = SQLiteStore(str(db_path))
+    serper = FakeSerper()
+    agent = TradingResearchAgent(
+        config=config,
+        market_connector=FakeMarket(),
+        serper_connector=serper,
+        announcement_connector=AnnouncementConnector(serper),
+        notifier=FakeWecom(),
+        store=store,
+    )
+
+    result = agent.run_once(symbols=["002463", "600519"], equity=1_000_000)
+
+    by_key = {(item.stage, item.source): item for item in result.metrics}
+    assert by_key[("connector.get_kline", "akshare")].count == 2
+    assert by_key[("connector.get_news", "serper")].count == 2
+    assert by_key[("connector.get_announcements", "serper")].count == 2
+    assert by_key[("build_trade_signal", "")].count == 2
+    assert by_key[("store.save_signals", "sqlite")].count == 1
+    assert by_key[("report.write_daily_markdown", "")].count == 1
+    run = by_key[("run", "")]
+    assert run.max_ms >= run.p95_ms >= run.p50_ms > 0
+
+    assert store.get_run_metrics(result.run_id) == result.metrics
@@ -0,0 +1,30 @@
+import pandas as pd
+
+from agent_search.config import ScreenConfig
+from agent_search.strategy.screen import screen_universe
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "symbol": ["000001", "000002", "000003", "000004", "000005", "000006"],
+            "name": ["平安银行", "*ST国华", "高换手", "强势股", "温和放量", "停牌股"],
+            "price": [12.0, 4.0, 20.0, 30.0, 8.0, float("nan")],
+            "change_pct": [2.0, 5.0, 3.0, 6.0, 1.0, float("nan")],
+            "volume": [1e6, 1e6, 1e6, 1e6, 1e6, 0.0],
+            "amount": [2e8, 2e8, 2e8, 5e8, 1e8, 0.0],
+            "volume_ratio": [1.5, 3.0, 2.0, 2.5, 1.3, float("nan")],
+            "turnover": [2.0, 5.0, 40.0, 6.0, 1.5, float("nan")],
+        }
+    )
+
+
+def test_screen_filters_and_ranks() -> None:
+    shortlist = screen_universe(_frame(), ScreenConfig())
+    assert shortlist["symbol"].tolist() == ["000004", "000001", "000005"]
+    assert shortlist["screen_score"].is_monotonic_decreasing
+
+
+def test_screen_top_n_override() -> None:
+    shortlist = screen_universe(_frame(), ScreenConfig(exclude_st=False), top_n=2)
+    assert shortlist["symbol"].tolist() == ["000004", "000002"]
@@ -0,0 +1,119 @@
+from agent_search.config import AppConfig
+from agent_search.connectors.serper_connector import SerperConnector
+from agent_search.engine import TradingResearchAgent
+from agent_search.storage import SearchCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Resp:
+    def __init__(self, data):
+        self._data = data
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self._data
+
+
+class CountingSession:
+    def __init__(self):
+        self.calls = 0
+
+    def post(self, url, headers=None, data=None, timeout=None):
+        self.calls += 1
+        return _Resp({"organic": [], "call": self.calls})
+
+    def close(self):
+        return None
+
+
+def test_search_cache_ttl_and_stale_while_revalidate(tmp_path) -> None:
+    clock = _Clock()
+    cache = SearchCache(
+        str(tmp_path / "agent.db"), ttls={"news": 60}, stale_seconds=120, max_entries=10, clock=clock
+    )
+    session = CountingSession()
+    connector = SerperConnector(api_key="dummy", session=session, cache=cache)
+
+    assert connector.search("q", kind="news")["call"] == 1
+    clock.now += 30
+    assert connector.search("q", kind="news")["call"] == 1
+    assert session.calls == 1
+
+    # Past the TTL but inside the stale window: serve the old copy, refresh in the background.
+    clock.now += 60
+    assert connector.search("q", kind="news")["call"] == 1
+    connector.close()
+    assert session.calls == 2
+    assert connector.search("q", kind="news")["call"] == 2
+
+    # Past TTL + stale window: fetch synchronously.
+    clock.now += 500
+    assert connector.search("q", kind="news")["call"] == 3
+
+
+def test_search_cache_evicts_least_recently_used(tmp_path) -> None:
+    clock = _Clock()
+    cache = SearchCache(str(tmp_path / "agent.db"), max_entries=2, clock=clock)
+    for key in ("a", "b"):
+        clock.now += 1
+        cache.put(key, "search", key, {"q": key})
+    clock.now += 1
+    assert cache.lookup("a", "search") is not None
+    clock.now += 1
+    cache.put("c", "search", "c", {"q": "c"})
+
+    assert cache.lookup("b", "search") is None
+    assert cache.lookup("a", "search") == ({"q": "a"}, True)
+    assert cache.lookup("c", "search") == ({"q": "c"}, True)
+
+
+def test_lookups_batch_their_access_time_updates(tmp_path) -> None:
+    clock = _Clock()
+    cache = SearchCache(str(tmp_path / "agent.db"), clock=clock, touch_batch_size=3)
+    cache.put("a", "search", "a", {"q": "a"})
+    updates = []
+    cache.conn.set_trace_callback(lambda sql: updates.append(sql) if sql.startswith("UPDATE") else None)
+
+    for _ in range(5):
+        clock.now += 1
+        assert cache.lookup("a", "search") is not None
+    assert updates == []  # one pending touch per key, not one write per hit
+
+    clock.now += 1
+    cache.put("b", "search", "b", {"q": "b"})
+    assert len(updates) == 1
+    assert cache.conn.execute("SELECT last_access FROM search_cache WHERE key='a'").fetchone()[0] == 1_005.0
+    cache.close()
+
+
+def test_background_refresh_goes_through_the_agent_breaker(tmp_path) -> None:
+    clock = _Clock()
+    cache = SearchCache(str(tmp_path / "cache.db"), ttls={"news": 60}, stale_seconds=120, clock=clock)
+    session = CountingSession()
+    connector = SerperConnector(api_key="dummy", session=session, cache=cache)
+    config = AppConfig.model_validate(
+        {
+            "results_dir": str(tmp_path / "results"),
+            "storage": {"db_path": str(tmp_path / "agent.db")},
+            "resilience": {"breaker_failures": 1, "breaker_reset_seconds": 600},
+        }
+    )
+    agent = TradingResearchAgent(config=config, serper_connector=connector)
+    connector.search("q", kind="news")
+    agent._breakers["serper"].record_failure()
+
+    clock.now += 90
+    assert connector.search("q", kind="news")["call"] == 1
+    connector.close()
+
+    assert session.calls == 1  # the open circuit blocked the refresh
+    agent.close()
@@ -28,3 +28,40 @@ def test_source_and_dedupe_key() -> None:
     key1 = connector.dedupe_key(items[0])
     key2 = connector.dedupe_key(items[1])
     assert key1 == key2
+
+
+def test_search_reuses_pooled_session(monkeypatch) -> None:
+    import requests
+
+    from agent_search.config import AppConfig
+    from agent_search.engine import TradingResearchAgent
+
+    sessions = []
+
+    class _Resp:
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            return {"organic": []}
+
+    def _fake_post(self, *args, **kwargs):
+        sessions.append(self)
+        return _Resp()
+
+    monkeypatch.setattr(requests.Session, "post", _fake_post)
+
+    config = AppConfig.model_validate({"scan": {"serper_concurrency": 6}})
+    agent = TradingResearchAgent(config, market_connector=object(), store=object())
+    agent.serper.api_key = "dummy"
+    agent.serper.search("a")
+    agent.serper.search("b")
+
+    assert sessions[0] is sessions[1] is agent.notifier.session
+    assert agent.serper.session.get_adapter("https://google.serper.dev").poolmanager.connection_pool_kw["maxsize"] == 6
+
+    closed = []
+    monkeypatch.setattr(requests.Session, "close", lambda self: closed.append(self))
+    with agent:
+        pass
+    assert closed == [agent.serper.session]
@@ -0,0 +1,100 @@
+import json
+import os
+from datetime import date, datetime, timedelta
+
+from agent_search.engine import RunContext, shard_context, split_shards
+from agent_search.models import MarketBar, NewsItem, RiskState
+
+
+class FakeMarket:
+    def get_kline(self, symbol, start, end, adjust="qfq", period="daily"):
+        if symbol == "000003":
+            raise RuntimeError("upstream down")
+        base = datetime(2026, 1, 1)
+        return [
+            MarketBar(
+                symbol=symbol,
+                ts=base + timedelta(days=i),
+                open=10 + i * 0.1,
+                high=10.3 + i * 0.1,
+                low=9.8 + i * 0.1,
+                close=10.1 + i * 0.1,
+                volume=1_000_000,
+                amount=10_000_000,
+                source=f"pid-{os.getpid()}",
+            )
+            for i in range(30)
+        ]
+
+
+class FakeSerper:
+    def get_news(self, symbol, since_hours=48):
+        return []
+
+
+class FakeAnnouncements:
+    def get_announcements(self, symbol, since_days=7):
+        return []
+
+
+def fake_components(config):
+    return FakeMarket(), FakeSerper(), FakeAnnouncements()
+
+
+def test_split_shards_is_contiguous_and_balanced() -> None:
+    symbols = [str(i) for i in range(7)]
+    shards = split_shards(symbols, 3)
+    assert shards == [["0", "1", "2"], ["3", "4"], ["5", "6"]]
+    assert split_shards(symbols[:2], 4) == [["0"], ["1"]]
+
+
+def test_shard_context_only_carries_the_shards_symbols() -> None:
+    notice = NewsItem(
+        id="a1", symbol="000002", ts=datetime(2026, 1, 30), title="公告", url="https://cninfo.example/a1", source="cninfo"
+    )
+    ctx = RunContext(
+        today=date(2026, 1, 31),
+        start="2026-01-01",
+        end="2026-01-31",
+        equity=1_000_000.0,
+        risk_state=RiskState(date=date(2026, 1, 31), equity=1_000_000.0, peak_equity=1_000_000.0),
+        cached_bars={symbol: [] for symbol in ("000001", "000002", "000003")},
+        announcements={"000002": [notice], "000003": [notice]},
+    )
+
+    shard = shard_context(ctx, ["000001", "000002"])
+
+    assert list(shard.cached_bars) == ["000001", "000002"]
+    assert shard.announcements == {"000002": [notice]}
+    assert shard.fingerprints is None
+    assert shard.metrics is not ctx.metrics and shard.metrics.run_id == ctx.metrics.run_id
+
+
+def test_run_sharded_merges_results_in_parent(make_agent) -> None:
+    market, serper, announcements = fake_components(None)
+    agent = make_agent(
+        market_connector=market,
+        serper_connector=serper,
+        announcement_connector=announcements,
+        scan={"max_workers": 4, "akshare_concurrency": 4, "serper_concurrency": 4},
+    )
+
+    symbols = [f"{i:06d}" for i in range(1, 7)]
+    result = agent.run_sharded(symbols=symbols, processes=2, components=fake_components)
+
+    assert [signal.symbol for signal in result.signals] == symbols
+    assert result.signals[2].low_confidence is True
+    assert any("行情获取失败" in reason for reason in result.signals[2].reasons)
+
+    bars = agent.store.get_market_bars("000001", "2026-01-01", "2026-01-30")
+    assert len(bars) == 30
+    assert bars[0].source != f"pid-{os.getpid()}"
+
+    payload = json.loads(open(result.output_json, encoding="utf-8").read())
+    assert [item["symbol"] for item in payload] == symbols
+
+    stages = {(item.stage, item.source): item for item in result.metrics}
+    assert stages[("connector.get_kline", "akshare")].count == 6
+    assert stages[("connector.get_kline", "akshare")].errors == 1
+    assert stages[("shard.scan", "")].count == 1
+    assert agent.store.get_run_metrics(result.run_id)
@@ -0,0 +1,103 @@
+import json
+import sqlite3
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+from agent_search.cli import build_parser
+from agent_search.models import SignalAction, TradeSignal
+from agent_search.storage import SQLiteStore
+
+TZ = ZoneInfo("Asia/Shanghai")
+
+
+def _signal(symbol: str, ts: datetime, action: SignalAction = SignalAction.HOLD) -> TradeSignal:
+    return TradeSignal(id=f"{symbol}-{ts.isoformat()}", symbol=symbol, ts=ts, action=action, score=0.1)
+
+
+def _seed(store: SQLiteStore) -> None:
+    store.save_signals(
+        [
+            _signal("002463", datetime(2026, 10, 15, 9, 5, tzinfo=TZ)),
+            _signal("002463", datetime(2026, 10, 16, 15, 10, tzinfo=TZ), SignalAction.BUY),
+            _signal("600519", datetime(2026, 10, 16, 9, 5, tzinfo=TZ)),
+            _signal("600519", datetime(2026, 10, 17, 0, 30, tzinfo=TZ), SignalAction.REDUCE),
+        ]
+    )
+
+
+def test_range_symbol_and_latest_queries(tmp_path) -> None:
+    store = SQLiteStore(str(tmp_path / "agent.db"))
+    _seed(store)
+
+    assert [row["symbol"] for row in store.get_signals_by_date(date(2026, 10, 16))] == ["600519", "002463"]
+    # 00:30 local time is still the 17th even though it is the 16th in UTC.
+    assert [row["action"] for row in store.get_signals_by_date(date(2026, 10, 17))] == ["REDUCE"]
+
+    week = store.get_signals_between(date(2026, 10, 15), date(2026, 10, 16))
+    assert len(week) == 3
+    history = store.get_signals_between(symbol="002463")
+    assert [row["ts"][:10] for row in history] == ["2026-10-15", "2026-10-16"]
+    assert store.get_signals_between(date(2026, 10, 17), symbol="002463") == []
+
+    latest = store.get_latest_signals()
+    assert {symbol: row["action"] for symbol, row in latest.items()} == {"002463": "BUY", "600519": "REDUCE"}
+    assert list(store.get_latest_signals(["600519"])) == ["600519"]
+
+
+def test_date_lookup_uses_the_trade_date_index(tmp_path) -> None:
+    store = SQLiteStore(str(tmp_path / "agent.db"))
+    plan = store.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM signals WHERE trade_date=? ORDER BY ts ASC", ("2026-10-16",)
+    ).fetchall()
+    assert any("idx_signals_trade_date" in row["detail"] for row in plan)
+    plan = store.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM signals WHERE symbol=? AND trade_date>=?", ("002463", "2026-10-01")
+    ).fetchall()
+    assert any("idx_signals_symbol_date" in row["detail"] for row in plan)
+
+
+def test_existing_database_is_backfilled(tmp_path) -> None:
+    db_path = tmp_path / "old.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        """
+        CREATE TABLE signals (
+            id TEXT PRIMARY KEY, symbol TEXT NOT NULL, ts TEXT NOT NULL, action TEXT NOT NULL,
+            entry REAL, stop_loss REAL, take_profit REAL, confidence REAL NOT NULL, score REAL NOT NULL,
+            reasons TEXT NOT NULL, evidence_urls TEXT NOT NULL, position_size_pct REAL NOT NULL,
+            low_confidence INTEGER NOT NULL, created_at TEXT NOT NULL
+        )
+        """
+    )
+    conn.execute(
+        "INSERT INTO signals VALUES ('s1', '002463', '2026-10-16T09:05:00+08:00', 'HOLD', NULL, NULL, NULL,"
+        " 0.5, 0.1, '[]', '[]', 0.0, 0, '2026-10-16T01:05:00')"
+    )
+    conn.commit()
+    conn.close()
+
+    store = SQLiteStore(str(db_path))
+    assert [row["id"] for row in store.get_signals_by_date(date(2026, 10, 16))] == ["s1"]
+
+
+def test_report_cli_range_and_symbol(tmp_path, capsys) -> None:
+    db_path = tmp_path / "agent.db"
+    _seed(SQLiteStore(str(db_path)))
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        f"results_dir: {tmp_path / 'results'}\nstorage:\n  db_path: {db_path}\n", encoding="utf-8"
+    )
+    parser = build_parser()
+
+    args = parser.parse_args(
+        ["--config", str(config_path), "report", "--from", "2026-10-16", "--to", "2026-10-17", "--symbol", "600519"]
+    )
+    assert args.func(args) == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["from"] == "2026-10-16" and payload["symbol"] == "600519"
+    assert [row["action"] for row in payload["signals"]] == ["HOLD", "REDUCE"]
+
+    args = parser.parse_args(["--config", str(config_path), "report", "--date", "2026-10-15"])
+    assert args.func(args) == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["date"] == "2026-10-15" and len(payload["signals"]) == 1
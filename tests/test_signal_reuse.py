@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+
+from agent_search.connectors import RealtimeQuote
+from agent_search.models import MarketBar
+from agent_search.storage import SQLiteStore
+
+
+class QuietMarket:
+    def __init__(self):
+        self.price = 15.5
+
+    def get_kline(self, symbol, start, end, adjust="qfq", period="daily"):
+        last = datetime.fromisoformat(end) - timedelta(days=1)
+        return [
+            MarketBar(
+                symbol=symbol,
+                ts=last - timedelta(days=39 - i),
+                open=10 + i * 0.1,
+                high=10.3 + i * 0.1,
+                low=9.9 + i * 0.1,
+                close=10.2 + i * 0.1,
+                volume=1_000_000,
+                amount=10_000_000,
+                source="akshare",
+            )
+            for i in range(40)
+        ]
+
+    def get_realtime_quotes(self, symbols):
+        return {
+            symbol: RealtimeQuote(
+                symbol=symbol,
+                price=self.price,
+                change_pct=3.0,
+                volume=2_000_000,
+                amount=30_000_000,
+                open=14.2,
+                high=15.8,
+                low=14.1,
+                prev_close=14.1,
+            )
+            for symbol in symbols
+        }
+
+
+def _signal_rows(store: SQLiteStore) -> int:
+    return store.conn.execute("SELECT COUNT(*) FROM signals").fetchone()[0]
+
+
+def test_unchanged_inputs_reuse_previous_signal(make_agent) -> None:
+    market = QuietMarket()
+    agent = make_agent(market_connector=market, scan={"reuse_unchanged_signals": True})
+    symbols = ["002463", "600519"]
+
+    first = agent.run_intraday(symbols=symbols)
+    rows = _signal_rows(agent.store)
+
+    second = agent.run_intraday(symbols=symbols)
+    assert [signal.id for signal in second.signals] == [signal.id for signal in first.signals]
+    assert _signal_rows(agent.store) == rows
+    stages = {item.stage: item for item in second.metrics}
+    assert stages["signal.reused"].count == 2
+    assert "build_trade_signal" not in stages
+
+    market.price = 15.9
+    third = agent.run_intraday(symbols=symbols)
+    assert third.signals[0].id != first.signals[0].id
+    assert third.signals[0].entry == 15.9
+    assert _signal_rows(agent.store) == rows + 2
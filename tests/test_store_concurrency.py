@@ -0,0 +1,113 @@
+import gc
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+
+from agent_search.models import MarketBar
+from agent_search.storage import SQLiteStore
+
+
+def _bar(symbol: str, day: int) -> MarketBar:
+    return MarketBar(
+        symbol=symbol,
+        ts=datetime(2026, 1, 1) + timedelta(days=day),
+        open=10,
+        high=10.5,
+        low=9.8,
+        close=10.2,
+        volume=1000,
+        amount=10200,
+        source="fake",
+    )
+
+
+def test_many_producers_share_one_store(tmp_path) -> None:
+    store = SQLiteStore(str(tmp_path / "agent.db"), journal_mode="wal")
+    commits = []
+    store._writer.set_trace_callback(lambda sql: commits.append(sql) if sql.startswith("COMMIT") else None)
+
+    def produce(worker: int) -> int:
+        symbol = f"{worker:06d}"
+        for day in range(25):
+            store.save_market_bars([_bar(symbol, day)])
+            store.log_event("tick", {"worker": worker, "day": day})
+        # Reads run on this thread's own connection and see the committed writes.
+        return len(store.get_market_bars(symbol, "2026-01-01", "2026-12-31"))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert list(pool.map(produce, range(16))) == [25] * 16
+
+    assert store.get_market_bar_stats()["000007"][0] == 25
+    assert store.conn.execute("SELECT COUNT(*) FROM audit_logs").fetchone()[0] == 16 * 25
+    # Concurrent submissions were grouped into shared transactions.
+    assert len(commits) < 16 * 25 * 2
+    store.close()
+
+
+def test_transaction_holds_off_other_writers_until_commit(tmp_path) -> None:
+    store = SQLiteStore(str(tmp_path / "agent.db"))
+    other_done = threading.Event()
+
+    def other_writer() -> None:
+        store.save_market_bars([_bar("600519", 0)])
+        other_done.set()
+
+    with store.transaction():
+        store.save_market_bars([_bar("002463", 0)])
+        thread = threading.Thread(target=other_writer)
+        thread.start()
+        assert not other_done.wait(0.2)
+        # Reads inside the transaction see its own uncommitted rows.
+        assert len(store.get_market_bars("002463", "2026-01-01", "2026-01-01")) == 1
+    thread.join(5)
+
+    assert other_done.is_set()
+    assert set(store.get_market_bar_stats()) == {"002463", "600519"}
+    store.close()
+
+
+def test_failed_write_is_reported_to_its_producer_only(tmp_path) -> None:
+    store = SQLiteStore(str(tmp_path / "agent.db"))
+
+    with pytest.raises(sqlite3.OperationalError):
+        store._execute("INSERT INTO missing_table VALUES (1)")
+    store.save_market_bars([_bar("002463", 0)])
+
+    assert list(store.get_market_bar_stats()) == ["002463"]
+    store.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        store.save_market_bars([_bar("002463", 1)])
+
+
+def test_reader_connections_are_released_when_their_threads_exit(tmp_path) -> None:
+    store = SQLiteStore(str(tmp_path / "agent.db"))
+    store.save_market_bars([_bar("002463", 0)])
+
+    def read() -> None:
+        assert len(store.get_market_bars("002463", "2026-01-01", "2026-01-01")) == 1
+
+    for _ in range(30):
+        threads = [threading.Thread(target=read) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    gc.collect()
+
+    assert len(store._readers) == 0
+    store.close()
+
+
+def test_close_inside_a_transaction_raises_instead_of_deadlocking(tmp_path) -> None:
+    store = SQLiteStore(str(tmp_path / "agent.db"))
+
+    with store.transaction():
+        store.save_market_bars([_bar("002463", 0)])
+        with pytest.raises(sqlite3.ProgrammingError):
+            store.close()
+
+    assert list(store.get_market_bar_stats()) == ["002463"]
+    store.close()
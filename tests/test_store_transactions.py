@@ -0,0 +1,123 @@
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from agent_search.config import AppConfig
+from agent_search.engine import TradingResearchAgent, build_store
+from agent_search.models import MarketBar, NewsItem
+
+
+def _bar(symbol: str, day: int) -> MarketBar:
+    return MarketBar(
+        symbol=symbol,
+        ts=datetime(2026, 1, 1) + timedelta(days=day),
+        open=10,
+        high=10.5,
+        low=9.8,
+        close=10.2,
+        volume=1000,
+        amount=10200,
+        source="fake",
+    )
+
+
+def _count(db_path, table: str) -> int:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def _config(tmp_path, **storage) -> AppConfig:
+    return AppConfig.model_validate(
+        {
+            "results_dir": str(tmp_path / "results"),
+            "storage": {"db_path": str(tmp_path / "agent.db"), **storage},
+        }
+    )
+
+
+def test_wal_and_synchronous_pragmas(tmp_path) -> None:
+    store = build_store(_config(tmp_path, journal_mode="wal", synchronous="normal", cache_size_kib=8192))
+    assert store.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert store.conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    assert store.conn.execute("PRAGMA cache_size").fetchone()[0] == -8192
+
+
+def test_transaction_commits_once_and_rolls_back_on_error(tmp_path) -> None:
+    config = _config(tmp_path, journal_mode="wal")
+    store = build_store(config)
+    db_path = config.storage.db_path
+
+    with store.transaction():
+        store.save_market_bars([_bar("002463", 0)])
+        with store.transaction():
+            store.save_market_bars([_bar("002463", 1)])
+        assert _count(db_path, "market_bars") == 0
+    assert _count(db_path, "market_bars") == 2
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            store.save_market_bars([_bar("600519", 0)])
+            raise RuntimeError("boom")
+    assert _count(db_path, "market_bars") == 2
+
+
+def test_audit_events_flush_at_batch_boundaries(tmp_path) -> None:
+    config = _config(tmp_path, event_buffer_size=3)
+    store = build_store(config)
+    db_path = config.storage.db_path
+
+    for i in range(3):
+        store.log_event("tick", {"i": i})
+    assert _count(db_path, "audit_logs") == 0
+    store.log_event("tick", {"i": 3})
+    assert _count(db_path, "audit_logs") == 4
+
+    with store.transaction():
+        store.log_event("tick", {"i": 4})
+    assert _count(db_path, "audit_logs") == 5
+
+    store.log_event("tick", {"i": 5})
+    store.close()
+    assert _count(db_path, "audit_logs") == 6
+
+
+class FlatMarket:
+    def get_kline(self, symbol, start, end, adjust="qfq", period="daily"):
+        return [_bar(symbol, day) for day in range(40)]
+
+
+class OneNews:
+    def get_news(self, symbol, since_hours=48):
+        return [
+            NewsItem(
+                id=f"n-{symbol}",
+                symbol=symbol,
+                ts=datetime(2026, 2, 27),
+                title="公司公告",
+                url=f"https://finance.example.com/{symbol}",
+                source="finance.example.com",
+            )
+        ]
+
+
+def test_run_once_commit_count_does_not_grow_with_symbols(tmp_path, no_announcements, silent_wecom) -> None:
+    config = _config(tmp_path, journal_mode="wal", synchronous="normal", event_buffer_size=100)
+    store = build_store(config)
+    commits = []
+    # Every write goes through the writer connection, so its COMMITs are all the commits.
+    store._writer.set_trace_callback(lambda sql: commits.append(sql) if sql.startswith("COMMIT") else None)
+    agent = TradingResearchAgent(
+        config=config,
+        market_connector=FlatMarket(),
+        serper_connector=OneNews(),
+        announcement_connector=no_announcements,
+        notifier=silent_wecom,
+        store=store,
+    )
+
+    agent.run_once(symbols=[f"{i:06d}" for i in range(1, 31)])
+
+    assert len(commits) <= 4
+    assert _count(config.storage.db_path, "market_bars") == 30 * 40
+    assert _count(config.storage.db_path, "signals") == 30
@@ -0,0 +1,86 @@
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import pytest
+
+from agent_search.connectors import AkShareConnector, TradingCalendar
+
+
+def test_calendar_bisect_helpers() -> None:
+    calendar = TradingCalendar([date(2026, 2, 27), date(2026, 3, 2), date(2026, 3, 3), date(2026, 2, 26)])
+
+    assert calendar.is_trading_day(date(2026, 3, 2))
+    assert not calendar.is_trading_day(date(2026, 2, 28))
+    assert calendar.next_trading_day(date(2026, 2, 27)) == date(2026, 3, 2)
+    assert calendar.next_trading_day(date(2026, 2, 28)) == date(2026, 3, 2)
+    assert calendar.next_trading_day(date(2026, 3, 3)) is None
+    assert calendar.prev_trading_day(date(2026, 3, 2)) == date(2026, 2, 27)
+    assert calendar.prev_trading_day(date(2026, 2, 26)) is None
+    assert calendar.trading_days_between(date(2026, 2, 27), date(2026, 3, 2)) == [
+        date(2026, 2, 27),
+        date(2026, 3, 2),
+    ]
+
+
+class _FakeAk:
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+
+    def tool_trade_date_hist_sina(self):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("sina down")
+        return pd.DataFrame({"trade_date": ["2026-02-26", "2026-02-27", "2026-03-02"]})
+
+
+def test_calendar_is_persisted_and_refreshed_daily(tmp_path, monkeypatch) -> None:
+    fake = _FakeAk()
+    monkeypatch.setattr(AkShareConnector, "_import_akshare", staticmethod(lambda: fake))
+    path = tmp_path / "calendar.json"
+
+    first = AkShareConnector(calendar_path=str(path))
+    assert first.trading_calendar(today=date(2026, 3, 2)).is_trading_day(date(2026, 2, 27))
+    first.trading_calendar(today=date(2026, 3, 2))
+    assert fake.calls == 1
+    assert path.exists()
+
+    # A new process on the same day reads the file instead of downloading.
+    second = AkShareConnector(calendar_path=str(path))
+    assert len(second.trading_calendar(today=date(2026, 3, 2))) == 3
+    assert fake.calls == 1
+
+    # Next day: refresh, falling back to the stored copy when the download fails.
+    fake.fail = True
+    stale = second.trading_calendar(today=date(2026, 3, 3))
+    assert fake.calls == 2
+    assert stale.fetched_on == date(2026, 3, 2)
+    # The fallback is kept for the rest of the day; the scheduler's 20s ticks do not retry.
+    assert second.trading_calendar(today=date(2026, 3, 3)) is stale
+    assert fake.calls == 2
+
+    fake.fail = False
+    assert second.get_trading_calendar("2026-02-27", "2026-03-10") == [date(2026, 2, 27), date(2026, 3, 2)]
+
+
+def test_calendar_without_cache_raises_on_failure(monkeypatch) -> None:
+    fake = _FakeAk()
+    fake.fail = True
+    monkeypatch.setattr(AkShareConnector, "_import_akshare", staticmethod(lambda: fake))
+
+    market = AkShareConnector()
+    with pytest.raises(RuntimeError):
+        market.trading_calendar()
+    with pytest.raises(RuntimeError):
+        market.trading_calendar()
+    assert fake.calls == 1
+
+
+def test_calendar_day_follows_the_exchange_timezone(monkeypatch) -> None:
+    fake = _FakeAk()
+    monkeypatch.setattr(AkShareConnector, "_import_akshare", staticmethod(lambda: fake))
+
+    calendar = AkShareConnector(timezone="Asia/Shanghai").trading_calendar()
+
+    assert calendar.fetched_on == datetime.now(ZoneInfo("Asia/Shanghai")).date()
@@ -17,13 +17,13 @@ class _FakeResp:
 def test_wecom_retry(monkeypatch) -> None:
     attempts = {"count": 0}
 
-    def _fake_post(*args, **kwargs):
+    def _fake_post(self, *args, **kwargs):
         attempts["count"] += 1
         if attempts["count"] == 1:
             raise requests.ConnectionError("network")
         return _FakeResp({"errcode": 0, "errmsg": "ok"})
 
-    monkeypatch.setattr(requests, "post", _fake_post)
+    monkeypatch.setattr(requests.Session, "post", _fake_post)
 
     connector = WecomConnector(
         webhook_url="https://qyapi.weixin.qq.com/cgi-bin/webhook/send?key=demo",